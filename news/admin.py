@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import NewsArticle, UserPreference, Vote, Comment, Poll, PollOption
+from .models import NewsArticle, UserPreference, Vote, Comment, Poll, PollOption, PollVote, IngestJob
 
 from .models import UserProfile
 
@@ -43,4 +43,16 @@ class PollAdmin(admin.ModelAdmin):
     list_display = ['question', 'is_active', 'created_at']
     list_filter = ['is_active', 'created_at']
     search_fields = ['question']
-    inlines = [PollOptionInline]
\ No newline at end of file
+    inlines = [PollOptionInline]
+
+@admin.register(PollVote)
+class PollVoteAdmin(admin.ModelAdmin):
+    list_display = ['poll', 'option', 'session_id', 'created_at']
+    list_filter = ['created_at']
+    search_fields = ['poll__question', 'session_id']
+
+@admin.register(IngestJob)
+class IngestJobAdmin(admin.ModelAdmin):
+    list_display = ['id', 'kind', 'status', 'created_at', 'started_at', 'finished_at']
+    list_filter = ['kind', 'status']
+    readonly_fields = ['progress', 'error', 'created_at', 'started_at', 'finished_at']
@@ -0,0 +1,194 @@
+import json
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.contrib.admin.views.decorators import staff_member_required
+from django.db import close_old_connections
+from django.http import JsonResponse
+from django.utils import timezone
+from django.views.decorators.csrf import csrf_exempt
+
+from .feed_cache import cached_body
+from .ingest import job_status
+from .models import IngestJob, NewsArticle, UserProfile, Vote
+from .pagination import InvalidCursor
+from .polls import get_polls_payload, get_session_poll_votes, with_pending_votes
+from .preferences import get_anonymous_preferences, profile_preferences
+from .stats import get_site_stats
+from .views import (
+    build_archived_body,
+    build_news_body,
+    queue_admin_refresh,
+    queue_public_refresh,
+    refresh_cooldown_response,
+    refresh_session_key,
+    with_live_counts,
+)
+from .votes import cast_vote
+
+# ==================== ASYNC API VIEWS ====================
+# Async twins of the hot JSON endpoints, routed under /api/async/ so both can
+# be compared on the same server (`manage.py benchmark_api`). Under ASGI
+# (newsify_backend/asgi.py) a sync view runs on Django's single
+# thread-sensitive executor, so one slow request queues every other sync view
+# behind it; these views await instead.
+#
+# Simple reads use the async ORM directly. Code shared with the sync views
+# (feed building, cached_body, vote transactions) is sync and runs through
+# in_thread(), i.e. on asgiref's thread pool rather than the shared
+# thread-sensitive one; each of those calls is self-contained (its own
+# transaction), so it doesn't need to stay on one thread. Django's
+# request_started/request_finished handlers only close the connections of the
+# thread they run on, so in_thread() does the same for the pool thread around
+# each call; otherwise every pool thread would keep its own connection open.
+
+
+def in_thread(func):
+    @wraps(func)
+    def run(*args, **kwargs):
+        close_old_connections()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            close_old_connections()
+    return sync_to_async(run, thread_sensitive=False)
+
+
+async def aget_or_create_session(request):
+    if not request.session.session_key:
+        await request.session.acreate()
+    return request.session.session_key
+
+
+async def aget_user_preferences(request):
+    user = await request.auser()
+    if not user.is_authenticated:
+        return await in_thread(get_anonymous_preferences)(request)
+    preferred = await UserProfile.objects.filter(user=user).values_list(
+        'preferred_categories', flat=True
+    ).afirst()
+    return profile_preferences(preferred)
+
+
+async def awith_user_votes(body, session_id):
+    """Async with_user_votes (see views.py)"""
+    if not session_id or not body['news']:
+        return body
+    user_votes_dict = {
+        article_id: vote_type
+        async for article_id, vote_type in Vote.objects.filter(
+            session_id=session_id,
+            article_id__in=[item['id'] for item in body['news']]
+        ).values_list('article_id', 'vote_type')
+    }
+    if not user_votes_dict:
+        return body
+    return dict(body, news=[
+        dict(item, user_vote=user_votes_dict[item['id']]) if item['id'] in user_votes_dict else item
+        for item in body['news']
+    ])
+
+
+async def get_news(request):
+    """Async /api/news/"""
+    session_id = request.session.session_key
+    category = request.GET.get('category', 'all')
+    search_query = ' '.join(request.GET.get('search', '').split()).lower()
+    cursor = request.GET.get('cursor') or None
+    preferences = await aget_user_preferences(request)
+
+    try:
+        if preferences:
+            body = await in_thread(build_news_body)(category, search_query, cursor, preferences)
+            cache_status = None
+        else:
+            params = {'category': category, 'search': search_query, 'cursor': cursor}
+            body, cache_status = await in_thread(cached_body)(
+                'news', params, lambda: build_news_body(category, search_query, cursor, {})
+            )
+            body = await in_thread(with_live_counts)(body)
+    except InvalidCursor as e:
+        return JsonResponse({'status': 'error', 'message': str(e)}, status=400)
+
+    response = JsonResponse(await awith_user_votes(body, session_id))
+    if cache_status:
+        response['X-Cache'] = cache_status
+    return response
+
+
+async def get_archived(request):
+    """Async /api/archived/"""
+    days = int(request.GET.get('days', 7))
+    body, cache_status = await in_thread(cached_body)('archived', {'days': days}, lambda: build_archived_body(days))
+    response = JsonResponse(await in_thread(with_live_counts)(body, 'archived'))
+    response['X-Cache'] = cache_status
+    return response
+
+
+def _polls_body(session_id):
+    polls_data = [with_pending_votes(poll_data) for poll_data in get_polls_payload()]
+    user_votes = get_session_poll_votes(session_id, [poll_data['id'] for poll_data in polls_data])
+    for poll_data in polls_data:
+        poll_data['user_vote'] = user_votes.get(poll_data['id'])
+    return {'polls': polls_data}
+
+
+async def get_polls(request):
+    """Async /api/polls/"""
+    return JsonResponse(await in_thread(_polls_body)(request.session.session_key))
+
+
+async def get_stats(request):
+    """Async /api/stats/"""
+    return JsonResponse(await in_thread(get_site_stats)())
+
+
+@csrf_exempt
+async def vote_article(request):
+    """Async /api/vote/"""
+    if request.method != 'POST':
+        return JsonResponse({'status': 'error', 'message': 'Invalid request'}, status=400)
+
+    data = json.loads(request.body)
+    session_id = await aget_or_create_session(request)
+
+    try:
+        article, new_vote = await in_thread(cast_vote)(data.get('article_id'), session_id, data.get('vote_type'))
+    except NewsArticle.DoesNotExist:
+        return JsonResponse({'status': 'error', 'message': 'Article not found'}, status=404)
+
+    return JsonResponse({
+        'status': 'success',
+        'upvotes': article.upvotes,
+        'downvotes': article.downvotes,
+        'user_vote': new_vote,
+    })
+
+
+async def refresh_news_public(request):
+    """Async /api/refresh-news-public/"""
+    session_id = await aget_or_create_session(request)
+    last_refresh_key = refresh_session_key(session_id)
+
+    error_response = refresh_cooldown_response(await request.session.aget(last_refresh_key))
+    if error_response:
+        return error_response
+
+    response = await in_thread(queue_public_refresh)()
+    await request.session.aset(last_refresh_key, timezone.now().isoformat())
+    return response
+
+
+@staff_member_required
+async def refresh_news(request):
+    """Async /api/refresh-news/"""
+    return await in_thread(queue_admin_refresh)()
+
+
+async def refresh_status(request, job_id):
+    """Async /api/refresh-status/<job_id>/"""
+    try:
+        job = await IngestJob.objects.aget(id=job_id)
+    except IngestJob.DoesNotExist:
+        return JsonResponse({'status': 'error', 'message': 'Refresh job not found'}, status=404)
+    return JsonResponse(await in_thread(job_status)(job))
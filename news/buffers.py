@@ -0,0 +1,116 @@
+import atexit
+import threading
+
+# ==================== WRITE-BEHIND DELTA BUFFER ====================
+# Hot counters (article votes, poll votes, views) are cheap to add up in memory
+# and expensive to write one row update at a time. A DeltaBuffer collects
+# {key: {field: delta}} and hands the summed batch to a flush function every
+# `interval` seconds, when `max_keys` distinct keys are pending, or at exit.
+#
+# Deltas are only in memory until flushed, so a hard crash can lose the last
+# interval's worth of counter updates; anything that must survive (the Vote
+# rows themselves) is written synchronously by the caller.
+#
+# discard_all() drops every buffer's queued deltas and closes it for good. The
+# test runner calls it before destroying the test database, so nothing is
+# flushed at exit into whatever database is configured then.
+
+_buffers = []
+
+
+class DeltaBuffer:
+    def __init__(self, name, flush_func, interval=2.0, max_keys=1000):
+        self.name = name
+        self.flush_func = flush_func
+        self.interval = interval
+        self.max_keys = max_keys
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending = {}
+        self._inflight = {}
+        self._thread = None
+        self._stopped = threading.Event()
+        self._closed = False
+        self.flushed_batches = 0
+        self.flushed_keys = 0
+        _buffers.append(self)
+
+    def add(self, key, **deltas):
+        """Add field deltas for one key"""
+        with self._lock:
+            if self._closed:
+                return
+            fields = self._pending.setdefault(key, {})
+            for field, delta in deltas.items():
+                fields[field] = fields.get(field, 0) + delta
+            full = len(self._pending) >= self.max_keys
+        self._ensure_thread()
+        if full:
+            self.flush()
+
+    def pending(self, key):
+        """Deltas for a key that are not in the database yet (queued or being flushed)"""
+        with self._lock:
+            totals = dict(self._inflight.get(key, {}))
+            for field, delta in self._pending.get(key, {}).items():
+                totals[field] = totals.get(field, 0) + delta
+            return totals
+
+    def flush(self):
+        """Write everything queued so far. Returns the number of keys flushed."""
+        with self._flush_lock:
+            with self._lock:
+                if self._closed:
+                    return 0
+                batch = {key: fields for key, fields in self._pending.items() if any(fields.values())}
+                self._pending = {}
+                self._inflight = batch
+            if not batch:
+                return 0
+            try:
+                self.flush_func(batch)
+                self.flushed_batches += 1
+                self.flushed_keys += len(batch)
+                return len(batch)
+            except Exception as e:
+                # Put the batch back so the next flush retries it
+                print(f"{self.name} flush failed: {e}")
+                with self._lock:
+                    for key, fields in batch.items():
+                        merged = self._pending.setdefault(key, {})
+                        for field, delta in fields.items():
+                            merged[field] = merged.get(field, 0) + delta
+                return 0
+            finally:
+                with self._lock:
+                    self._inflight = {}
+
+    def _ensure_thread(self):
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=f'{self.name}-flusher', daemon=True)
+                self._thread.start()
+                atexit.register(self.stop)
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            self.flush()
+
+    def stop(self):
+        """Stop the background flusher and write what is left"""
+        self._stopped.set()
+        self.flush()
+
+    def discard(self):
+        """Stop the background flusher and drop what is left; later adds are ignored"""
+        self._stopped.set()
+        with self._flush_lock, self._lock:
+            self._closed = True
+            self._pending = {}
+
+
+def discard_all():
+    for buffer in _buffers:
+        buffer.discard()
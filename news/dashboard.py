@@ -0,0 +1,217 @@
+import csv
+import json
+from datetime import datetime
+
+from django.contrib.auth.models import User
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from django.http import StreamingHttpResponse
+
+from .models import Comment, NewsArticle, Vote
+from .pagination import InvalidCursor, decode_cursor, encode_cursor
+
+# ==================== DASHBOARD LISTS ====================
+# The staff list pages (users, comments, articles, votes) used to hand a whole
+# table to the template. Each list is now described by a DashboardList:
+#
+#   - columns: the only fields read, through values(), so no model instances
+#     and no unused TEXT columns are loaded
+#   - filters: GET parameters turned into WHERE clauses
+#   - order: an indexed key ending in a unique column; pages are addressed by
+#     a signed cursor holding the last row's key (keyset pagination), so
+#     page 10,000 costs the same as page 1
+#
+# ?format=csv / ?format=ndjson streams every matching row with
+# StreamingHttpResponse over iterator(chunk_size=EXPORT_CHUNK_SIZE), so an
+# export of millions of votes runs in constant memory.
+
+DASHBOARD_PAGE_SIZE = 50
+MAX_DASHBOARD_PAGE_SIZE = 200
+EXPORT_CHUNK_SIZE = 2000
+DASHBOARD_CURSOR_SALT = 'newsify.dashboard'
+
+
+class DashboardList:
+    """
+    Args:
+        name: List name, also the cursor namespace
+        queryset: Callable returning the base queryset
+        columns: values() field names, in export column order
+        order: (field, descending) pairs; the last field must be unique
+        filters: {GET parameter: callable(value) -> Q}
+    """
+
+    def __init__(self, name, queryset, columns, order, filters=None):
+        self.name = name
+        self.queryset = queryset
+        self.columns = columns
+        self.order = order
+        self.filters = filters or {}
+
+    def filtered(self, params):
+        """Base queryset narrowed by the filter parameters present in params"""
+        qs = self.queryset()
+        applied = {}
+        for param, build in self.filters.items():
+            value = (params.get(param) or '').strip()
+            if value:
+                qs = qs.filter(build(value))
+                applied[param] = value
+        return qs, applied
+
+    def ordered(self, qs):
+        return qs.order_by(*[f'-{field}' if desc else field for field, desc in self.order])
+
+    def after(self, key):
+        """Rows strictly after `key` in list order"""
+        condition = Q()
+        for i in reversed(range(len(self.order))):
+            field, desc = self.order[i]
+            step = Q(**{f'{field}__{"lt" if desc else "gt"}': key[i]})
+            if i < len(self.order) - 1:
+                step |= Q(**{field: key[i]}) & condition
+            condition = step
+        return condition
+
+    def row_key(self, row):
+        return [row[field] for field, _ in self.order]
+
+    def page(self, params, cursor=None, page_size=DASHBOARD_PAGE_SIZE):
+        """
+        One page of rows (dicts of `columns`).
+
+        Returns:
+            (rows, applied filters, next_cursor or None)
+
+        Raises:
+            InvalidCursor if the cursor is malformed or belongs to another list/filter.
+        """
+        qs, applied = self.filtered(params)
+        if cursor:
+            state = decode_cursor(cursor, salt=DASHBOARD_CURSOR_SALT)
+            if state.get('l') != self.name or state.get('f') != applied:
+                raise InvalidCursor('Cursor does not belong to this list')
+            qs = qs.filter(self.after([_decode_value(value) for value in state['k']]))
+
+        key_fields = [field for field, _ in self.order if field not in self.columns]
+        rows = list(self.ordered(qs).values(*self.columns, *key_fields)[:page_size + 1])
+        next_cursor = None
+        if len(rows) > page_size:
+            rows = rows[:page_size]
+            next_cursor = encode_cursor({
+                'l': self.name,
+                'f': applied,
+                'k': [_encode_value(value) for value in self.row_key(rows[-1])],
+            }, salt=DASHBOARD_CURSOR_SALT)
+        return rows, applied, next_cursor
+
+    def export(self, params, fmt):
+        """StreamingHttpResponse with every matching row as CSV or NDJSON"""
+        qs, _ = self.filtered(params)
+        rows = self.ordered(qs).values_list(*self.columns).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+        if fmt == 'csv':
+            writer = csv.writer(_Echo())
+            body = (writer.writerow(row) for row in _with_header(self.columns, rows))
+            response = StreamingHttpResponse(body, content_type='text/csv')
+        else:
+            body = (json.dumps(dict(zip(self.columns, row)), cls=DjangoJSONEncoder) + '\n' for row in rows)
+            response = StreamingHttpResponse(body, content_type='application/x-ndjson')
+        response['Content-Disposition'] = f'attachment; filename="{self.name}.{fmt}"'
+        return response
+
+
+class _Echo:
+    """csv.writer target that hands each formatted line back instead of buffering it"""
+
+    def write(self, value):
+        return value
+
+
+def _with_header(columns, rows):
+    yield columns
+    yield from rows
+
+
+def _encode_value(value):
+    if isinstance(value, datetime):
+        return {'dt': value.isoformat()}
+    return value
+
+
+def _decode_value(value):
+    if isinstance(value, dict):
+        try:
+            return datetime.fromisoformat(value['dt'])
+        except (KeyError, TypeError, ValueError):
+            raise InvalidCursor('Invalid cursor')
+    return value
+
+
+def _int_filter(field):
+    def build(value):
+        if not value.isdigit():
+            return Q(pk__in=[])
+        return Q(**{field: int(value)})
+    return build
+
+
+def _yes_no_filter(field):
+    return lambda value: Q(**{field: value.lower() in ('1', 'true', 'yes')})
+
+
+# Keys: username is unique; ids grow with created_at (auto_now_add), so '-id'
+# is the comment/vote timeline on the primary key index; articles use the
+# (-published_date) index with id as the tie-breaker.
+DASHBOARD_LISTS = {
+    'users': DashboardList(
+        'users',
+        lambda: User.objects.all(),
+        columns=['id', 'username', 'email', 'is_staff', 'date_joined', 'last_login'],
+        order=[('username', False)],
+        filters={
+            'q': lambda value: Q(username__icontains=value) | Q(email__icontains=value),
+            'staff': _yes_no_filter('is_staff'),
+        },
+    ),
+    'comments': DashboardList(
+        'comments',
+        lambda: Comment.objects.all(),
+        columns=['id', 'created_at', 'author_name', 'session_id', 'article_id', 'article__title', 'text'],
+        order=[('id', True)],
+        filters={
+            'article': _int_filter('article_id'),
+            'session': lambda value: Q(session_id=value),
+            'q': lambda value: Q(text__icontains=value),
+        },
+    ),
+    'articles': DashboardList(
+        'articles',
+        lambda: NewsArticle.objects.all(),
+        columns=['id', 'published_date', 'title', 'category', 'source', 'upvotes', 'downvotes',
+                 'views', 'comment_count', 'source_url'],
+        order=[('published_date', True), ('id', True)],
+        filters={
+            'category': lambda value: Q(category=value),
+            'source': lambda value: Q(source=value),
+            'q': lambda value: Q(title__icontains=value),
+        },
+    ),
+    'votes': DashboardList(
+        'votes',
+        lambda: Vote.objects.all(),
+        columns=['id', 'created_at', 'session_id', 'vote_type', 'article_id', 'article__title'],
+        order=[('id', True)],
+        filters={
+            'article': _int_filter('article_id'),
+            'session': lambda value: Q(session_id=value),
+            'type': lambda value: Q(vote_type=value),
+        },
+    ),
+}
+
+
+def parse_page_size(value):
+    try:
+        return max(1, min(int(value), MAX_DASHBOARD_PAGE_SIZE))
+    except (TypeError, ValueError):
+        return DASHBOARD_PAGE_SIZE
@@ -0,0 +1,227 @@
+import hashlib
+import random
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Q
+
+from .models import ArticleBand, ArticleSignature, NewsArticle
+
+# ==================== NEAR-DUPLICATE DETECTION ====================
+# The same wire story arrives from several providers under different URLs
+# (with a " - Reuters" suffix, a truncated description...), so the unique
+# source_url index lets every copy in.
+#
+# Each article gets a MinHash signature of its word and word-pair set. The
+# fraction of equal positions in two signatures estimates the Jaccard
+# similarity of the two texts; syndicated copies score around 0.9, different
+# stories on the same topic well under 0.5.
+#
+# Lookups use LSH banding: the 32 values are cut into 8 bands of 4 and each band
+# is hashed into one ArticleBand key, indexed together with the publish date.
+# Two articles with similarity s share at least one key with probability
+# 1 - (1 - s^4)^8 (0.89 at s=0.7, 0.98 at s=0.8), so candidates come from one
+# indexed `key IN (...)` query instead of a scan. Their estimated similarity is
+# then checked against DUPLICATE_SIMILARITY.
+#
+# The first article of a story is its representative. Later copies get
+# duplicate_of pointing at it and are left out of the feed. When a copy with
+# an earlier publish date turns up in a later batch, the stored cluster is
+# re-pointed to it. Signatures are
+# rows, so the index survives restarts; `manage.py index_duplicates` backfills
+# existing articles.
+
+NUM_PERM = 32
+LSH_BANDS = 8
+LSH_ROWS = NUM_PERM // LSH_BANDS
+DUPLICATE_SIMILARITY = 0.7
+DUPLICATE_WINDOW = timedelta(days=3)  # copies of a story are published close together
+
+_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 64) - 1
+# Fixed seed: stored signatures must stay comparable across restarts
+_rng = random.Random(20261017)
+_PERMUTATIONS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+
+
+def tokens(text):
+    return ''.join(ch if ch.isalnum() else ' ' for ch in (text or '').lower()).split()
+
+
+def features(title, description):
+    """Set of words and word pairs of an article's title and description"""
+    result = set()
+    for text in (title, description):
+        words = tokens(text)
+        result.update(words)
+        result.update(f'{a} {b}' for a, b in zip(words, words[1:]))
+    return result
+
+
+def _hash64(data):
+    # hashlib rather than hash(): string hashing is salted per process
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), 'big')
+
+
+def minhash(title, description):
+    """List of NUM_PERM minimum hashes, or None for text without any words"""
+    hashes = [_hash64(feature.encode()) for feature in features(title, description)]
+    if not hashes:
+        return None
+    return [min((a * h + b) % _PRIME for h in hashes) for a, b in _PERMUTATIONS]
+
+
+def similarity(sig_a, sig_b):
+    """Estimated Jaccard similarity of two signatures"""
+    return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / NUM_PERM
+
+
+def band_keys(signature):
+    """One signed 64-bit key per band (BigIntegerField is signed)"""
+    keys = []
+    for band in range(LSH_BANDS):
+        rows = signature[band * LSH_ROWS:(band + 1) * LSH_ROWS]
+        data = band.to_bytes(1, 'big') + b''.join(value.to_bytes(8, 'big') for value in rows)
+        key = _hash64(data)
+        keys.append(key - (1 << 64) if key > _MAX_HASH >> 1 else key)
+    return keys
+
+
+def pack(signature):
+    return b''.join(value.to_bytes(8, 'big') for value in signature)
+
+
+def unpack(data):
+    data = bytes(data)
+    return [int.from_bytes(data[i:i + 8], 'big') for i in range(0, len(data), 8)]
+
+
+class _CandidateIndex:
+    """band key -> signed articles, for one ingest batch plus its stored candidates"""
+
+    def __init__(self):
+        self._buckets = {}
+        self._signatures = {}
+        self._root_dates = {}
+
+    def add(self, article_id, root_id, signature, keys, published_date, root_date=None):
+        self._signatures[article_id] = (signature, root_id, published_date)
+        self._root_dates.setdefault(root_id, published_date if root_id == article_id else root_date)
+        for key in keys:
+            self._buckets.setdefault(key, set()).add(article_id)
+
+    def root_date(self, root_id):
+        return self._root_dates[root_id]
+
+    def repoint(self, old_root_id, new_root_id, new_root_date):
+        """Move every indexed member of old_root_id's cluster under new_root_id"""
+        for article_id, (signature, root_id, published_date) in self._signatures.items():
+            if root_id == old_root_id:
+                self._signatures[article_id] = (signature, new_root_id, published_date)
+        self._root_dates[new_root_id] = new_root_date
+
+    def representative(self, article_id, signature, keys, published_date):
+        """Root of the most similar earlier-indexed article, or None"""
+        best = None
+        candidates = set().union(*(self._buckets.get(key, ()) for key in keys))
+        candidates.discard(article_id)
+        for candidate_id in candidates:
+            other, root_id, other_date = self._signatures[candidate_id]
+            if abs(published_date - other_date) > DUPLICATE_WINDOW:
+                continue
+            score = similarity(signature, other)
+            if score >= DUPLICATE_SIMILARITY:
+                rank = (-score, other_date, candidate_id)
+                if best is None or rank < best[0]:
+                    best = (rank, root_id)
+        return best[1] if best else None
+
+
+def _load_candidates(index, keys, earliest, latest):
+    """Add stored articles sharing a band key with the batch (2 queries)"""
+    article_ids = set(
+        ArticleBand.objects.filter(
+            key__in=list(keys),
+            published_date__gte=earliest - DUPLICATE_WINDOW,
+            published_date__lte=latest + DUPLICATE_WINDOW,
+        ).values_list('article_id', flat=True)
+    )
+    if not article_ids:
+        return
+    rows = ArticleSignature.objects.filter(article_id__in=article_ids).values_list(
+        'article_id', 'minhash', 'published_date',
+        'article__duplicate_of_id', 'article__duplicate_of__published_date',
+    )
+    for article_id, data, published_date, duplicate_of_id, root_date in rows:
+        signature = unpack(data)
+        index.add(article_id, duplicate_of_id or article_id, signature, band_keys(signature),
+                  published_date, root_date)
+
+
+def index_articles(articles):
+    """
+    Sign newly saved articles and point near-duplicates at their story's
+    representative (also within the batch). Articles are taken oldest first,
+    so the earliest copy of a story wins; if a stored story's representative
+    was published after the new copy, the whole cluster is re-pointed to the
+    new copy.
+
+    Returns:
+        Number of articles marked as duplicates
+    """
+    signed = []
+    for article in sorted(articles, key=lambda a: (a.published_date, a.id)):
+        signature = minhash(article.title, article.description)
+        if signature is not None:
+            signed.append((article, signature, band_keys(signature)))
+    if not signed:
+        return 0
+
+    index = _CandidateIndex()
+    _load_candidates(
+        index,
+        {key for _, _, keys in signed for key in keys},
+        signed[0][0].published_date,
+        signed[-1][0].published_date,
+    )
+
+    signatures = []
+    bands = []
+    changed = []  # articles whose duplicate_of is set or cleared
+    repointed = {}  # old representative id -> new one
+    for article, signature, keys in signed:
+        root_id = index.representative(article.id, signature, keys, article.published_date)
+        if root_id is not None and root_id != article.id:
+            if (article.published_date, article.id) < (index.root_date(root_id), root_id):
+                repointed[root_id] = article.id
+                index.repoint(root_id, article.id, article.published_date)
+                for duplicate in changed:
+                    if duplicate.duplicate_of_id == root_id:
+                        duplicate.duplicate_of_id = article.id
+                article.duplicate_of_id = None
+            else:
+                article.duplicate_of_id = root_id
+            changed.append(article)
+        index.add(article.id, article.duplicate_of_id or article.id, signature, keys, article.published_date)
+
+        signatures.append(ArticleSignature(
+            article=article, minhash=pack(signature), published_date=article.published_date
+        ))
+        bands.extend(
+            ArticleBand(article=article, key=key, published_date=article.published_date) for key in keys
+        )
+
+    with transaction.atomic():
+        # Re-indexing an article replaces its bands
+        ArticleBand.objects.filter(article_id__in=[article.id for article, _, _ in signed]).delete()
+        ArticleSignature.objects.bulk_create(signatures, update_conflicts=True,
+                                             update_fields=['minhash', 'published_date'],
+                                             unique_fields=['article'])
+        ArticleBand.objects.bulk_create(bands)
+        if changed:
+            NewsArticle.objects.bulk_update(changed, ['duplicate_of'])
+        for old_root_id, new_root_id in repointed.items():
+            NewsArticle.objects.filter(
+                Q(id=old_root_id) | Q(duplicate_of_id=old_root_id)
+            ).exclude(id=new_root_id).update(duplicate_of_id=new_root_id)
+    return sum(1 for article in changed if article.duplicate_of_id) + len(repointed)
@@ -0,0 +1,219 @@
+import asyncio
+import json
+import threading
+from collections import deque
+
+from django.conf import settings
+from django.db import connection
+
+from .buffers import DeltaBuffer
+from .models import NewsArticle
+
+# ==================== LIVE FEED EVENTS ====================
+# /api/events/ is a Server-Sent Events stream (an async view, so under ASGI an
+# idle client is one coroutine and a small queue, not a worker thread). Under
+# WSGI it answers 204 and index.html polls for new articles instead.
+#
+# EventBroker is an in-process pub/sub: publish() may be called from any thread
+# and hands each event to every subscriber's asyncio queue on that
+# subscriber's own event loop. The last EVENT_HISTORY events are kept so a
+# reconnecting EventSource (Last-Event-ID) gets what it missed; a client that
+# fell further behind, or whose queue overflowed, gets one 'resync' event.
+#
+# Events:
+#   articles  {'articles': [{'id': .., 'category': ..}, ...]}
+#   votes     {'votes': {article_id: {'upvotes': n, 'downvotes': m,
+#                                     'up': delta, 'down': delta}}}
+#
+# Votes are published from cast_vote and coalesced for VOTE_EVENT_INTERVAL, so
+# a hot article is one event per interval rather than one per vote (they only
+# reach clients connected to the process that took the vote). Articles
+# are written by the ingest daemon, a different process, so one poller thread
+# per process looks for new rows by id every ARTICLE_POLL_INTERVAL seconds
+# while anyone is listening; in-process ingests poke it to run at once.
+
+EVENT_HISTORY = 500
+SUBSCRIBER_QUEUE_SIZE = 100
+HEARTBEAT_INTERVAL = 15.0  # seconds; keeps proxies from closing idle streams
+VOTE_EVENT_INTERVAL = 1.0
+ARTICLE_POLL_INTERVAL = 2.0
+ARTICLE_POLL_LIMIT = 200
+
+
+class Subscription:
+    def __init__(self, loop, queue_size=SUBSCRIBER_QUEUE_SIZE):
+        self.loop = loop
+        self.queue = asyncio.Queue(maxsize=queue_size)
+
+    def _put(self, event):
+        # Runs on the subscriber's loop
+        if self.queue.full():
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            event = (event[0], 'resync', {})
+        self.queue.put_nowait(event)
+
+    async def get(self, timeout):
+        """Next (id, kind, data), or None after `timeout` seconds without one"""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class EventBroker:
+    def __init__(self, history=EVENT_HISTORY):
+        self._lock = threading.Lock()
+        self._subscribers = set()
+        self._history = deque(maxlen=history)
+        self._last_id = 0
+
+    def subscribe(self):
+        """New subscription bound to the running event loop"""
+        subscription = Subscription(asyncio.get_running_loop())
+        with self._lock:
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    @property
+    def subscriber_count(self):
+        with self._lock:
+            return len(self._subscribers)
+
+    @property
+    def last_id(self):
+        with self._lock:
+            return self._last_id
+
+    def publish(self, kind, data):
+        with self._lock:
+            self._last_id += 1
+            event = (self._last_id, kind, data)
+            self._history.append(event)
+            subscribers = list(self._subscribers)
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription._put, event)
+            except RuntimeError:
+                # Loop already closed: the client is gone
+                self.unsubscribe(subscription)
+        return event[0]
+
+    def since(self, last_id):
+        """
+        Events after `last_id`, or None if the client has to resync: some of
+        them were already dropped from the history, or `last_id` is ahead of
+        this broker (it came from another process or before a restart).
+        """
+        with self._lock:
+            if last_id > self._last_id:
+                return None
+            if last_id == self._last_id:
+                return []
+            if not self._history or self._history[0][0] > last_id + 1:
+                return None
+            return [event for event in self._history if event[0] > last_id]
+
+
+event_broker = EventBroker()
+
+
+def format_event(event):
+    """One SSE frame"""
+    event_id, kind, data = event
+    return f"id: {event_id}\nevent: {kind}\ndata: {json.dumps(data)}\n\n"
+
+
+# -------------------- VOTES --------------------
+
+_vote_counts = {}
+_vote_counts_lock = threading.Lock()
+
+
+def _publish_votes(batch):
+    with _vote_counts_lock:
+        counts = {article_id: _vote_counts.pop(article_id, None) for article_id in batch}
+    payload = {}
+    for article_id, deltas in batch.items():
+        entry = {'up': deltas.get('up', 0), 'down': deltas.get('down', 0)}
+        if counts[article_id]:
+            entry['upvotes'], entry['downvotes'] = counts[article_id]
+        payload[str(article_id)] = entry
+    event_broker.publish('votes', {'votes': payload})
+
+
+vote_events = DeltaBuffer('vote-events', _publish_votes, interval=VOTE_EVENT_INTERVAL)
+
+
+def publish_vote(article_id, up, down, upvotes, downvotes):
+    """Queue a vote change (deltas plus the counts after it) for the next votes event"""
+    if not event_broker.subscriber_count:
+        return
+    with _vote_counts_lock:
+        _vote_counts[article_id] = (upvotes, downvotes)
+    vote_events.add(article_id, up=up, down=down)
+
+
+# -------------------- ARTICLES --------------------
+
+class ArticlePoller:
+    """Publishes an 'articles' event for feed rows with ids above the last one seen"""
+
+    def __init__(self, interval=ARTICLE_POLL_INTERVAL):
+        self.interval = interval
+        self.last_seen_id = None
+        self._wake = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='article-events', daemon=True)
+                self._thread.start()
+
+    def poke(self):
+        """Check for new articles now instead of at the next interval"""
+        self._wake.set()
+
+    def poll(self):
+        if self.last_seen_id is None:
+            latest = NewsArticle.objects.order_by('-id').values_list('id', flat=True).first()
+            self.last_seen_id = latest or 0
+            return 0
+        rows = list(
+            NewsArticle.objects.filter(id__gt=self.last_seen_id)
+            .order_by('id')
+            .values('id', 'category', 'duplicate_of_id')[:ARTICLE_POLL_LIMIT]
+        )
+        if not rows:
+            return 0
+        self.last_seen_id = rows[-1]['id']
+        articles = [{'id': row['id'], 'category': row['category']} for row in rows if not row['duplicate_of_id']]
+        if articles:
+            event_broker.publish('articles', {'articles': articles})
+        return len(articles)
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            if not event_broker.subscriber_count:
+                # Nobody listening: start from the newest row once someone is
+                self.last_seen_id = None
+                continue
+            try:
+                self.poll()
+            except Exception as e:
+                print(f"Article event poll failed: {e}")
+            finally:
+                connection.close()
+
+
+article_poller = ArticlePoller(interval=getattr(settings, 'NEWSIFY_EVENTS_POLL_INTERVAL', ARTICLE_POLL_INTERVAL))
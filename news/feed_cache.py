@@ -0,0 +1,114 @@
+import hashlib
+import json
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection
+
+# ==================== ANONYMOUS FEED RESPONSE CACHE ====================
+# Visitors without preferences all get the same /api/news/ and /api/archived/
+# body for the same parameters, so the body is built once and shared. Entries
+# are keyed by the view name plus its normalized parameters and remember the
+# version counters they were built under:
+#
+#   ingest    bumped when an ingest saves new articles
+#   comments  bumped when a comment is posted
+#
+# Votes don't invalidate anything: steady voting traffic would keep every entry
+# stale. The views overlay the current vote counts on the cached body instead
+# (views.with_live_counts, one primary-key query per response).
+#
+# An entry is fresh while its versions are current and it is younger than
+# NEWSIFY_FEED_CACHE_TTL. After that it is still served for up to
+# NEWSIFY_FEED_CACHE_STALE more seconds while one background thread rebuilds
+# it (stale-while-revalidate), so readers never wait on a rebuild.
+# Per-session fields such as user_vote are merged on top by the view.
+#
+# NEWSIFY_FEED_CACHE names the Django cache alias to use: 'feed' (local memory,
+# per process) or 'feed_file' (file based, shared by the processes on a host).
+# Versions live in the same cache, so bumps reach every process sharing it.
+
+DEFAULT_FEED_CACHE = 'feed'
+DEFAULT_FEED_CACHE_TTL = 30  # seconds
+DEFAULT_FEED_CACHE_STALE = 300  # seconds
+REVALIDATE_LOCK_TIMEOUT = 30
+
+KEY_PREFIX = 'newsify:feed'
+VERSION_NAMES = ('ingest', 'comments')
+
+HIT, STALE, MISS = 'HIT', 'STALE', 'MISS'
+
+
+def get_feed_cache():
+    return caches[getattr(settings, 'NEWSIFY_FEED_CACHE', DEFAULT_FEED_CACHE)]
+
+
+def _version_key(name):
+    return f'{KEY_PREFIX}:version:{name}'
+
+
+def bump_version(name):
+    """Mark every cached body built before now as stale"""
+    get_feed_cache().set(_version_key(name), time.time_ns(), None)
+
+
+def current_versions():
+    keys = [_version_key(name) for name in VERSION_NAMES]
+    values = get_feed_cache().get_many(keys)
+    return [values.get(key) for key in keys]
+
+
+def cache_key(view, params):
+    raw = json.dumps(params, sort_keys=True, separators=(',', ':'))
+    return f'{KEY_PREFIX}:{view}:{hashlib.sha256(raw.encode()).hexdigest()}'
+
+
+def _store(cache, key, build):
+    # Read versions first: a bump during the build must leave the entry stale
+    versions = current_versions()
+    body = build()
+    ttl = getattr(settings, 'NEWSIFY_FEED_CACHE_TTL', DEFAULT_FEED_CACHE_TTL)
+    stale = getattr(settings, 'NEWSIFY_FEED_CACHE_STALE', DEFAULT_FEED_CACHE_STALE)
+    cache.set(key, {'versions': versions, 'built_at': time.time(), 'body': body}, ttl + stale)
+    return body
+
+
+def _revalidate(cache, key, build):
+    lock_key = f'{key}:lock'
+    if not cache.add(lock_key, 1, REVALIDATE_LOCK_TIMEOUT):
+        return  # another request is already rebuilding this entry
+
+    def run():
+        try:
+            _store(cache, key, build)
+        except Exception as e:
+            print(f"Feed cache revalidation failed: {e}")
+        finally:
+            cache.delete(lock_key)
+            connection.close()
+
+    threading.Thread(target=run, name='feed-cache-revalidate', daemon=True).start()
+
+
+def cached_body(view, params, build):
+    """
+    Shared response body for (view, params), building it with build() on a miss.
+
+    Returns:
+        (body, status) with status HIT, STALE or MISS. Exceptions from build()
+        on a miss propagate to the caller.
+    """
+    cache = get_feed_cache()
+    key = cache_key(view, params)
+    entry = cache.get(key)
+
+    if entry is not None:
+        age = time.time() - entry['built_at']
+        if entry['versions'] == current_versions() and age < getattr(settings, 'NEWSIFY_FEED_CACHE_TTL', DEFAULT_FEED_CACHE_TTL):
+            return entry['body'], HIT
+        _revalidate(cache, key, build)
+        return entry['body'], STALE
+
+    return _store(cache, key, build), MISS
@@ -0,0 +1,296 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone as dt_timezone
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Not on Windows; quota counts are then only safe within one process
+    fcntl = None
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from .http_client import CircuitOpenError, get_http_client
+
+# ==================== PROVIDER RESPONSE CACHE ====================
+# Free tiers are tiny (NewsData 200/day, GNews 100/day), so identical requests
+# made within a provider's TTL are answered from disk. Once the TTL runs out we
+# revalidate with ETag / If-Modified-Since where the provider supports it, and a
+# quota accountant stops calling a provider once its daily budget is spent.
+
+DEFAULT_CACHE_TTL = 900  # seconds
+
+DEFAULT_PROVIDER_CACHE_TTL = {
+    'NewsAPI': 900,
+    'NewsData.io': 1800,
+    'The Guardian': 600,
+    'NYTimes': 900,
+    'GNews': 1800,
+}
+
+DEFAULT_PROVIDER_DAILY_QUOTA = {
+    'NewsAPI': 100,
+    'NewsData.io': 200,
+    'The Guardian': 5000,
+    'NYTimes': 500,
+    'GNews': 100,
+}
+
+
+def _cache_dir():
+    default = Path(settings.BASE_DIR) / '.newsify_cache' / 'http'
+    return Path(getattr(settings, 'NEWSIFY_HTTP_CACHE_DIR', default))
+
+
+def _write_json_atomic(path, payload):
+    """Write JSON to a temp file and rename it over the target"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(payload, f)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class BaseResponseCache:
+    """Interface for response cache backends (set NEWSIFY_HTTP_CACHE_BACKEND to swap)"""
+
+    def get(self, key):
+        raise NotImplementedError
+
+    def set(self, key, entry):
+        raise NotImplementedError
+
+    def delete(self, key):
+        raise NotImplementedError
+
+
+class FileResponseCache(BaseResponseCache):
+    """One JSON file per cached response"""
+
+    def __init__(self, directory=None):
+        self.directory = Path(directory) if directory else _cache_dir() / 'responses'
+
+    def _path(self, key):
+        return self.directory / key[:2] / f'{key}.json'
+
+    def get(self, key):
+        try:
+            with open(self._path(key)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key, entry):
+        try:
+            _write_json_atomic(self._path(key), entry)
+        except OSError as e:
+            print(f"Response cache write failed: {e}")
+
+    def delete(self, key):
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+
+class MemoryResponseCache(BaseResponseCache):
+    """Process-local cache, handy for tests and single-process dev servers"""
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            return self._entries.get(key)
+
+    def set(self, key, entry):
+        with self._lock:
+            self._entries[key] = entry
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+class QuotaAccountant:
+    """
+    Count provider calls per UTC day and refuse calls past the daily budget.
+    Counts are persisted next to the response cache so restarts don't reset them.
+
+    The web server, the ingest daemon and manual fetch_news runs all spend the
+    same budgets, so every read-modify-write re-reads the file under an
+    exclusive lock (quota.json.lock) instead of trusting an in-memory copy.
+    """
+
+    def __init__(self, quotas=None, path=None):
+        self.quotas = quotas if quotas is not None else getattr(
+            settings, 'NEWSIFY_PROVIDER_DAILY_QUOTA', DEFAULT_PROVIDER_DAILY_QUOTA
+        )
+        self.path = Path(path) if path else _cache_dir() / 'quota.json'
+        self.lock_path = self.path.with_name(self.path.name + '.lock')
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _today():
+        return datetime.now(dt_timezone.utc).date().isoformat()
+
+    @contextmanager
+    def _locked(self):
+        """Hold the thread lock and, where supported, an exclusive file lock"""
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.lock_path, 'a') as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _load(self):
+        """Today's {provider: calls} as currently on disk"""
+        try:
+            with open(self.path) as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            saved = {}
+        return saved.get('used', {}) if saved.get('day') == self._today() else {}
+
+    def _save(self, used):
+        try:
+            _write_json_atomic(self.path, {'day': self._today(), 'used': used})
+        except OSError as e:
+            print(f"Quota file write failed: {e}")
+
+    def remaining(self, provider):
+        """Calls left today (None = unlimited)"""
+        limit = self.quotas.get(provider)
+        if limit is None:
+            return None
+        with self._locked():
+            return max(0, limit - self._load().get(provider, 0))
+
+    def try_consume(self, provider):
+        """Reserve one call. Returns False if the provider's budget is spent."""
+        limit = self.quotas.get(provider)
+        with self._locked():
+            used = self._load()
+            count = used.get(provider, 0)
+            if limit is not None and count >= limit:
+                return False
+            used[provider] = count + 1
+            self._save(used)
+            return True
+
+    def usage(self):
+        """{provider: calls made today}"""
+        with self._locked():
+            return self._load()
+
+
+_response_cache = None
+_quota = None
+_init_lock = threading.Lock()
+
+
+def get_response_cache():
+    global _response_cache
+    with _init_lock:
+        if _response_cache is None:
+            backend = getattr(settings, 'NEWSIFY_HTTP_CACHE_BACKEND', 'news.http_cache.FileResponseCache')
+            _response_cache = import_string(backend)()
+        return _response_cache
+
+
+def get_quota_accountant():
+    global _quota
+    with _init_lock:
+        if _quota is None:
+            _quota = QuotaAccountant()
+        return _quota
+
+
+def cache_key(provider, url, params):
+    raw = json.dumps([provider, url, sorted((params or {}).items())], default=str)
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def get_cache_ttl(provider):
+    ttls = getattr(settings, 'NEWSIFY_PROVIDER_CACHE_TTL', DEFAULT_PROVIDER_CACHE_TTL)
+    return ttls.get(provider, DEFAULT_CACHE_TTL)
+
+
+def cached_get_json(provider, url, params=None, timeout=None):
+    """
+    GET a provider endpoint through the response cache.
+
+    Fresh cache hits cost nothing. Stale entries are revalidated with
+    If-None-Match / If-Modified-Since, and a 304 just renews the entry.
+    When the provider's daily quota is spent, or its circuit breaker is open
+    after repeated failures, the last cached payload (if any) is returned
+    instead of making the call. The call itself goes through the shared
+    HttpClient (pooled connections, retries with backoff); retries of one
+    logical request count once against the quota.
+
+    Returns:
+        Parsed JSON body, or None if nothing usable is available.
+    """
+    cache = get_response_cache()
+    key = cache_key(provider, url, params)
+    entry = cache.get(key)
+    now = time.time()
+
+    if entry and now - entry.get('stored_at', 0) < get_cache_ttl(provider):
+        return entry['data']
+
+    client = get_http_client()
+    if client.is_open(provider):
+        print(f"{provider}: circuit open, skipping request")
+        return entry['data'] if entry else None
+
+    if not get_quota_accountant().try_consume(provider):
+        print(f"{provider}: daily quota used up, skipping request")
+        return entry['data'] if entry else None
+
+    headers = {}
+    if entry:
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+
+    try:
+        response = client.get(url, params=params, headers=headers, timeout=timeout, breaker=provider)
+    except CircuitOpenError:
+        return entry['data'] if entry else None
+
+    if response.status_code == 304 and entry:
+        entry['stored_at'] = now
+        cache.set(key, entry)
+        return entry['data']
+
+    if response.status_code != 200:
+        return None
+
+    data = response.json()
+    cache.set(key, {
+        'stored_at': now,
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified'),
+        'data': data,
+    })
+    return data
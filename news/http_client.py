@@ -0,0 +1,255 @@
+import random
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+# ==================== SHARED HTTP CLIENT ====================
+# All outbound HTTP (provider APIs through http_cache, article link checks)
+# goes through one HttpClient:
+#
+#   - one requests.Session, so connections are kept alive and pooled per host
+#     instead of a new TCP + TLS handshake per call
+#   - (connect, read) timeouts from NEWSIFY_HTTP_TIMEOUT
+#   - retries for connection errors, timeouts, 429 and 5xx, with exponential
+#     backoff and full jitter (Retry-After is honoured when it is shorter
+#     than MAX_BACKOFF)
+#   - an optional circuit breaker per provider: after BREAKER_THRESHOLD failed
+#     calls in a row the provider is skipped for BREAKER_RESET seconds, then a
+#     single trial call decides whether it is back
+#   - per-host request, error, retry and latency counters (metrics())
+
+DEFAULT_TIMEOUT = (3.05, 10)  # connect, read (seconds)
+DEFAULT_RETRIES = 2
+BACKOFF_BASE = 0.5  # seconds; attempt n waits up to BACKOFF_BASE * 2**n
+MAX_BACKOFF = 30.0
+RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+POOL_HOSTS = 100  # hosts whose connection pools are kept
+POOL_SIZE = 32  # keep-alive connections per host
+BREAKER_THRESHOLD = 5
+BREAKER_RESET = 60.0  # seconds
+
+
+def backoff_delay(attempt, response=None):
+    """Seconds to wait before retry number `attempt` (full jitter, honours Retry-After)"""
+    delay = random.uniform(0, min(MAX_BACKOFF, BACKOFF_BASE * (2 ** attempt)))
+    retry_after = response.headers.get('Retry-After') if response is not None else None
+    if retry_after and retry_after.isdigit():
+        delay = max(delay, min(MAX_BACKOFF, float(retry_after)))
+    return delay
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """Raised instead of calling a provider whose breaker is open"""
+
+
+class CircuitBreaker:
+    CLOSED, OPEN, HALF_OPEN = 'closed', 'open', 'half-open'
+
+    def __init__(self, name, threshold=BREAKER_THRESHOLD, reset_after=BREAKER_RESET):
+        self.name = name
+        self.threshold = threshold
+        self.reset_after = reset_after
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """True if a call may go out now (half-open lets exactly one through)"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_after:
+                self.state = self.HALF_OPEN
+                return True
+            return False
+
+    def is_open(self):
+        with self._lock:
+            if self.state == self.OPEN:
+                return time.monotonic() - self.opened_at < self.reset_after
+            return self.state == self.HALF_OPEN
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.threshold:
+                if self.state != self.OPEN:
+                    print(f"Circuit breaker for {self.name} opened after {self.failures} failures")
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+    def snapshot(self):
+        with self._lock:
+            return {'state': self.state, 'consecutive_failures': self.failures}
+
+
+class HostMetrics:
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.status_counts = {}
+
+    def snapshot(self):
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'retries': self.retries,
+            'avg_latency_ms': round(1000 * self.total_latency / self.requests, 1) if self.requests else 0.0,
+            'max_latency_ms': round(1000 * self.max_latency, 1),
+            'status_counts': dict(self.status_counts),
+        }
+
+
+def _host(url):
+    try:
+        return (urlparse(url).hostname or '').lower() or 'unknown'
+    except ValueError:
+        return 'unknown'
+
+
+class HttpClient:
+    def __init__(self, timeout=None, retries=None, pool_hosts=POOL_HOSTS, pool_size=POOL_SIZE):
+        self.timeout = timeout or tuple(getattr(settings, 'NEWSIFY_HTTP_TIMEOUT', DEFAULT_TIMEOUT))
+        self.retries = retries if retries is not None else getattr(settings, 'NEWSIFY_HTTP_RETRIES', DEFAULT_RETRIES)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_hosts, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self._lock = threading.Lock()
+        self._breakers = {}
+        self._metrics = {}
+
+    def breaker(self, name):
+        with self._lock:
+            if name not in self._breakers:
+                self._breakers[name] = CircuitBreaker(name)
+            return self._breakers[name]
+
+    def is_open(self, name):
+        """True if calls for `name` would be refused right now (does not use up the half-open trial)"""
+        with self._lock:
+            breaker = self._breakers.get(name)
+        return breaker is not None and breaker.is_open()
+
+    def _record(self, host, latency, status=None, error=False, retried=False):
+        with self._lock:
+            metrics = self._metrics.setdefault(host, HostMetrics())
+            metrics.requests += 1
+            metrics.total_latency += latency
+            metrics.max_latency = max(metrics.max_latency, latency)
+            if status is not None:
+                metrics.status_counts[status] = metrics.status_counts.get(status, 0) + 1
+            if error:
+                metrics.errors += 1
+            if retried:
+                metrics.retries += 1
+
+    def request(self, method, url, breaker=None, retries=None, timeout=None, **kwargs):
+        """
+        Send a request with retries, through `breaker` (a provider name) if given.
+
+        Returns:
+            The final requests.Response (which may still be a 429/5xx once
+            retries are used up).
+
+        Raises:
+            CircuitOpenError if the breaker is open, the last
+            requests.RequestException when every attempt failed to connect,
+            or any other exception the first time it is raised.
+        """
+        circuit = self.breaker(breaker) if breaker else None
+        if circuit is not None and not circuit.allow():
+            raise CircuitOpenError(f"{breaker} is failing; circuit open")
+
+        host = _host(url)
+        retries = self.retries if retries is None else retries
+        timeout = timeout or self.timeout
+        attempt = 0
+        while True:
+            started = time.monotonic()
+            response = None
+            try:
+                response = self.session.request(method, url, timeout=timeout, **kwargs)
+                failed = response.status_code in RETRY_STATUSES
+                self._record(host, time.monotonic() - started, status=response.status_code,
+                             error=failed, retried=attempt > 0)
+            except requests.exceptions.RequestException:
+                self._record(host, time.monotonic() - started, error=True, retried=attempt > 0)
+                if attempt >= retries:
+                    if circuit is not None:
+                        circuit.record_failure()
+                    raise
+                failed = True
+            except BaseException:
+                # Anything else isn't retried, but it still counts against the
+                # breaker; a half-open trial must never leave it half-open
+                self._record(host, time.monotonic() - started, error=True, retried=attempt > 0)
+                if circuit is not None:
+                    circuit.record_failure()
+                raise
+
+            if not failed:
+                if circuit is not None:
+                    circuit.record_success()
+                return response
+            if attempt >= retries:
+                if circuit is not None:
+                    circuit.record_failure()
+                return response
+
+            time.sleep(backoff_delay(attempt, response))
+            attempt += 1
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def head(self, url, **kwargs):
+        return self.request('HEAD', url, **kwargs)
+
+    def metrics(self):
+        """{'hosts': {host: counters}, 'breakers': {provider: state}}"""
+        with self._lock:
+            hosts = {host: metrics.snapshot() for host, metrics in self._metrics.items()}
+            breakers = dict(self._breakers)
+        return {'hosts': hosts, 'breakers': {name: b.snapshot() for name, b in breakers.items()}}
+
+
+def format_metrics(metrics, limit=15):
+    """Printable table of HttpClient.metrics(), busiest hosts first"""
+    lines = [f"{'host':<32} {'requests':>8} {'errors':>6} {'retries':>7} {'avg ms':>8} {'max ms':>8}"]
+    hosts = sorted(metrics['hosts'].items(), key=lambda item: -item[1]['requests'])
+    for host, row in hosts[:limit]:
+        lines.append(
+            f"{host[:32]:<32} {row['requests']:>8} {row['errors']:>6} {row['retries']:>7} "
+            f"{row['avg_latency_ms']:>8} {row['max_latency_ms']:>8}"
+        )
+    open_breakers = [name for name, state in metrics['breakers'].items() if state['state'] != CircuitBreaker.CLOSED]
+    if open_breakers:
+        lines.append(f"Circuit open: {', '.join(open_breakers)}")
+    return '\n'.join(lines)
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_http_client():
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient()
+        return _client
@@ -0,0 +1,118 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+
+from .buffers import DeltaBuffer
+from .models import NewsArticle, UserProfile, engagement_after
+
+# ==================== ARTICLE VIEW TRACKING ====================
+# index.html sends a beacon (POST /api/view-beacon/) with the ids of articles
+# that were on screen for a moment ('impression') or opened ('read').
+#
+#   - Each (visitor, article, kind) counts once per DEDUPE_TTL, checked in an
+#     in-process SeenSet; repeated scrolling past the same card is free.
+#   - Counts go into DeltaBuffers, not the database. Every
+#     NEWSIFY_VIEW_FLUSH_INTERVAL seconds one UPDATE per distinct delta writes
+#     NewsArticle.views (and engagement), and reads are added to
+#     UserProfile.total_articles_read the same way.
+#
+# Visitors without a session are keyed by a hash of address and user agent, so
+# a beacon never creates a session. Like the other write-behind counters, a
+# hard crash loses at most one interval of views.
+
+DEFAULT_DEDUPE_TTL = 6 * 60 * 60  # seconds
+DEFAULT_DEDUPE_SIZE = 200000
+DEFAULT_VIEW_FLUSH_INTERVAL = 5.0
+MAX_BEACON_ARTICLES = 50
+VIEW_KINDS = ('impression', 'read')
+
+
+class SeenSet:
+    """Bounded set of recently seen keys with a per-entry TTL"""
+
+    def __init__(self, size=DEFAULT_DEDUPE_SIZE, ttl=DEFAULT_DEDUPE_TTL):
+        self.size = size
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    def add(self, key):
+        """Remember `key`; False if it was already seen within the TTL"""
+        now = time.monotonic()
+        with self._lock:
+            expires_at = self._entries.get(key)
+            if expires_at is not None and expires_at > now:
+                return False
+            self._entries[key] = now + self.ttl
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+            return True
+
+
+def _grouped(batch, field):
+    """{delta: [keys]} so keys sharing a delta are written by one UPDATE"""
+    groups = {}
+    for key, deltas in batch.items():
+        groups.setdefault(deltas.get(field, 0), []).append(key)
+    groups.pop(0, None)
+    return groups
+
+
+def apply_view_deltas(batch):
+    """Write {article_id: {'views': n}}"""
+    with transaction.atomic():
+        for delta, article_ids in _grouped(batch, 'views').items():
+            views = F('views') + delta
+            NewsArticle.objects.filter(id__in=article_ids).update(
+                views=views, engagement=engagement_after(views=views)
+            )
+
+
+def apply_read_deltas(batch):
+    """Write {user_id: {'reads': n}}"""
+    with transaction.atomic():
+        for delta, user_ids in _grouped(batch, 'reads').items():
+            UserProfile.objects.filter(user_id__in=user_ids).update(
+                total_articles_read=F('total_articles_read') + delta
+            )
+
+
+_flush_interval = getattr(settings, 'NEWSIFY_VIEW_FLUSH_INTERVAL', DEFAULT_VIEW_FLUSH_INTERVAL)
+view_buffer = DeltaBuffer('article-views', apply_view_deltas, interval=_flush_interval)
+read_buffer = DeltaBuffer('profile-reads', apply_read_deltas, interval=_flush_interval)
+seen_views = SeenSet(
+    size=getattr(settings, 'NEWSIFY_VIEW_DEDUPE_SIZE', DEFAULT_DEDUPE_SIZE),
+    ttl=getattr(settings, 'NEWSIFY_VIEW_DEDUPE_TTL', DEFAULT_DEDUPE_TTL),
+)
+
+
+def visitor_key(request):
+    """Session key, or a stable hash of address and user agent without a session"""
+    if request.session.session_key:
+        return request.session.session_key
+    raw = f"{request.META.get('REMOTE_ADDR', '')}|{request.META.get('HTTP_USER_AGENT', '')}"
+    return 'anon:' + hashlib.blake2b(raw.encode(), digest_size=12).hexdigest()
+
+
+def record_views(visitor, article_ids, kind='impression', user_id=None):
+    """
+    Count the first impression/read of each article by this visitor. A read
+    also counts as an impression.
+
+    Returns:
+        Number of article views counted (0 for repeats)
+    """
+    counted = 0
+    for article_id in article_ids:
+        if kind == 'read' and user_id and seen_views.add((visitor, article_id, 'read')):
+            read_buffer.add(user_id, reads=1)
+        if seen_views.add((visitor, article_id, 'impression')):
+            view_buffer.add(article_id, views=1)
+            counted += 1
+    return counted
@@ -0,0 +1,241 @@
+import random
+import threading
+import time
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.db import IntegrityError, connection, transaction
+from django.utils import timezone
+
+from .http_cache import get_quota_accountant
+from .models import IngestJob
+from .scraper import (
+    CATEGORY_MAPPING,
+    PROVIDERS,
+    build_ingest_pipeline,
+    new_ingest_stats,
+    publish_ingest,
+)
+
+# ==================== INGEST DAEMON ====================
+# Scraping used to run inside web requests (refresh endpoints) or from cron.
+# `manage.py run_ingest_daemon` now owns it:
+#
+#   - Refresh endpoints only insert an IngestJob row and return; the daemon
+#     claims queued jobs, runs them through the ingest pipeline and writes
+#     progress back to the row for the status endpoint.
+#   - Between jobs, every (provider, category) pair is fetched on its own
+#     schedule. A provider's interval is stretched so its remaining daily quota
+#     lasts until the UTC day rolls over, and every interval gets +/- jitter so
+#     the pairs drift apart instead of firing together.
+#
+# Web processes pick up new articles when their ranking window expires
+# (NEWSIFY_RANKING_TTL), or immediately through the shared feed cache versions
+# when NEWSIFY_FEED_CACHE is the file-based cache.
+
+DEFAULT_INTERVAL = 15 * 60  # seconds between fetches of one (provider, category)
+SCHEDULE_JITTER = 0.1  # +/- fraction of each interval
+JOB_POLL_INTERVAL = 2.0  # seconds between checks for queued jobs
+PROGRESS_INTERVAL = 2.0  # seconds between progress writes of a running job
+SCHEDULED_ARTICLES_PER_CATEGORY = 10
+
+ACTIVE_STATUSES = ('queued', 'running')
+
+
+# -------------------- JOBS --------------------
+
+def enqueue_refresh(kind, categories=None, articles_per_category=5):
+    """
+    Queue a refresh unless an identical one is already waiting or running.
+
+    The check is the database's: a conditional unique constraint allows one
+    active job per request_key, so concurrent requests can't both insert.
+
+    Returns:
+        (job, created)
+    """
+    categories = list(categories or [])
+    request_key = IngestJob.make_request_key(kind, categories, articles_per_category)
+    while True:
+        job = IngestJob.objects.filter(request_key=request_key, status__in=ACTIVE_STATUSES).first()
+        if job is not None:
+            return job, False
+        try:
+            with transaction.atomic():
+                job = IngestJob.objects.create(
+                    kind=kind,
+                    categories=categories,
+                    articles_per_category=articles_per_category,
+                    request_key=request_key,
+                )
+            return job, True
+        except IntegrityError:
+            # Another request inserted it first; loop to return that job (or
+            # retry if it already finished in between)
+            continue
+
+
+def job_status(job):
+    """Status endpoint payload for one job"""
+    data = {
+        'job_id': job.id,
+        'kind': job.kind,
+        'status': job.status,
+        'categories': job.categories,
+        'progress': job.progress,
+        'error': job.error or None,
+        'created_at': job.created_at.isoformat(),
+        'started_at': job.started_at.isoformat() if job.started_at else None,
+        'finished_at': job.finished_at.isoformat() if job.finished_at else None,
+    }
+    if job.status == 'queued':
+        data['queued_ahead'] = IngestJob.objects.filter(
+            status__in=ACTIVE_STATUSES, created_at__lt=job.created_at
+        ).count()
+    return data
+
+
+def claim_next_job():
+    """Mark the oldest queued job running and return it (None if the queue is empty)"""
+    while True:
+        job = IngestJob.objects.filter(status='queued').order_by('created_at', 'id').first()
+        if job is None:
+            return None
+        now = timezone.now()
+        # Conditional update: only one daemon can win a job
+        if IngestJob.objects.filter(id=job.id, status='queued').update(status='running', started_at=now):
+            job.status = 'running'
+            job.started_at = now
+            return job
+
+
+def requeue_interrupted_jobs():
+    """Jobs left 'running' by a daemon that died go back to the queue"""
+    return IngestJob.objects.filter(status='running').update(status='queued', started_at=None)
+
+
+def run_ingest(tasks, articles_per_category, on_progress=None):
+    """
+    Run (provider, api_category) tasks through the ingest pipeline.
+
+    Args:
+        on_progress: Optional callback(progress dict), called every
+            PROGRESS_INTERVAL seconds and once at the end
+
+    Returns:
+        Ingest stats (see new_ingest_stats) with the per-stage report under 'stages'
+    """
+    tasks = list(tasks)
+    stats = new_ingest_stats()
+    providers = sorted({name for name, _ in tasks}, key=list(PROVIDERS).index)
+    pipeline = build_ingest_pipeline(articles_per_category, providers, stats)
+    fetch_stats = pipeline.stages[0].stats
+
+    def progress():
+        return {
+            'tasks_total': len(tasks),
+            'tasks_done': fetch_stats.items_in,
+            'fetched': stats['total_fetched'],
+            'saved': stats['total_saved'],
+            'normalize_dropped': stats['normalize_dropped'],
+            'rows_rejected': stats['rows_rejected'],
+            'batches_failed': stats['batches_failed'],
+            'by_category': dict(stats['by_category']),
+        }
+
+    finished = threading.Event()
+
+    def report():
+        try:
+            while not finished.wait(PROGRESS_INTERVAL):
+                on_progress(progress())
+        finally:
+            connection.close()
+
+    reporter = None
+    if on_progress:
+        reporter = threading.Thread(target=report, name='ingest-progress', daemon=True)
+        reporter.start()
+    try:
+        stats['stages'] = pipeline.run(tasks)
+    finally:
+        finished.set()
+        if reporter:
+            reporter.join()
+
+    if stats['total_saved']:
+        publish_ingest()
+    if on_progress:
+        on_progress(progress())
+    return stats
+
+
+def run_job(job):
+    """Run a claimed job to completion, recording progress and the outcome"""
+    categories = job.categories or list(CATEGORY_MAPPING.keys())
+    tasks = [(name, category) for category in categories for name in PROVIDERS]
+
+    def save_progress(progress):
+        IngestJob.objects.filter(id=job.id).update(progress=progress)
+
+    try:
+        run_ingest(tasks, job.articles_per_category, on_progress=save_progress)
+        job.status = 'done'
+    except Exception as e:
+        job.status = 'failed'
+        job.error = f'{type(e).__name__}: {e}'
+    job.finished_at = timezone.now()
+    IngestJob.objects.filter(id=job.id).update(status=job.status, error=job.error, finished_at=job.finished_at)
+    return job
+
+
+# -------------------- SCHEDULE --------------------
+
+def seconds_until_quota_reset(now=None):
+    """Seconds until the next UTC midnight, when provider quotas reset"""
+    now = now or datetime.now(dt_timezone.utc)
+    tomorrow = (now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+    return (tomorrow - now).total_seconds()
+
+
+class IngestSchedule:
+    """Next due time for every (provider, api_category) pair"""
+
+    def __init__(self, categories=None, providers=None, base_interval=DEFAULT_INTERVAL, jitter=SCHEDULE_JITTER, rng=None):
+        self.categories = list(categories or CATEGORY_MAPPING.keys())
+        self.providers = list(providers or PROVIDERS.keys())
+        self.base_interval = base_interval
+        self.jitter = jitter
+        self.rng = rng or random.Random()
+        self.quota = get_quota_accountant()
+        start = time.monotonic()
+        # Spread the first round over one minute instead of firing everything at once
+        self._due = {
+            (name, category): start + self.rng.uniform(0, 60)
+            for category in self.categories
+            for name in self.providers
+        }
+
+    def interval(self, provider):
+        """Seconds until this provider's next fetch of a category"""
+        remaining = self.quota.remaining(provider)
+        if remaining is None:
+            return self.base_interval
+        reset_in = seconds_until_quota_reset()
+        if remaining <= 0:
+            return reset_in + 60
+        # Spread the calls left today evenly over what is left of the day
+        return max(self.base_interval, reset_in * len(self.categories) / remaining)
+
+    def due(self, now=None):
+        now = time.monotonic() if now is None else now
+        return [task for task, due_at in self._due.items() if due_at <= now]
+
+    def reschedule(self, tasks, now=None):
+        now = time.monotonic() if now is None else now
+        for task in tasks:
+            interval = self.interval(task[0])
+            self._due[task] = now + interval * self.rng.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def seconds_until_next(self, now=None):
+        now = time.monotonic() if now is None else now
+        return max(0.0, min(self._due.values()) - now) if self._due else float('inf')
@@ -0,0 +1,265 @@
+import heapq
+import itertools
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import timedelta
+from functools import partial
+from urllib.parse import urlparse
+
+from .http_client import RETRY_STATUSES, backoff_delay, get_http_client
+from .scraper import LINK_CHECK_RETRIES, probe_article_url, is_live_status
+
+# ==================== CONCURRENT LINK CHECKER ====================
+# Checking article URLs one at a time spends almost all of its time waiting on
+# the network. The checker below runs many HEAD requests at once, but stays
+# polite: a global worker cap, a per-host concurrency cap, and a minimum gap
+# between two requests to the same host.
+#
+# Those limits are enforced before a URL reaches the pool, not inside it: each
+# host has its own queue and a scheduler thread hands a host's next URL to a
+# worker only when the host has a free slot and its gap has passed. A worker
+# never waits on a host, so one site with thousands of articles can't tie up
+# the pool while other hosts are idle. Retries work the same way: a blip is
+# re-queued for later instead of sleeping in a worker.
+
+DEFAULT_MAX_WORKERS = 32
+DEFAULT_PER_HOST = 2
+DEFAULT_HOST_INTERVAL = 0.25  # seconds between request starts on one host
+DEFAULT_TIMEOUT = 5
+
+# ==================== RE-CHECK SCHEDULE ====================
+# A link that has answered fine for weeks rarely disappears overnight, so the
+# gap between checks grows with the article's age and its run of passed checks.
+# Failed links are retried quickly (to tell a blip from a real removal) and are
+# only deleted after DEFAULT_MAX_FAILURES failures in a row.
+
+BASE_CHECK_INTERVAL = timedelta(hours=12)
+MAX_CHECK_INTERVAL = timedelta(days=30)
+FAILURE_RETRY_INTERVAL = timedelta(hours=1)
+DEFAULT_MAX_FAILURES = 3
+
+
+def next_check_delay(published_date, successes, failures, now):
+    """How long to wait before checking an article's link again"""
+    if failures:
+        # 1h, 2h, 4h... so N failures span a few hours, not one bad minute
+        return min(FAILURE_RETRY_INTERVAL * (2 ** (failures - 1)), BASE_CHECK_INTERVAL)
+
+    age_days = max(0.0, (now - published_date).total_seconds() / 86400)
+    stability = 2 ** min(max(successes - 1, 0), 6)
+    return min(BASE_CHECK_INTERVAL * (1 + age_days / 7) * stability, MAX_CHECK_INTERVAL)
+
+
+def record_check(article, status, is_live, now):
+    """Update an article's link-check fields in place after a probe"""
+    article.link_checked_at = now
+    article.link_status = status if status is not None else 0
+    if is_live:
+        article.link_failures = 0
+        article.link_successes += 1
+    else:
+        article.link_failures += 1
+        article.link_successes = 0
+    article.link_next_check = now + next_check_delay(
+        article.published_date, article.link_successes, article.link_failures, now
+    )
+
+
+LINK_STATE_FIELDS = ['link_checked_at', 'link_status', 'link_failures', 'link_successes', 'link_next_check']
+
+
+def get_host(url):
+    """Lowercased host of a URL ('' if it can't be parsed)"""
+    try:
+        return (urlparse(url).hostname or '').lower()
+    except ValueError:
+        return ''
+
+
+class HostScheduler:
+    """
+    Per-host queues in front of a thread pool.
+
+    submit(host, func) queues func; the scheduler thread runs it on the pool
+    once fewer than `per_host` calls for that host are running, at least
+    `interval` seconds after the host's previous start, and while fewer than
+    `max_workers` calls are running overall.
+    """
+
+    def __init__(self, max_workers=DEFAULT_MAX_WORKERS, per_host=DEFAULT_PER_HOST, interval=DEFAULT_HOST_INTERVAL):
+        self.max_workers = max_workers
+        self.per_host = per_host
+        self.interval = interval
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='link-check')
+        self._cond = threading.Condition()
+        self._queues = {}  # host -> deque of callables, in host order of arrival
+        self._delayed = []  # heap of (ready_at, seq, host, func) for retries
+        self._seq = itertools.count()
+        self._running = defaultdict(int)
+        self._total_running = 0
+        self._next_start = {}
+        self._closed = False
+        self._thread = threading.Thread(target=self._dispatch, name='link-check-scheduler', daemon=True)
+        self._thread.start()
+
+    def submit(self, host, func, delay=0.0):
+        """Queue func() for `host`, to start no sooner than `delay` seconds from now"""
+        with self._cond:
+            if delay > 0:
+                heapq.heappush(self._delayed, (time.monotonic() + delay, next(self._seq), host, func))
+            else:
+                self._queues.setdefault(host, deque()).append(func)
+            self._cond.notify()
+
+    def close(self):
+        """Wait for everything queued (including retries) to finish"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+        self._executor.shutdown(wait=True)
+
+    def _run(self, host, func):
+        try:
+            func()
+        finally:
+            with self._cond:
+                self._running[host] -= 1
+                self._total_running -= 1
+                self._cond.notify()
+
+    def _dispatch(self):
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                while self._delayed and self._delayed[0][0] <= now:
+                    _, _, host, func = heapq.heappop(self._delayed)
+                    self._queues.setdefault(host, deque()).append(func)
+
+                wake_at = self._delayed[0][0] if self._delayed else None
+                started = False
+                # At most one start per host per pass keeps hosts interleaved
+                for host in list(self._queues):
+                    if self._total_running >= self.max_workers:
+                        break
+                    if self._running[host] >= self.per_host:
+                        continue
+                    next_start = self._next_start.get(host, now)
+                    if next_start > now:
+                        wake_at = next_start if wake_at is None else min(wake_at, next_start)
+                        continue
+                    queue = self._queues[host]
+                    func = queue.popleft()
+                    if not queue:
+                        del self._queues[host]
+                    self._running[host] += 1
+                    self._total_running += 1
+                    self._next_start[host] = now + self.interval
+                    self._executor.submit(self._run, host, func)
+                    started = True
+
+                if started:
+                    continue
+                if self._closed and not self._queues and not self._delayed and not self._total_running:
+                    return
+                # Woken early by submit() or a finished call
+                self._cond.wait(None if wake_at is None else max(0.0, wake_at - now))
+
+
+class LinkCheckStats:
+    """Throughput and per-domain failure counters for one run"""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.checked = 0
+        self.failed = 0
+        self.failures_by_domain = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def record(self, host, is_live):
+        with self._lock:
+            self.checked += 1
+            if not is_live:
+                self.failed += 1
+                self.failures_by_domain[host or 'unknown'] += 1
+
+    @property
+    def elapsed(self):
+        return time.monotonic() - self.started
+
+    @property
+    def urls_per_second(self):
+        elapsed = self.elapsed
+        return self.checked / elapsed if elapsed > 0 else 0.0
+
+
+class LinkChecker:
+    """
+    Check many article URLs concurrently over the shared client's pooled
+    keep-alive connections.
+
+    Usage:
+        with LinkChecker(max_workers=32) as checker:
+            for key, status, is_live in checker.check_many(items):
+                ...
+    """
+
+    def __init__(self, max_workers=DEFAULT_MAX_WORKERS, per_host=DEFAULT_PER_HOST,
+                 host_interval=DEFAULT_HOST_INTERVAL, timeout=DEFAULT_TIMEOUT, retries=LINK_CHECK_RETRIES):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.retries = retries
+        self.scheduler = HostScheduler(max_workers=max_workers, per_host=per_host, interval=host_interval)
+        self.stats = LinkCheckStats()
+
+        # Shared client: keep-alive pools per host and metrics
+        self.client = get_http_client()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.scheduler.close()
+
+    def submit(self, url):
+        """Queue one URL. Returns a Future for (status_code, is_live)"""
+        host = get_host(url)
+        future = Future()
+        self.scheduler.submit(host, partial(self._attempt, url, host, future, 0))
+        return future
+
+    def _attempt(self, url, host, future, attempt):
+        try:
+            # No client-side retries: they would sleep while holding the host's slot
+            status = probe_article_url(url, client=self.client, timeout=self.timeout, retries=0)
+        except Exception as e:
+            future.set_exception(e)
+            return
+        if (status is None or status in RETRY_STATUSES) and attempt < self.retries:
+            self.scheduler.submit(
+                host, partial(self._attempt, url, host, future, attempt + 1), delay=backoff_delay(attempt)
+            )
+            return
+        is_live = is_live_status(status)
+        self.stats.record(host, is_live)
+        future.set_result((status, is_live))
+
+    def check(self, url):
+        """Probe one URL through the host scheduler. Returns (status_code, is_live)"""
+        return self.submit(url).result()
+
+    def check_many(self, items):
+        """
+        Check a batch of (key, url) pairs concurrently.
+
+        Yields (key, status_code, is_live) in submission order.
+        """
+        futures = [(key, self.submit(url)) for key, url in items]
+        for key, future in futures:
+            status, is_live = future.result()
+            yield key, status, is_live
@@ -0,0 +1,120 @@
+import random
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import override_settings
+
+# ==================== VOTE LOAD TEST HARNESS ====================
+# Shared by `manage.py loadtest_votes` and `manage.py loadtest_poll_votes`.
+# Each run creates a throwaway target (article or poll), casts a shuffled plan
+# of (session, choice) votes from a thread pool, flushes the write-behind
+# buffer and lets the subcommand compare its counters with the stored vote
+# rows. The target is deleted afterwards.
+
+
+class VoteLoadTestCommand(BaseCommand):
+    """
+    Base for the vote load test commands. Subclasses set the class attributes
+    below and implement setup(), cast(), check() and teardown().
+    """
+
+    noun = 'votes'
+    default_sessions = 500
+    default_actions = 3
+    actions_help = 'Votes per session'
+    write_behind_setting = None  # e.g. 'NEWSIFY_VOTE_WRITE_BEHIND'
+    buffer = None  # the DeltaBuffer holding the counters
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--threads',
+            type=int,
+            help='Concurrent voters',
+            default=16
+        )
+        parser.add_argument(
+            '--sessions',
+            type=int,
+            help='Distinct voting sessions',
+            default=self.default_sessions
+        )
+        parser.add_argument(
+            '--actions',
+            type=int,
+            help=self.actions_help,
+            default=self.default_actions
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=7
+        )
+
+    def write_behind(self, options):
+        """Whether counters are buffered for this run"""
+        raise NotImplementedError
+
+    def setup(self, run_id, options):
+        """Create the target; returns the choices a vote picks from"""
+        raise NotImplementedError
+
+    def cast(self, session_id, choice):
+        raise NotImplementedError
+
+    def check(self, sessions, options):
+        """Compare counters with vote rows and print the verdict"""
+        raise NotImplementedError
+
+    def teardown(self):
+        raise NotImplementedError
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        run_id = uuid.uuid4().hex[:8]
+        choices = self.setup(run_id, options)
+
+        sessions = [f'loadtest-{run_id}-{i}' for i in range(options['sessions'])]
+        plan = [
+            (session_id, rng.choice(choices))
+            for session_id in sessions
+            for _ in range(options['actions'])
+        ]
+        rng.shuffle(plan)
+        errors = []
+
+        def vote(item):
+            try:
+                self.cast(*item)
+            except Exception as e:
+                # A failed request rolls back as a whole; it must not leave
+                # the counters out of step with the vote rows.
+                errors.append(type(e).__name__)
+            finally:
+                # Each worker thread has its own connection; don't leak them
+                connection.close()
+
+        write_behind = self.write_behind(options)
+        with override_settings(**{self.write_behind_setting: write_behind}):
+            self.stdout.write(self.style.WARNING(
+                f"Casting {len(plan)} {self.noun} from {len(sessions)} sessions on {options['threads']} threads "
+                f"({'write-behind' if write_behind else 'direct'} counters)..."
+            ))
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=options['threads']) as executor:
+                list(executor.map(vote, plan))
+            elapsed = time.perf_counter() - started
+            flush_started = time.perf_counter()
+            self.buffer.flush()
+            flush_elapsed = time.perf_counter() - flush_started
+
+        try:
+            self.stdout.write(f"Throughput: {len(plan) / elapsed:.1f} {self.noun}/sec over {elapsed:.2f}s")
+            self.stdout.write(f"Final flush: {flush_elapsed * 1000:.1f}ms "
+                              f"({self.buffer.flushed_batches} batches flushed so far)")
+            self.stdout.write(f"Failed requests: {len(errors)} {sorted(set(errors)) if errors else ''}")
+            self.check(sessions, options)
+        finally:
+            self.teardown()
@@ -0,0 +1,117 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from django.core.management.base import BaseCommand
+
+# (sync path, async path) per endpoint; all read-only so the benchmark can run
+# against a live database
+ENDPOINTS = {
+    'news': ('/api/news/', '/api/async/news/'),
+    'archived': ('/api/archived/', '/api/async/archived/'),
+    'polls': ('/api/polls/', '/api/async/polls/'),
+    'stats': ('/api/stats/', '/api/async/stats/'),
+}
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class Command(BaseCommand):
+    help = 'Compare requests/sec and tail latency of the sync and async API views on a running server'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--base-url',
+            type=str,
+            help='Server to benchmark (run it through asgi.py, e.g. uvicorn newsify_backend.asgi:application)',
+            default='http://127.0.0.1:8000'
+        )
+        parser.add_argument(
+            '--endpoints',
+            nargs='+',
+            choices=sorted(ENDPOINTS),
+            help='Endpoints to compare (default: all)',
+            default=sorted(ENDPOINTS)
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            help='Requests in flight at once',
+            default=100
+        )
+        parser.add_argument(
+            '--requests',
+            type=int,
+            help='Requests per endpoint and variant',
+            default=2000
+        )
+        parser.add_argument(
+            '--warmup',
+            type=int,
+            help='Untimed requests per endpoint and variant',
+            default=20
+        )
+        parser.add_argument(
+            '--timeout',
+            type=float,
+            default=30.0
+        )
+
+    def run(self, url, total, concurrency, timeout):
+        """Returns (elapsed seconds, sorted latencies of successful requests, error count)"""
+        local = threading.local()
+        latencies = []
+        errors = []
+        lock = threading.Lock()
+
+        def one(_):
+            session = getattr(local, 'session', None)
+            if session is None:
+                session = local.session = requests.Session()
+            started = time.perf_counter()
+            try:
+                ok = session.get(url, timeout=timeout).status_code == 200
+            except requests.exceptions.RequestException:
+                ok = False
+            latency = time.perf_counter() - started
+            with lock:
+                (latencies if ok else errors).append(latency)
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            list(executor.map(one, range(total)))
+        return time.perf_counter() - started, sorted(latencies), len(errors)
+
+    def handle(self, *args, **options):
+        base_url = options['base_url'].rstrip('/')
+        concurrency = options['concurrency']
+        self.stdout.write(self.style.WARNING(
+            f"{options['requests']} requests per variant, {concurrency} concurrent, against {base_url}"
+        ))
+        self.stdout.write(
+            f"\n{'endpoint':<10} {'variant':<7} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8} {'errors':>7}"
+        )
+
+        for name in options['endpoints']:
+            for variant, path in zip(('sync', 'async'), ENDPOINTS[name]):
+                url = base_url + path
+                if options['warmup']:
+                    self.run(url, options['warmup'], min(concurrency, options['warmup']), options['timeout'])
+                elapsed, latencies, errors = self.run(url, options['requests'], concurrency, options['timeout'])
+                self.stdout.write(
+                    f"{name:<10} {variant:<7} {len(latencies) / elapsed:>8.1f} "
+                    f"{1000 * percentile(latencies, 0.50):>8.1f} {1000 * percentile(latencies, 0.95):>8.1f} "
+                    f"{1000 * percentile(latencies, 0.99):>8.1f} {1000 * (latencies[-1] if latencies else 0):>8.1f} "
+                    f"{errors:>7}"
+                )
+
+        self.stdout.write(
+            '\nThe load generator is a thread pool too; at very high --concurrency run it from another '
+            'machine so the client is not the bottleneck.'
+        )
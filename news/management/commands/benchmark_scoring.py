@@ -0,0 +1,99 @@
+import random
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from news import scoring
+from news.scoring import CandidateColumns, CATEGORIES, top_k, score_batch, to_microseconds, category_code
+from news.views import calculate_personalized_score
+
+
+class _Article:
+    """Just the attributes calculate_personalized_score reads"""
+    __slots__ = ('id', 'category', 'published_date', 'upvotes', 'views', 'credibility_score')
+
+    def __init__(self, id, category, published_date, upvotes, views, credibility_score):
+        self.id = id
+        self.category = category
+        self.published_date = published_date
+        self.upvotes = upvotes
+        self.views = views
+        self.credibility_score = credibility_score
+
+
+class Command(BaseCommand):
+    help = 'Compare the per-article scoring loop against the batch scorer (news/scoring.py)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sizes',
+            nargs='+',
+            type=int,
+            help='Candidate counts to benchmark',
+            default=[100, 10000, 1000000]
+        )
+        parser.add_argument(
+            '--k',
+            type=int,
+            help='How many top results to select',
+            default=50
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=42
+        )
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        k = options['k']
+        now = timezone.now()
+        prefs = {'technology': 8.0, 'sports': 3, 'science': 6.5}
+
+        backend = 'NumPy' if scoring.np is not None else 'pure Python (NumPy not installed)'
+        self.stdout.write(self.style.WARNING(f'Batch scorer backend: {backend}\n'))
+
+        for size in options['sizes']:
+            articles = [
+                _Article(
+                    id=i,
+                    category=rng.choice(CATEGORIES),
+                    published_date=now - timedelta(seconds=rng.randint(0, 30 * 86400), microseconds=rng.randint(0, 999999)),
+                    upvotes=rng.randint(0, 500),
+                    views=rng.randint(0, 50000),
+                    credibility_score=rng.randint(1, 10),
+                )
+                for i in range(size)
+            ]
+
+            # Current path: score every article, then sort the whole list
+            started = time.perf_counter()
+            loop_scores = [(a.id, calculate_personalized_score(a, prefs, now)) for a in articles]
+            loop_top = sorted(loop_scores, key=lambda x: x[1], reverse=True)[:k]
+            loop_time = time.perf_counter() - started
+
+            columns = CandidateColumns(
+                ids=[a.id for a in articles],
+                published_us=[to_microseconds(a.published_date) for a in articles],
+                upvotes=[a.upvotes for a in articles],
+                views=[a.views for a in articles],
+                credibility=[a.credibility_score for a in articles],
+                category_codes=[category_code(a.category) for a in articles],
+            )
+
+            started = time.perf_counter()
+            batch_top = top_k(columns, prefs, now, k=k)
+            batch_time = time.perf_counter() - started
+
+            batch_scores = list(score_batch(columns, prefs, now))
+            exact = all(float(b) == s for b, (_, s) in zip(batch_scores, loop_scores))
+            same_top = [s for _, s in loop_top] == [s for _, s in batch_top]
+
+            speedup = loop_time / batch_time if batch_time else float('inf')
+            self.stdout.write(f'{size:>9,} candidates')
+            self.stdout.write(f'    loop + sort:  {loop_time * 1000:10.2f} ms')
+            self.stdout.write(f'    batch top-k:  {batch_time * 1000:10.2f} ms  ({speedup:.1f}x)')
+            style = self.style.SUCCESS if exact and same_top else self.style.ERROR
+            self.stdout.write(style(f'    scores identical: {exact}, top-{k} identical: {same_top}\n'))
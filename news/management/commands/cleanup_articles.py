@@ -1,29 +1,144 @@
 from django.core.management.base import BaseCommand
+from django.db.models import Q
+from django.utils import timezone
 from news.models import NewsArticle
-from news.scraper import check_article_status
+from news.feed_cache import bump_version
+from news.ranking import feed_ranker
+from news.http_client import get_http_client, format_metrics
+from news.linkcheck import (
+    LinkChecker,
+    record_check,
+    LINK_STATE_FIELDS,
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_PER_HOST,
+    DEFAULT_HOST_INTERVAL,
+    DEFAULT_MAX_FAILURES,
+)
 
 class Command(BaseCommand):
-    help = 'Checks existence of all existing news articles and deletes stale/removed ones.'
+    help = 'Re-checks article links that are due and deletes articles whose link keeps failing.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers',
+            type=int,
+            help='Maximum number of URL checks in flight at once',
+            default=DEFAULT_MAX_WORKERS
+        )
+        parser.add_argument(
+            '--per-host',
+            type=int,
+            help='Maximum concurrent checks against a single host',
+            default=DEFAULT_PER_HOST
+        )
+        parser.add_argument(
+            '--host-interval',
+            type=float,
+            help='Minimum seconds between two requests to the same host',
+            default=DEFAULT_HOST_INTERVAL
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            help='Number of articles read from the database per chunk',
+            default=500
+        )
+        parser.add_argument(
+            '--max-failures',
+            type=int,
+            help='Delete an article after this many consecutive failed checks',
+            default=DEFAULT_MAX_FAILURES
+        )
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Check every article, not only the ones that are due'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report dead links without deleting anything'
+        )
 
     def handle(self, *args, **options):
         self.stdout.write(self.style.WARNING("Starting stale article cleanup... This may take a moment."))
-        
-        articles_to_check = NewsArticle.objects.all()
-        total_checked = articles_to_check.count()
+
+        chunk_size = options['chunk_size']
+        max_failures = options['max_failures']
+        dry_run = options['dry_run']
         deleted_count = 0
-        
-        for article in articles_to_check:
-            # Check the URL status using the helper function from scraper.py
-            is_live = check_article_status(article.source_url)
-            
-            if not is_live:
-                article_title = article.title
-                article.delete()
-                deleted_count += 1
-                # Truncate title for clean console output
-                self.stdout.write(self.style.SUCCESS(f"🗑️ Deleted: {article_title[:60]}... (URL check failed)"))
-        
+        last_id = 0
+
+        run_started = timezone.now()
+        articles_qs = NewsArticle.objects.only('id', 'title', 'source_url', 'published_date', *LINK_STATE_FIELDS)
+        if not options['all']:
+            # Only articles that were never checked or whose next check is due
+            articles_qs = articles_qs.filter(
+                Q(link_next_check__isnull=True) | Q(link_next_check__lte=run_started)
+            )
+
+        with LinkChecker(
+            max_workers=options['workers'],
+            per_host=options['per_host'],
+            host_interval=options['host_interval'],
+        ) as checker:
+            while True:
+                # Keyset over the primary key so we never hold the whole table in memory
+                chunk = list(articles_qs.filter(id__gt=last_id).order_by('id')[:chunk_size])
+                if not chunk:
+                    break
+                last_id = chunk[-1].id
+
+                by_id = {article.id: article for article in chunk}
+                dead_ids = []
+                now = timezone.now()
+                for article_id, status, is_live in checker.check_many((a.id, a.source_url) for a in chunk):
+                    article = by_id[article_id]
+                    record_check(article, status, is_live, now)
+
+                    if article.link_failures >= max_failures:
+                        dead_ids.append(article_id)
+                        # Truncate title for clean console output
+                        label = "🔍 Dead link" if dry_run else "🗑️ Deleted"
+                        self.stdout.write(self.style.SUCCESS(
+                            f"{label}: {article.title[:60]}... "
+                            f"({article.link_failures} failed checks, status={status})"
+                        ))
+
+                # A dry run must not move the schedule or the failure counts
+                if not dry_run:
+                    NewsArticle.objects.bulk_update(chunk, LINK_STATE_FIELDS)
+
+                # One DELETE per chunk instead of one per article
+                if dead_ids and not dry_run:
+                    NewsArticle.objects.filter(id__in=dead_ids).delete()
+                    # Deleted articles must drop out of the ranked window and the cached feed
+                    feed_ranker.invalidate()
+                    bump_version('ingest')
+                deleted_count += len(dead_ids)
+
+                self.stdout.write(
+                    f"  ...checked {checker.stats.checked} URLs ({checker.stats.urls_per_second:.1f} URLs/sec)"
+                )
+
+            stats = checker.stats
+
         self.stdout.write(self.style.WARNING(f"\n--- Cleanup Complete ---"))
-        self.stdout.write(self.style.SUCCESS(f"Total articles checked: {total_checked}"))
-        self.stdout.write(self.style.SUCCESS(f"Total articles deleted: {deleted_count}"))
-        self.stdout.write(self.style.WARNING("To automate, schedule this command (e.g., via cron) to run daily."))
\ No newline at end of file
+        self.stdout.write(self.style.SUCCESS(f"Total articles checked: {stats.checked}"))
+        self.stdout.write(self.style.SUCCESS(f"Failed checks this run: {stats.failed}"))
+        self.stdout.write(self.style.SUCCESS(
+            f"Total articles deleted: {deleted_count}" + (" (dry run, nothing removed)" if dry_run else "")
+        ))
+        self.stdout.write(self.style.SUCCESS(
+            f"Throughput: {stats.urls_per_second:.1f} URLs/sec over {stats.elapsed:.1f}s"
+        ))
+
+        if stats.failures_by_domain:
+            self.stdout.write('\nFailures by domain:')
+            for domain, count in sorted(stats.failures_by_domain.items(), key=lambda x: x[1], reverse=True):
+                self.stdout.write(f"  {domain}: {count}")
+
+        self.stdout.write('\nHTTP by host:')
+        self.stdout.write(format_metrics(get_http_client().metrics()))
+
+        self.stdout.write(self.style.WARNING("To automate, schedule this command (e.g., via cron) to run daily."))
@@ -1,5 +1,5 @@
 from django.core.management.base import BaseCommand
-from news.scraper import fetch_and_save_news
+from news.scraper import fetch_and_save_news, duplicates_skipped, format_ingest_losses, INGEST_STAGE_WORKERS
 
 class Command(BaseCommand):
     help = 'Fetch latest news from NewsAPI and save to database'
@@ -18,6 +18,18 @@ class Command(BaseCommand):
             help='Number of articles per category',
             default=5
         )
+        parser.add_argument(
+            '--normalize-workers',
+            type=int,
+            help='Worker threads for the normalize stage',
+            default=INGEST_STAGE_WORKERS['normalize']
+        )
+        parser.add_argument(
+            '--write-workers',
+            type=int,
+            help='Worker threads for the database write stage',
+            default=INGEST_STAGE_WORKERS['write']
+        )
 
     def handle(self, *args, **options):
         categories = options['categories']
@@ -25,13 +37,22 @@ class Command(BaseCommand):
         
         self.stdout.write(self.style.WARNING('Fetching news from NewsAPI...'))
         
-        stats = fetch_and_save_news(categories=categories, articles_per_category=count)
+        stats = fetch_and_save_news(
+            categories=categories,
+            articles_per_category=count,
+            stage_workers={
+                'normalize': options['normalize_workers'],
+                'write': options['write_workers'],
+            },
+        )
         
         self.stdout.write(self.style.SUCCESS('\n--- Fetch Complete ---'))
         self.stdout.write(f"Total fetched: {stats['total_fetched']}")
         self.stdout.write(f"Total saved: {stats['total_saved']}")
-        self.stdout.write(f"Duplicates skipped: {stats['total_fetched'] - stats['total_saved']}")
+        self.stdout.write(f"Duplicates skipped: {duplicates_skipped(stats)}")
+        for line in format_ingest_losses(stats):
+            self.stdout.write(self.style.ERROR(line))
         
         self.stdout.write('\nBy category:')
         for category, count in stats['by_category'].items():
-            self.stdout.write(f"  {category}: {count} articles")
\ No newline at end of file
+            self.stdout.write(f"  {category}: {count} articles")
@@ -0,0 +1,58 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Q
+from news.dedup import index_articles
+from news.models import NewsArticle, ArticleSignature, ArticleBand
+from news.ranking import feed_ranker
+from news.feed_cache import bump_version
+
+
+class Command(BaseCommand):
+    help = 'Builds the near-duplicate (MinHash LSH) index for articles that do not have a signature yet.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            help='Articles signed per batch',
+            default=500
+        )
+        parser.add_argument(
+            '--rebuild',
+            action='store_true',
+            help='Drop every signature and duplicate link first and re-cluster all articles'
+        )
+
+    def handle(self, *args, **options):
+        if options['rebuild']:
+            with transaction.atomic():
+                ArticleBand.objects.all().delete()
+                ArticleSignature.objects.all().delete()
+                NewsArticle.objects.filter(duplicate_of__isnull=False).update(duplicate_of=None)
+            self.stdout.write(self.style.WARNING('Dropped the existing index'))
+
+        # Oldest first, so each story's earliest copy becomes its representative
+        pending = NewsArticle.objects.filter(signature__isnull=True).order_by('published_date', 'id')
+        total = pending.count()
+        self.stdout.write(self.style.WARNING(f'Indexing {total} articles...'))
+
+        indexed = 0
+        duplicates = 0
+        last = None
+        while True:
+            chunk = pending
+            if last:
+                chunk = chunk.filter(
+                    Q(published_date__gt=last[0]) | Q(published_date=last[0], id__gt=last[1])
+                )
+            chunk = list(chunk.only('id', 'title', 'description', 'published_date', 'duplicate_of')[:options['chunk_size']])
+            if not chunk:
+                break
+            last = (chunk[-1].published_date, chunk[-1].id)
+            duplicates += index_articles(chunk)
+            indexed += len(chunk)
+            self.stdout.write(f'  {indexed}/{total} articles, {duplicates} duplicates so far')
+
+        feed_ranker.invalidate()
+        bump_version('ingest')
+        self.stdout.write(self.style.SUCCESS(f'✓ Indexed {indexed} articles; {duplicates} marked as duplicates'))
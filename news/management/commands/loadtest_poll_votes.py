@@ -0,0 +1,67 @@
+from news.loadtest import VoteLoadTestCommand
+from news.models import Poll, PollOption, PollVote
+from news.polls import cast_poll_vote, poll_vote_buffer
+
+
+class Command(VoteLoadTestCommand):
+    help = 'Measure poll vote throughput and check that votes are counted once per session'
+
+    noun = 'poll votes'
+    default_sessions = 1000
+    default_actions = 2
+    actions_help = 'Votes per session (repeats must be ignored)'
+    write_behind_setting = 'NEWSIFY_POLL_WRITE_BEHIND'
+    buffer = poll_vote_buffer
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument(
+            '--options',
+            type=int,
+            help='Options on the test poll',
+            default=4
+        )
+        parser.add_argument(
+            '--direct',
+            action='store_true',
+            help='Update the option counter in every request instead of buffering'
+        )
+
+    def write_behind(self, options):
+        return not options['direct']
+
+    def setup(self, run_id, options):
+        self.poll = Poll.objects.create(question=f'Poll load test {run_id}', is_active=False)
+        self.option_ids = [
+            PollOption.objects.create(poll=self.poll, text=f'Option {i + 1}').id
+            for i in range(options['options'])
+        ]
+        self.repeats = []
+        return self.option_ids
+
+    def cast(self, session_id, option_id):
+        _, _, created = cast_poll_vote(option_id, session_id)
+        if not created:
+            self.repeats.append(session_id)
+
+    def check(self, sessions, options):
+        counters = dict(PollOption.objects.filter(poll=self.poll).values_list('id', 'votes'))
+        recorded = {option_id: 0 for option_id in self.option_ids}
+        for option_id in PollVote.objects.filter(poll=self.poll).values_list('option_id', flat=True):
+            recorded[option_id] += 1
+
+        self.stdout.write(f"Repeated votes ignored: {len(self.repeats)}")
+        for option_id in self.option_ids:
+            self.stdout.write(f"Option {option_id}: counter={counters[option_id]}  vote rows={recorded[option_id]}")
+
+        if counters != recorded:
+            self.stdout.write(self.style.ERROR('✗ Counters do not match the recorded votes'))
+        elif sum(recorded.values()) != len(sessions):
+            self.stdout.write(self.style.ERROR(
+                f"✗ {sum(recorded.values())} votes recorded for {len(sessions)} sessions"
+            ))
+        else:
+            self.stdout.write(self.style.SUCCESS('✓ One vote counted per session'))
+
+    def teardown(self):
+        self.poll.delete()
@@ -0,0 +1,55 @@
+from news.loadtest import VoteLoadTestCommand
+from news.models import NewsArticle, Vote
+from news.votes import cast_vote, vote_buffer
+
+
+class Command(VoteLoadTestCommand):
+    help = 'Hammer one article with concurrent votes and check that no vote is lost'
+
+    noun = 'votes'
+    default_sessions = 500
+    default_actions = 3
+    actions_help = 'Votes per session (repeats toggle or switch the vote)'
+    write_behind_setting = 'NEWSIFY_VOTE_WRITE_BEHIND'
+    buffer = vote_buffer
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument(
+            '--write-behind',
+            action='store_true',
+            help='Buffer counter updates instead of writing them per vote'
+        )
+
+    def write_behind(self, options):
+        return options['write_behind']
+
+    def setup(self, run_id, options):
+        self.article = NewsArticle.objects.create(
+            title=f'Vote load test {run_id}',
+            description='Temporary article created by loadtest_votes',
+            category='technology',
+            source='loadtest',
+            source_url=f'https://loadtest.invalid/{run_id}',
+        )
+        return ['up', 'down']
+
+    def cast(self, session_id, vote_type):
+        cast_vote(self.article.id, session_id, vote_type)
+
+    def check(self, sessions, options):
+        article = self.article
+        article.refresh_from_db()
+        expected_up = Vote.objects.filter(article=article, vote_type='up').count()
+        expected_down = Vote.objects.filter(article=article, vote_type='down').count()
+
+        self.stdout.write(f"Upvotes:   counter={article.upvotes}  vote rows={expected_up}")
+        self.stdout.write(f"Downvotes: counter={article.downvotes}  vote rows={expected_down}")
+
+        if article.upvotes == expected_up and article.downvotes == expected_down:
+            self.stdout.write(self.style.SUCCESS('✓ No lost votes'))
+        else:
+            self.stdout.write(self.style.ERROR('✗ Counters do not match the recorded votes'))
+
+    def teardown(self):
+        self.article.delete()
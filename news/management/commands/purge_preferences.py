@@ -0,0 +1,62 @@
+from datetime import timedelta
+
+from django.contrib.sessions.models import Session
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+from django.utils import timezone
+
+from news.models import UserPreference
+
+
+class Command(BaseCommand):
+    help = 'Deletes anonymous UserPreference rows that are empty or whose session has expired.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            help='Only purge rows not updated for this many days',
+            default=30
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            help='Rows deleted per query',
+            default=1000
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Count the rows that would be purged without deleting them'
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options['days'])
+        live_sessions = Session.objects.filter(expire_date__gt=timezone.now()).values('session_key')
+
+        # Empty rows were created by feed reads before preferences became lazy;
+        # the rest belong to sessions that can no longer come back.
+        stale = UserPreference.objects.filter(updated_at__lt=cutoff).filter(
+            Q(preferred_categories={}) | ~Q(session_id__in=live_sessions)
+        )
+
+        total = stale.count()
+        self.stdout.write(self.style.WARNING(
+            f"{total} preference rows not updated since {cutoff:%Y-%m-%d} are empty or have no live session"
+        ))
+        if options['dry_run'] or not total:
+            return
+
+        deleted = 0
+        last_id = 0
+        while True:
+            ids = list(
+                stale.filter(id__gt=last_id).order_by('id').values_list('id', flat=True)[:options['chunk_size']]
+            )
+            if not ids:
+                break
+            last_id = ids[-1]
+            # Goes through the ORM (not a raw DELETE) so the stats counters follow
+            deleted += UserPreference.objects.filter(id__in=ids).delete()[0]
+
+        self.stdout.write(self.style.SUCCESS(f"✓ Purged {deleted} preference rows"))
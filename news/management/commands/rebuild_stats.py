@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+from news.stats import rebuild_counters
+
+class Command(BaseCommand):
+    help = 'Recompute the materialized site stats counters from the source tables'
+
+    def handle(self, *args, **options):
+        self.stdout.write(self.style.WARNING('Rebuilding stats counters...'))
+        
+        values = rebuild_counters()
+        
+        self.stdout.write(self.style.SUCCESS('\n--- Rebuild Complete ---'))
+        for name, value in sorted(values.items()):
+            self.stdout.write(f"  {name}: {value}")
@@ -0,0 +1,108 @@
+import signal
+import threading
+
+from django.core.management.base import BaseCommand
+from django.db import DatabaseError, close_old_connections
+from django.utils import timezone
+
+from news.ingest import (
+    DEFAULT_INTERVAL,
+    JOB_POLL_INTERVAL,
+    SCHEDULED_ARTICLES_PER_CATEGORY,
+    IngestSchedule,
+    claim_next_job,
+    requeue_interrupted_jobs,
+    run_ingest,
+    run_job,
+)
+
+
+class Command(BaseCommand):
+    help = 'Runs queued refresh jobs and fetches every provider/category on a quota-paced schedule until stopped.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--categories',
+            nargs='+',
+            type=str,
+            help='API categories to keep fresh (default: all)',
+            default=None
+        )
+        parser.add_argument(
+            '--interval',
+            type=int,
+            help='Minimum seconds between fetches of one provider/category',
+            default=DEFAULT_INTERVAL
+        )
+        parser.add_argument(
+            '--count',
+            type=int,
+            help='Articles per category for scheduled fetches',
+            default=SCHEDULED_ARTICLES_PER_CATEGORY
+        )
+        parser.add_argument(
+            '--no-schedule',
+            action='store_true',
+            help='Only run queued refresh jobs'
+        )
+
+    def handle(self, *args, **options):
+        stopping = threading.Event()
+
+        def request_stop(signum, frame):
+            if stopping.is_set():
+                return
+            # The batch in flight finishes first; nothing is cut off mid-write
+            self.stdout.write(self.style.WARNING('\nStopping after the current batch...'))
+            stopping.set()
+
+        signal.signal(signal.SIGINT, request_stop)
+        signal.signal(signal.SIGTERM, request_stop)
+
+        requeued = requeue_interrupted_jobs()
+        if requeued:
+            self.stdout.write(self.style.WARNING(f'Requeued {requeued} interrupted jobs'))
+
+        schedule = None
+        if not options['no_schedule']:
+            schedule = IngestSchedule(categories=options['categories'], base_interval=options['interval'])
+        self.stdout.write(self.style.SUCCESS(
+            f"Ingest daemon started ({'jobs only' if schedule is None else f'{len(schedule.categories)} categories'})"
+        ))
+
+        while not stopping.is_set():
+            # The daemon has no request cycle: drop connections that are past
+            # CONN_MAX_AGE or were left unusable by an error
+            close_old_connections()
+            try:
+                job = claim_next_job()
+            except DatabaseError as e:
+                self.stderr.write(self.style.ERROR(f'[{timezone.now():%H:%M:%S}] Could not claim a job: {e}'))
+                stopping.wait(JOB_POLL_INTERVAL)
+                continue
+            if job is not None:
+                self.stdout.write(f'[{timezone.now():%H:%M:%S}] Running {job}')
+                run_job(job)
+                self.stdout.write(f'[{timezone.now():%H:%M:%S}] {job} finished: {job.status}')
+                continue
+
+            wait = JOB_POLL_INTERVAL
+            if schedule is not None:
+                due = schedule.due()
+                if due:
+                    self.stdout.write(f'[{timezone.now():%H:%M:%S}] Scheduled fetch: {len(due)} provider/category pairs')
+                    try:
+                        stats = run_ingest(due, options['count'])
+                    except Exception as e:
+                        # Like run_job: report it and try these pairs again at their next turn
+                        self.stderr.write(self.style.ERROR(f'  scheduled fetch failed: {type(e).__name__}: {e}'))
+                    else:
+                        self.stdout.write(f"  saved {stats['total_saved']} of {stats['total_fetched']} fetched")
+                    finally:
+                        schedule.reschedule(due)
+                    continue
+                wait = min(wait, schedule.seconds_until_next())
+
+            stopping.wait(wait)
+
+        self.stdout.write(self.style.SUCCESS('Ingest daemon stopped'))
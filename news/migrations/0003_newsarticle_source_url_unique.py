@@ -0,0 +1,34 @@
+# Generated by Django 5.2.7 on 2026-10-17 09:12
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+
+
+def remove_duplicate_urls(apps, schema_editor):
+    """Keep the oldest row for each source_url so the unique index can be built"""
+    NewsArticle = apps.get_model("news", "NewsArticle")
+    duplicates = (
+        NewsArticle.objects.values("source_url")
+        .annotate(keep_id=Min("id"), copies=Count("id"))
+        .filter(copies__gt=1)
+    )
+    for row in duplicates:
+        NewsArticle.objects.filter(source_url=row["source_url"]).exclude(
+            id=row["keep_id"]
+        ).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("news", "0002_userprofile"),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_urls, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="newsarticle",
+            name="source_url",
+            field=models.URLField(max_length=1000, unique=True),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.7 on 2026-10-17 10:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("news", "0003_newsarticle_source_url_unique"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="newsarticle",
+            name="link_checked_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="newsarticle",
+            name="link_status",
+            field=models.IntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="newsarticle",
+            name="link_failures",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="newsarticle",
+            name="link_successes",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="newsarticle",
+            name="link_next_check",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="newsarticle",
+            index=models.Index(
+                fields=["link_next_check"], name="news_newsar_link_ne_956516_idx"
+            ),
+        ),
+    ]
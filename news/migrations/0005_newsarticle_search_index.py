@@ -0,0 +1,24 @@
+# Generated by Django 5.2.7 on 2026-10-17 11:20
+
+from django.db import migrations
+
+from news.search import install_search_index, remove_search_index
+
+
+def forwards(apps, schema_editor):
+    install_search_index(schema_editor)
+
+
+def backwards(apps, schema_editor):
+    remove_search_index(schema_editor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("news", "0004_newsarticle_link_check_state"),
+    ]
+
+    operations = [
+        migrations.RunPython(forwards, backwards),
+    ]
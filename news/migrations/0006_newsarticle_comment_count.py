@@ -0,0 +1,50 @@
+# Generated by Django 5.2.7 on 2026-10-17 12:41
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from news.search import install_search_index
+
+
+def backfill_comment_count(apps, schema_editor):
+    NewsArticle = apps.get_model("news", "NewsArticle")
+    Comment = apps.get_model("news", "Comment")
+    counts = (
+        Comment.objects.filter(article_id=OuterRef("pk"))
+        .order_by()
+        .values("article_id")
+        .annotate(n=Count("id"))
+        .values("n")
+    )
+    NewsArticle.objects.update(
+        comment_count=Coalesce(Subquery(counts), Value(0))
+    )
+
+
+def reinstall_search_index(apps, schema_editor):
+    # Adding a column rebuilds the table on SQLite, which drops the FTS triggers
+    install_search_index(schema_editor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("news", "0005_newsarticle_search_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="newsarticle",
+            name="comment_count",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name="comment",
+            index=models.Index(
+                fields=["article", "-created_at"], name="news_commen_article_c962b8_idx"
+            ),
+        ),
+        migrations.RunPython(backfill_comment_count, migrations.RunPython.noop),
+        migrations.RunPython(reinstall_search_index, migrations.RunPython.noop),
+    ]
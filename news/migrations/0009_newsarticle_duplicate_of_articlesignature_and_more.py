@@ -0,0 +1,82 @@
+# Generated by Django 5.2.7 on 2026-10-17 16:48
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+from news.search import install_search_index
+
+
+def reinstall_search_index(apps, schema_editor):
+    # Keep the FTS triggers in place if the backend rebuilt the article table
+    install_search_index(schema_editor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("news", "0008_pollvote"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="newsarticle",
+            name="duplicate_of",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="duplicates",
+                to="news.newsarticle",
+            ),
+        ),
+        migrations.CreateModel(
+            name="ArticleSignature",
+            fields=[
+                (
+                    "article",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="signature",
+                        serialize=False,
+                        to="news.newsarticle",
+                    ),
+                ),
+                ("minhash", models.BinaryField()),
+                ("published_date", models.DateTimeField()),
+            ],
+        ),
+        migrations.CreateModel(
+            name="ArticleBand",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("key", models.BigIntegerField()),
+                ("published_date", models.DateTimeField()),
+                (
+                    "article",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="lsh_bands",
+                        to="news.newsarticle",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["key", "published_date"],
+                        name="news_articl_key_dc39fe_idx",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(reinstall_search_index, migrations.RunPython.noop),
+    ]
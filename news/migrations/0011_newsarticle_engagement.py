@@ -0,0 +1,39 @@
+# Generated by Django 5.2.7 on 2026-10-17 19:10
+
+from django.db import migrations, models
+from django.db.models import F
+
+from news.search import install_search_index
+
+
+def backfill_engagement(apps, schema_editor):
+    NewsArticle = apps.get_model("news", "NewsArticle")
+    NewsArticle.objects.update(engagement=F("upvotes") + F("views") + F("comment_count"))
+
+
+def reinstall_search_index(apps, schema_editor):
+    # Adding a column rebuilds the table on SQLite, which drops the FTS triggers
+    install_search_index(schema_editor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("news", "0010_ingestjob"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="newsarticle",
+            name="engagement",
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name="newsarticle",
+            index=models.Index(
+                fields=["-engagement", "published_date"], name="news_newsar_engagem_45f875_idx"
+            ),
+        ),
+        migrations.RunPython(backfill_engagement, migrations.RunPython.noop),
+        migrations.RunPython(reinstall_search_index, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 5.2.7 on 2026-10-17 21:40
+
+from django.db import migrations, models
+
+
+def backfill_request_key(apps, schema_editor):
+    # Same format as IngestJob.make_request_key (historical models have no methods)
+    IngestJob = apps.get_model("news", "IngestJob")
+    active_keys = {}
+    for job in IngestJob.objects.order_by("id"):
+        key = f"{job.kind}:{','.join(job.categories)}:{job.articles_per_category}"
+        job.request_key = key
+        update_fields = ["request_key"]
+        if job.status in ("queued", "running"):
+            if key in active_keys:
+                # Duplicates queued before the constraint existed
+                job.status = "failed"
+                job.error = f"Duplicate of job #{active_keys[key]}"
+                update_fields += ["status", "error"]
+            else:
+                active_keys[key] = job.id
+        job.save(update_fields=update_fields)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("news", "0011_newsarticle_engagement"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="ingestjob",
+            name="request_key",
+            field=models.CharField(default="", editable=False, max_length=255),
+        ),
+        migrations.RunPython(backfill_request_key, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="ingestjob",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("status__in", ["queued", "running"])),
+                fields=("request_key",),
+                name="news_ingestjob_one_active_per_request",
+            ),
+        ),
+    ]
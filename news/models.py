@@ -1,12 +1,30 @@
 from django.db import models
 from django.utils import timezone
+from django.utils.functional import cached_property
 from django.contrib.auth.models import User
-from django.db.models.signals import post_save
+from django.db.models import F
+from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 
 
 # -------------------- NEWS MODELS --------------------
 
+ENGAGEMENT_FIELDS = ('upvotes', 'views', 'comment_count')
+
+
+def engagement_after(**new_values):
+    """
+    Expression for NewsArticle.engagement in an UPDATE that also sets
+    `new_values` ({field: expression}). Every SET expression sees the row's
+    old values, so the changed fields are repeated here rather than read back.
+    """
+    total = None
+    for field in ENGAGEMENT_FIELDS:
+        term = new_values.get(field, F(field))
+        total = term if total is None else total + term
+    return total
+
+
 class NewsArticle(models.Model):
     """Model for storing news articles"""
     CATEGORY_CHOICES = [
@@ -25,7 +43,7 @@ class NewsArticle(models.Model):
     content = models.TextField(blank=True, null=True)
     category = models.CharField(max_length=50, choices=CATEGORY_CHOICES)
     source = models.CharField(max_length=200)
-    source_url = models.URLField(max_length=1000)
+    source_url = models.URLField(max_length=1000, unique=True)
     image_url = models.URLField(max_length=1000, blank=True, null=True)
     published_date = models.DateTimeField(default=timezone.now)
     scraped_date = models.DateTimeField(auto_now_add=True)
@@ -34,17 +52,42 @@ class NewsArticle(models.Model):
     upvotes = models.IntegerField(default=0)
     downvotes = models.IntegerField(default=0)
     views = models.IntegerField(default=0)
+    comment_count = models.IntegerField(default=0)  # maintained by Comment signals below
+    # upvotes + views + comment_count, kept in step by every path that changes
+    # one of them (see engagement_after) so the archive can sort on an index
+    engagement = models.IntegerField(default=0)
+    
+    # Link-check state (see cleanup_articles)
+    link_checked_at = models.DateTimeField(blank=True, null=True)
+    link_status = models.IntegerField(blank=True, null=True)  # HTTP status, 0 = request failed
+    link_failures = models.IntegerField(default=0)  # consecutive failed checks
+    link_successes = models.IntegerField(default=0)  # consecutive passed checks
+    link_next_check = models.DateTimeField(blank=True, null=True)  # NULL = never checked
+    
+    # First article of the story this one syndicates (see news/dedup.py); NULL = representative
+    duplicate_of = models.ForeignKey(
+        'self', on_delete=models.SET_NULL, blank=True, null=True, related_name='duplicates'
+    )
     
     class Meta:
         ordering = ['-published_date']
         indexes = [
             models.Index(fields=['category', '-published_date']),
             models.Index(fields=['-published_date']),
+            models.Index(fields=['link_next_check']),
+            models.Index(fields=['-engagement', 'published_date']),
         ]
     
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        self.engagement = sum(getattr(self, field) for field in ENGAGEMENT_FIELDS)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and set(update_fields) & set(ENGAGEMENT_FIELDS):
+            kwargs['update_fields'] = {*update_fields, 'engagement'}
+        super().save(*args, **kwargs)
+
     @property
     def vote_score(self):
         return self.upvotes - self.downvotes
@@ -54,6 +97,29 @@ class NewsArticle(models.Model):
         return (self.upvotes * 2) + self.views - self.downvotes
 
 
+class ArticleSignature(models.Model):
+    """MinHash signature of an article's title and description (see news/dedup.py)"""
+    article = models.OneToOneField(NewsArticle, on_delete=models.CASCADE, primary_key=True, related_name='signature')
+    minhash = models.BinaryField()
+    published_date = models.DateTimeField()  # copied from the article to bound lookups without a join
+    
+    def __str__(self):
+        return f"Signature for article {self.article_id}"
+
+
+class ArticleBand(models.Model):
+    """One LSH band key of an article's signature; equal keys mark near-duplicate candidates"""
+    article = models.ForeignKey(NewsArticle, on_delete=models.CASCADE, related_name='lsh_bands')
+    key = models.BigIntegerField()
+    published_date = models.DateTimeField()
+    
+    class Meta:
+        indexes = [models.Index(fields=['key', 'published_date'])]
+    
+    def __str__(self):
+        return f"Band {self.key} for article {self.article_id}"
+
+
 class UserPreference(models.Model):
     """Track anonymous user preferences (session-based)"""
     session_id = models.CharField(max_length=100, unique=True)
@@ -95,6 +161,7 @@ class Comment(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [models.Index(fields=['article', '-created_at'])]
     
     def __str__(self):
         return f"Comment by {self.author_name} on {self.article.title[:50]}"
@@ -108,6 +175,11 @@ class Poll(models.Model):
     
     def __str__(self):
         return self.question
+    
+    @cached_property
+    def total_votes(self):
+        """Sum of option votes (uses prefetched options; replaced by a query annotation when present)"""
+        return sum(option.votes for option in self.options.all())
 
 
 class PollOption(models.Model):
@@ -121,10 +193,83 @@ class PollOption(models.Model):
     
     @property
     def percentage(self):
-        total_votes = sum(option.votes for option in self.poll.options.all())
+        # poll.total_votes is computed once per poll instead of once per option
+        total_votes = self.poll.total_votes
         return round((self.votes / total_votes) * 100, 1) if total_votes > 0 else 0
 
 
+class PollVote(models.Model):
+    """One vote per session per poll (option counters are updated in batches, see news/polls.py)"""
+    poll = models.ForeignKey(Poll, on_delete=models.CASCADE, related_name='poll_votes')
+    option = models.ForeignKey(PollOption, on_delete=models.CASCADE, related_name='poll_votes')
+    session_id = models.CharField(max_length=100)
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        unique_together = ('poll', 'session_id')
+    
+    def __str__(self):
+        return f"{self.session_id} voted {self.option.text}"
+
+
+class StatCounter(models.Model):
+    """Materialized site-wide counters for /api/stats/ and the dashboard (see news/stats.py)"""
+    name = models.CharField(max_length=100, primary_key=True)
+    value = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    def __str__(self):
+        return f"{self.name} = {self.value}"
+
+
+class IngestJob(models.Model):
+    """A requested news refresh, run by `manage.py run_ingest_daemon` (see news/ingest.py)"""
+    STATUS_CHOICES = [
+        ('queued', 'Queued'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    ]
+    KIND_CHOICES = [
+        ('public', 'Public refresh'),
+        ('admin', 'Admin refresh'),
+    ]
+    
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES, default='public')
+    categories = models.JSONField(default=list)  # API categories; empty = all
+    articles_per_category = models.IntegerField(default=5)
+    # kind + categories + articles_per_category; at most one active job per key
+    request_key = models.CharField(max_length=255, default='', editable=False)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='queued')
+    progress = models.JSONField(default=dict)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(blank=True, null=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+    
+    class Meta:
+        indexes = [models.Index(fields=['status', 'created_at'])]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['request_key'],
+                condition=models.Q(status__in=['queued', 'running']),
+                name='news_ingestjob_one_active_per_request',
+            ),
+        ]
+    
+    @staticmethod
+    def make_request_key(kind, categories, articles_per_category):
+        return f"{kind}:{','.join(categories)}:{articles_per_category}"
+    
+    def save(self, *args, **kwargs):
+        if not self.request_key:
+            self.request_key = self.make_request_key(self.kind, self.categories, self.articles_per_category)
+        super().save(*args, **kwargs)
+    
+    def __str__(self):
+        return f"{self.get_kind_display()} #{self.pk} ({self.status})"
+
+
 # -------------------- USER PROFILE EXTENSION --------------------
 
 class UserProfile(models.Model):
@@ -180,3 +325,21 @@ def create_user_profile(sender, instance, created, **kwargs):
 def save_user_profile(sender, instance, **kwargs):
     """Save the profile whenever the user model is saved"""
     instance.profile.save()
+
+
+@receiver(post_save, sender=Comment)
+def increment_comment_count(sender, instance, created, **kwargs):
+    """Keep NewsArticle.comment_count in step without counting rows"""
+    if created:
+        comment_count = F('comment_count') + 1
+        NewsArticle.objects.filter(id=instance.article_id).update(
+            comment_count=comment_count, engagement=engagement_after(comment_count=comment_count)
+        )
+
+
+@receiver(post_delete, sender=Comment)
+def decrement_comment_count(sender, instance, **kwargs):
+    comment_count = F('comment_count') - 1
+    NewsArticle.objects.filter(id=instance.article_id, comment_count__gt=0).update(
+        comment_count=comment_count, engagement=engagement_after(comment_count=comment_count)
+    )
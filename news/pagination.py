@@ -0,0 +1,122 @@
+from datetime import timedelta
+
+from django.core import signing
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import NewsArticle
+from .ranking import feed_ranker
+from .scoring import EPOCH, CandidateColumns, score_batch, to_microseconds
+
+# ==================== CURSOR PAGINATION ====================
+# Pages are addressed by opaque, signed cursors instead of OFFSET, so page N
+# costs the same as page 1.
+#
+# The feed has two phases. The head is the ranked candidate window from
+# FeedRanker: its cursor carries the ranking time and the (score, id) of the
+# last item shown, so the next page resumes the same ordering. After the window
+# runs out, the tail continues in (published_date, id) order just below the
+# window's oldest article, using the (category, -published_date) and
+# (-published_date) indexes.
+
+FEED_PAGE_SIZE = 50
+CURSOR_SALT = 'newsify.cursor'
+
+
+class InvalidCursor(Exception):
+    pass
+
+
+def encode_cursor(state, salt=CURSOR_SALT):
+    return signing.dumps(state, salt=salt, compress=True)
+
+
+def decode_cursor(cursor, salt=CURSOR_SALT):
+    try:
+        state = signing.loads(cursor, salt=salt)
+    except signing.BadSignature:
+        raise InvalidCursor('Invalid cursor')
+    if not isinstance(state, dict):
+        raise InvalidCursor('Invalid cursor')
+    return state
+
+
+def from_microseconds(us):
+    return EPOCH + timedelta(microseconds=us)
+
+
+def keyset_before(field, value, pk):
+    """Rows strictly after (value, pk) in descending (field, id) order"""
+    return Q(**{f'{field}__lt': value}) | Q(**{field: value, 'id__lt': pk})
+
+
+def feed_page(category, preferences, cursor=None, page_size=FEED_PAGE_SIZE, now=None):
+    """
+    One page of the personalized feed.
+
+    Returns:
+        (list of (NewsArticle, score), next_cursor or None)
+
+    Raises:
+        InvalidCursor if the cursor is malformed, tampered with or belongs to another feed.
+    """
+    if cursor:
+        state = decode_cursor(cursor)
+        if state.get('c') != category or state.get('m') not in ('r', 'd'):
+            raise InvalidCursor('Cursor does not belong to this feed')
+    else:
+        now = now or timezone.now()
+        state = {
+            'c': category,
+            'm': 'r',
+            'n': to_microseconds(now),
+            'a': None,
+            'b': feed_ranker.window_boundary(category),
+        }
+
+    now = from_microseconds(state['n'])
+
+    if state['m'] == 'r':
+        after = tuple(state['a']) if state['a'] else None
+        ranked = feed_ranker.rank(category, preferences, limit=page_size, after=after, now=now)
+        if len(ranked) == page_size:
+            last_id, last_score = ranked[-1]
+            next_state = dict(state, a=[last_score, last_id])
+        elif state['b']:
+            # Window exhausted: continue chronologically below its oldest article
+            next_state = {'c': category, 'm': 'd', 'n': state['n'], 'p': state['b'][0], 'i': state['b'][1]}
+        else:
+            next_state = None
+
+        if not ranked and next_state:
+            # Nothing left in the window; serve the first tail page right away
+            return feed_page(category, preferences, encode_cursor(next_state), page_size)
+
+        articles_by_id = NewsArticle.objects.in_bulk([article_id for article_id, _ in ranked])
+        page = [
+            (articles_by_id[article_id], score) for article_id, score in ranked if article_id in articles_by_id
+        ]
+        return page, (encode_cursor(next_state) if next_state else None)
+
+    # Chronological tail
+    qs = NewsArticle.objects.filter(duplicate_of__isnull=True)
+    if category != 'all':
+        qs = qs.filter(category=category)
+    articles = list(
+        qs.filter(keyset_before('published_date', from_microseconds(state['p']), state['i']))
+        .order_by('-published_date', '-id')[:page_size + 1]
+    )
+    has_more = len(articles) > page_size
+    articles = articles[:page_size]
+
+    columns = CandidateColumns.from_rows(
+        (a.id, a.category, a.published_date, a.upvotes, a.views, a.credibility_score) for a in articles
+    )
+    scores = score_batch(columns, preferences, now) if articles else []
+    page = [(article, float(score)) for article, score in zip(articles, scores)]
+
+    next_cursor = None
+    if has_more:
+        last = articles[-1]
+        next_cursor = encode_cursor(dict(state, p=to_microseconds(last.published_date), i=last.id))
+    return page, next_cursor
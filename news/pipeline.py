@@ -0,0 +1,217 @@
+import queue
+import threading
+import time
+
+from django.db import connection
+
+# ==================== STAGED PIPELINE ====================
+# A Pipeline is a chain of Stages joined by bounded queues. Each stage has its
+# own worker threads; when a stage falls behind, its input queue fills up and
+# the stage before it blocks on put (backpressure) instead of piling items up
+# in memory.
+#
+# Every stage records how long its workers spent working, waiting for input
+# (starved: the bottleneck is upstream) and waiting to hand results on
+# (blocked: the bottleneck is downstream), plus the depth of its input queue.
+# For ingestion that tells network-bound (the writer starves) apart from
+# DB-bound (fetchers block and the writer's queue sits full).
+
+DEFAULT_QUEUE_SIZE = 200
+DEFAULT_BATCH_LINGER = 0.2  # seconds a batching stage waits to fill a batch
+
+_DONE = object()
+
+
+class StageStats:
+    def __init__(self, name, workers, queue_size):
+        self.name = name
+        self.workers = workers
+        self.queue_size = queue_size
+        self.items_in = 0
+        self.items_out = 0
+        self.errors = 0
+        self.busy = 0.0
+        self.wait_in = 0.0
+        self.wait_out = 0.0
+        self.max_depth = 0
+        self._depth_total = 0
+        self._depth_samples = 0
+        self.started_at = None
+        self.finished_at = None
+        self._lock = threading.Lock()
+
+    def sample_depth(self, depth):
+        with self._lock:
+            self.max_depth = max(self.max_depth, depth)
+            self._depth_total += depth
+            self._depth_samples += 1
+
+    def add(self, **values):
+        with self._lock:
+            for field, value in values.items():
+                setattr(self, field, getattr(self, field) + value)
+
+    @property
+    def elapsed(self):
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+    @property
+    def items_per_second(self):
+        return self.items_in / self.elapsed if self.elapsed > 0 else 0.0
+
+    def as_dict(self):
+        worker_time = self.elapsed * self.workers
+        return {
+            'stage': self.name,
+            'workers': self.workers,
+            'items_in': self.items_in,
+            'items_out': self.items_out,
+            'errors': self.errors,
+            'items_per_second': round(self.items_per_second, 1),
+            'busy_pct': round(100 * self.busy / worker_time, 1) if worker_time else 0.0,
+            'starved_pct': round(100 * self.wait_in / worker_time, 1) if worker_time else 0.0,
+            'blocked_pct': round(100 * self.wait_out / worker_time, 1) if worker_time else 0.0,
+            'queue_size': self.queue_size,
+            'avg_queue_depth': round(self._depth_total / self._depth_samples, 1) if self._depth_samples else 0.0,
+            'max_queue_depth': self.max_depth,
+        }
+
+
+class Stage:
+    """
+    One pipeline step.
+
+    func(item, emit) is called for every input item and calls emit(result)
+    for each output (zero or more). With batch_size > 1, func receives a list
+    of up to batch_size items instead, gathered for at most `linger` seconds.
+    """
+
+    def __init__(self, name, func, workers=1, queue_size=DEFAULT_QUEUE_SIZE, batch_size=1, linger=DEFAULT_BATCH_LINGER):
+        self.name = name
+        self.func = func
+        self.workers = max(1, workers)
+        self.batch_size = max(1, batch_size)
+        self.linger = linger
+        self.inbox = queue.Queue(maxsize=queue_size)
+        self.stats = StageStats(name, self.workers, queue_size)
+        self.next = None
+        self._alive = 0
+        self._alive_lock = threading.Lock()
+        self._threads = []
+        self._local = threading.local()
+
+    def _get(self, timeout=None):
+        started = time.monotonic()
+        try:
+            return self.inbox.get(timeout=timeout)
+        finally:
+            self.stats.add(wait_in=time.monotonic() - started)
+            self.stats.sample_depth(self.inbox.qsize())
+
+    def _emit(self, item):
+        self.stats.add(items_out=1)
+        if self.next is None:
+            return
+        started = time.monotonic()
+        self.next.inbox.put(item)
+        waited = time.monotonic() - started
+        self._local.blocked += waited
+        self.stats.add(wait_out=waited)
+
+    def _process(self, batch):
+        started = time.monotonic()
+        self._local.blocked = 0.0
+        try:
+            self.func(batch if self.batch_size > 1 else batch[0], self._emit)
+        except Exception as e:
+            self.stats.add(errors=1)
+            print(f"Pipeline stage {self.name} failed: {e}")
+        finally:
+            # Time this worker spent blocked in emit is counted as wait_out, not busy
+            self.stats.add(items_in=len(batch), busy=time.monotonic() - started - self._local.blocked)
+
+    def _work(self):
+        try:
+            done = False
+            while not done:
+                item = self._get()
+                if item is _DONE:
+                    break
+                batch = [item]
+                while len(batch) < self.batch_size:
+                    try:
+                        item = self._get(timeout=self.linger)
+                    except queue.Empty:
+                        break
+                    if item is _DONE:
+                        done = True
+                        break
+                    batch.append(item)
+                self._process(batch)
+        finally:
+            # Worker threads get their own DB connection; don't leak it
+            connection.close()
+            with self._alive_lock:
+                self._alive -= 1
+                last = self._alive == 0
+            if last:
+                self.stats.finished_at = time.monotonic()
+                if self.next is not None:
+                    self.next.close()
+
+    def start(self):
+        self.stats.started_at = time.monotonic()
+        self._alive = self.workers
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._work, name=f'pipeline-{self.name}-{i}', daemon=True)
+            self._threads.append(thread)
+            thread.start()
+
+    def close(self):
+        """No more input: let every worker finish what is queued and exit"""
+        for _ in range(self.workers):
+            self.inbox.put(_DONE)
+
+    def join(self):
+        for thread in self._threads:
+            thread.join()
+
+
+class Pipeline:
+    def __init__(self, stages):
+        self.stages = list(stages)
+        for stage, next_stage in zip(self.stages, self.stages[1:]):
+            stage.next = next_stage
+
+    def run(self, items):
+        """Push items through every stage and wait for the last one to finish"""
+        for stage in self.stages:
+            stage.start()
+        first = self.stages[0]
+        for item in items:
+            first.inbox.put(item)
+        first.close()
+        for stage in self.stages:
+            stage.join()
+        return self.report()
+
+    def report(self):
+        return [stage.stats.as_dict() for stage in self.stages]
+
+
+def format_report(report):
+    """Printable table of Pipeline.report()"""
+    lines = [
+        f"{'stage':<10} {'workers':>7} {'in':>7} {'out':>7} {'items/s':>9} "
+        f"{'busy%':>6} {'starved%':>8} {'blocked%':>8} {'queue avg/max':>14}"
+    ]
+    for row in report:
+        depth = f"{row['avg_queue_depth']}/{row['max_queue_depth']}"
+        lines.append(
+            f"{row['stage']:<10} {row['workers']:>7} {row['items_in']:>7} {row['items_out']:>7} "
+            f"{row['items_per_second']:>9} {row['busy_pct']:>6} {row['starved_pct']:>8} "
+            f"{row['blocked_pct']:>8} {depth:>14}"
+        )
+    return '\n'.join(lines)
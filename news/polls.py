@@ -0,0 +1,179 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import F, Sum
+from django.db.models.functions import Coalesce, Greatest
+from django.db.models.signals import post_save, post_delete
+
+from .buffers import DeltaBuffer
+from .models import Poll, PollOption, PollVote
+from .stats import increment as increment_stat, POLL_VOTES
+
+# ==================== POLL READS ====================
+# The active-polls payload is built with two queries no matter how many polls
+# there are (polls annotated with their vote total + one prefetch for options)
+# and kept in the Django cache until a vote or an admin edit invalidates it.
+
+POLLS_CACHE_KEY = 'newsify:polls:active'
+DEFAULT_POLLS_CACHE_TTL = 60
+
+
+def _percentage(votes, total_votes):
+    return round((votes / total_votes) * 100, 1) if total_votes > 0 else 0
+
+
+def build_polls_payload():
+    """Active polls with per-option percentages (2 queries)"""
+    polls_qs = (
+        Poll.objects.filter(is_active=True)
+        .annotate(total_votes=Coalesce(Sum('options__votes'), 0))
+        .prefetch_related('options')
+        .order_by('id')
+    )
+    polls_data = []
+
+    for poll in polls_qs:
+        total_votes = poll.total_votes
+        options_data = [
+            {
+                'id': o.id,
+                'text': o.text,
+                'votes': o.votes,
+                'percentage': _percentage(o.votes, total_votes),
+            }
+            for o in poll.options.all()
+        ]
+
+        polls_data.append({
+            'id': poll.id,
+            'question': poll.question,
+            'options': options_data,
+            'total_votes': total_votes,
+        })
+
+    return polls_data
+
+
+def get_polls_payload():
+    """Cached active-polls payload"""
+    polls_data = cache.get(POLLS_CACHE_KEY)
+    if polls_data is None:
+        polls_data = build_polls_payload()
+        cache.set(POLLS_CACHE_KEY, polls_data, getattr(settings, 'NEWSIFY_POLLS_CACHE_TTL', DEFAULT_POLLS_CACHE_TTL))
+    return polls_data
+
+
+def invalidate_polls_cache(**kwargs):
+    cache.delete(POLLS_CACHE_KEY)
+
+
+def connect_signals():
+    """Admin edits to polls or options also invalidate the payload (called from NewsConfig.ready)"""
+    for model in (Poll, PollOption):
+        post_save.connect(invalidate_polls_cache, sender=model, dispatch_uid=f'polls-cache-save-{model.__name__}')
+        post_delete.connect(invalidate_polls_cache, sender=model, dispatch_uid=f'polls-cache-delete-{model.__name__}')
+
+
+# ==================== POLL VOTES ====================
+# A vote is a PollVote row, unique per (poll, session), so repeating a vote (a
+# double click, a retried request) is a no-op that returns the original choice.
+# Inserting that row is the only per-vote write: the +1 on the option goes
+# through a DeltaBuffer and lands as one UPDATE per flush, so a popular poll is
+# not one hot-row lock per voter. NEWSIFY_POLL_WRITE_BEHIND = False updates the
+# counter inside the voting request instead.
+#
+# Until a flush, this process adds the buffered deltas to what it serves
+# (read-your-writes for the voter); other processes see the vote once the
+# flush invalidates the payload cache.
+
+
+def apply_poll_deltas(batch):
+    """Write {option_id: {'votes': n}} with one UPDATE per distinct delta"""
+    groups = {}
+    for option_id, deltas in batch.items():
+        groups.setdefault(deltas.get('votes', 0), []).append(option_id)
+
+    with transaction.atomic():
+        for delta, option_ids in groups.items():
+            PollOption.objects.filter(id__in=option_ids).update(votes=Greatest(F('votes') + delta, 0))
+        increment_stat(POLL_VOTES, sum(delta * len(option_ids) for delta, option_ids in groups.items()))
+    invalidate_polls_cache()
+
+
+def poll_write_behind_enabled():
+    return getattr(settings, 'NEWSIFY_POLL_WRITE_BEHIND', True)
+
+
+poll_vote_buffer = DeltaBuffer(
+    'poll-votes',
+    apply_poll_deltas,
+    interval=getattr(settings, 'NEWSIFY_VOTE_FLUSH_INTERVAL', 2.0),
+)
+
+
+def with_pending_votes(poll_data):
+    """Copy of one poll's payload with this process's unflushed votes added"""
+    options = []
+    for option in poll_data['options']:
+        votes = max(0, option['votes'] + poll_vote_buffer.pending(option['id']).get('votes', 0))
+        options.append(dict(option, votes=votes))
+
+    total_votes = sum(option['votes'] for option in options)
+    for option in options:
+        option['percentage'] = _percentage(option['votes'], total_votes)
+    return dict(poll_data, options=options, total_votes=total_votes)
+
+
+def get_session_poll_votes(session_id, poll_ids):
+    """{poll_id: option_id} for the polls this session has voted on"""
+    if not session_id or not poll_ids:
+        return {}
+    return dict(
+        PollVote.objects.filter(session_id=session_id, poll_id__in=poll_ids).values_list('poll_id', 'option_id')
+    )
+
+
+def _poll_data(poll_id):
+    """One poll's payload, from the cache when the poll is active"""
+    for poll_data in get_polls_payload():
+        if poll_data['id'] == poll_id:
+            return poll_data
+
+    poll = Poll.objects.only('question').get(id=poll_id)
+    options = list(PollOption.objects.filter(poll_id=poll_id).order_by('id').values('id', 'text', 'votes'))
+    return {'id': poll_id, 'question': poll.question, 'options': options, 'total_votes': 0}
+
+
+def cast_poll_vote(option_id, session_id):
+    """
+    Record a session's vote on a poll option, once per poll.
+
+    Returns:
+        (poll_data, option_id, created) where poll_data carries the current
+        counts (including buffered votes), option_id is the option this
+        session voted for and created is False for a repeated vote.
+
+    Raises:
+        PollOption.DoesNotExist if the option is gone.
+    """
+    poll_id = PollOption.objects.values_list('poll_id', flat=True).get(id=option_id)
+
+    try:
+        with transaction.atomic():
+            PollVote.objects.create(poll_id=poll_id, option_id=option_id, session_id=session_id)
+            if not poll_write_behind_enabled():
+                PollOption.objects.filter(id=option_id).update(votes=F('votes') + 1)
+                increment_stat(POLL_VOTES)
+        created = True
+    except IntegrityError:
+        # Already voted on this poll: keep the first choice
+        option_id = PollVote.objects.values_list('option_id', flat=True).get(poll_id=poll_id, session_id=session_id)
+        created = False
+
+    if created:
+        if poll_write_behind_enabled():
+            poll_vote_buffer.add(option_id, votes=1)
+        else:
+            invalidate_polls_cache()
+
+    return with_pending_votes(_poll_data(poll_id)), option_id, created
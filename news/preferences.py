@@ -0,0 +1,86 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+
+from .models import UserPreference
+
+# ==================== ANONYMOUS PREFERENCES ====================
+# get_news used to create a session and a UserPreference row for every new
+# visitor, crawlers included, although nothing was ever stored in them. Reads
+# now never write:
+#
+#   1. no session yet            -> no preferences, no query
+#   2. in-process LRU            -> recent lookups, including "no row"
+#   3. one SELECT, then cached in the LRU
+#
+# `manage.py purge_preferences` deletes rows whose session is gone.
+
+DEFAULT_PREFERENCE_CACHE_SIZE = 10000
+DEFAULT_PREFERENCE_CACHE_TTL = 300  # seconds
+
+
+class PreferenceLRU:
+    """Bounded session_id -> preferences cache with a per-entry TTL"""
+
+    def __init__(self, size=None, ttl=None):
+        self.size = size
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    def _limits(self):
+        size = self.size or getattr(settings, 'NEWSIFY_PREFERENCE_CACHE_SIZE', DEFAULT_PREFERENCE_CACHE_SIZE)
+        ttl = self.ttl or getattr(settings, 'NEWSIFY_PREFERENCE_CACHE_TTL', DEFAULT_PREFERENCE_CACHE_TTL)
+        return size, ttl
+
+    def get(self, session_id):
+        """Cached preferences, or None when unknown or expired"""
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None:
+                return None
+            preferences, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._entries[session_id]
+                return None
+            self._entries.move_to_end(session_id)
+            return preferences
+
+    def set(self, session_id, preferences):
+        size, ttl = self._limits()
+        with self._lock:
+            self._entries[session_id] = (preferences, time.monotonic() + ttl)
+            self._entries.move_to_end(session_id)
+            while len(self._entries) > size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+preference_cache = PreferenceLRU()
+
+
+def profile_preferences(preferred_categories):
+    """{category: weight} from UserProfile.preferred_categories (onboarding stores a plain list)"""
+    if isinstance(preferred_categories, list):
+        return {cat: 5.0 for cat in preferred_categories}
+    return preferred_categories or {}
+
+
+def get_anonymous_preferences(request):
+    """{category: weight} for an anonymous visitor; never creates a session or a row"""
+    session_id = request.session.session_key
+    if not session_id:
+        return {}
+
+    preferences = preference_cache.get(session_id)
+    if preferences is None:
+        preferences = UserPreference.objects.filter(session_id=session_id).values_list(
+            'preferred_categories', flat=True
+        ).first() or {}
+        preference_cache.set(session_id, preferences)
+    return preferences
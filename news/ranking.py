@@ -0,0 +1,99 @@
+import threading
+import time
+
+from django.conf import settings
+from django.utils import timezone
+
+from .models import NewsArticle
+from .scoring import CandidateColumns, top_k
+
+# ==================== FEED RANKING ENGINE ====================
+# get_news used to load 100 rows, score each one (calling timezone.now() per
+# article) and throw the work away. The ranker keeps the candidate window in
+# memory as scoring columns, so a request only re-weights the candidates by the
+# user's category preferences (see news/scoring.py).
+#
+# The window is reloaded after an ingest (invalidate) or once it is older than
+# NEWSIFY_RANKING_TTL seconds, which is how other worker processes catch up.
+# Votes patch the affected candidate in place.
+
+FEED_WINDOW = 100  # most recent articles considered per feed (matches get_news)
+DEFAULT_RANKING_TTL = 60
+
+RANKING_FIELDS = ('id', 'category', 'published_date', 'upvotes', 'views', 'credibility_score')
+
+
+class FeedRanker:
+    """Process-wide cache of ranking candidates, one column set per feed"""
+
+    def __init__(self, window=FEED_WINDOW, ttl=None):
+        self.window = window
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._loaded_at = None
+        # feed key ('all' or a category) -> CandidateColumns, newest first
+        self._feeds = {}
+
+    def _get_ttl(self):
+        if self.ttl is not None:
+            return self.ttl
+        return getattr(settings, 'NEWSIFY_RANKING_TTL', DEFAULT_RANKING_TTL)
+
+    def invalidate(self):
+        """Drop the window so the next request reloads it (call after an ingest)"""
+        with self._lock:
+            self._loaded_at = None
+
+    def _window_for(self, qs):
+        rows = qs.order_by('-published_date', '-id').values_list(*RANKING_FIELDS)[:self.window]
+        return CandidateColumns.from_rows(rows)
+
+    def _load(self):
+        # One representative per story (see news/dedup.py)
+        representatives = NewsArticle.objects.filter(duplicate_of__isnull=True)
+        feeds = {'all': self._window_for(representatives)}
+        for category, _ in NewsArticle.CATEGORY_CHOICES:
+            feeds[category] = self._window_for(representatives.filter(category=category))
+
+        self._feeds = feeds
+        self._loaded_at = time.monotonic()
+
+    def _ensure_loaded(self):
+        with self._lock:
+            if self._loaded_at is None or time.monotonic() - self._loaded_at > self._get_ttl():
+                self._load()
+            return self._feeds
+
+    def update_article(self, article):
+        """Refresh one candidate's counters after a vote (no-op if not in the window)"""
+        with self._lock:
+            for columns in self._feeds.values():
+                columns.update_counts(article.id, article.upvotes, article.views)
+
+    def candidates(self, category='all'):
+        """CandidateColumns for a feed, or None for an unknown feed"""
+        return self._ensure_loaded().get(category)
+
+    def rank(self, category, prefs, limit=50, after=None, now=None):
+        """
+        Rank a feed for one user's preferences.
+
+        Args:
+            after: (score, id) of the last item already shown, for the next page
+            now: Ranking time; pass the first page's time to keep pages consistent
+
+        Returns:
+            List of (article_id, score), best first
+        """
+        columns = self.candidates(category)
+        if columns is None:
+            return []
+        return top_k(columns, prefs, now or timezone.now(), k=limit, after=after)
+
+    def window_boundary(self, category):
+        """(published_us, id) of the oldest article in a feed's window, or None"""
+        columns = self.candidates(category)
+        return columns.oldest() if columns is not None else None
+
+
+feed_ranker = FeedRanker()
@@ -0,0 +1,168 @@
+import heapq
+from datetime import datetime, timezone as dt_timezone
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the pure-Python path gives the same scores
+    np = None
+
+from .models import NewsArticle
+
+# ==================== BATCH SCORING ====================
+# Column-oriented version of views.calculate_personalized_score. Candidates are
+# passed as parallel arrays and every term is computed for all of them at once.
+# The arithmetic is done in the same order as the scalar formula (and ages are
+# kept as integer microseconds, like timedelta.total_seconds) so the scores are
+# bit-for-bit identical to the per-article loop.
+
+CATEGORIES = [code for code, _ in NewsArticle.CATEGORY_CHOICES]
+CATEGORY_CODES = {category: i for i, category in enumerate(CATEGORIES)}
+UNKNOWN_CATEGORY = len(CATEGORIES)  # slot for categories we have no code for
+DEFAULT_PREFERENCE = 5
+
+MICROSECONDS = 10 ** 6
+EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+
+def to_microseconds(dt):
+    """Aware datetime -> integer microseconds since the epoch"""
+    delta = dt - EPOCH
+    return (delta.days * 86400 + delta.seconds) * MICROSECONDS + delta.microseconds
+
+
+def category_code(category):
+    return CATEGORY_CODES.get(category, UNKNOWN_CATEGORY)
+
+
+def preference_vector(prefs):
+    """User preferences -> list indexed by category code (missing = 5)"""
+    vector = [prefs.get(category, DEFAULT_PREFERENCE) for category in CATEGORIES]
+    vector.append(DEFAULT_PREFERENCE)
+    return vector
+
+
+class CandidateColumns:
+    """Parallel columns for a candidate set (NumPy arrays when available)"""
+
+    def __init__(self, ids, published_us, upvotes, views, credibility, category_codes):
+        self.ids = list(ids)
+        if np is not None:
+            self.published_us = np.asarray(published_us, dtype=np.int64)
+            self.upvotes = np.asarray(upvotes, dtype=np.int64)
+            self.views = np.asarray(views, dtype=np.int64)
+            self.credibility = np.asarray(credibility, dtype=np.int64)
+            self.category_codes = np.asarray(category_codes, dtype=np.int64)
+        else:
+            self.published_us = list(published_us)
+            self.upvotes = list(upvotes)
+            self.views = list(views)
+            self.credibility = list(credibility)
+            self.category_codes = list(category_codes)
+        self._row = {article_id: i for i, article_id in enumerate(self.ids)}
+
+    def __len__(self):
+        return len(self.ids)
+
+    def oldest(self):
+        """(published_us, id) of the last candidate in window order, or None"""
+        if not self.ids:
+            return None
+        return int(self.published_us[-1]), self.ids[-1]
+
+    @classmethod
+    def from_rows(cls, rows):
+        """rows: iterable of (id, category, published_date, upvotes, views, credibility_score)"""
+        rows = list(rows)
+        return cls(
+            ids=[r[0] for r in rows],
+            published_us=[to_microseconds(r[2]) for r in rows],
+            upvotes=[r[3] for r in rows],
+            views=[r[4] for r in rows],
+            credibility=[r[5] for r in rows],
+            category_codes=[category_code(r[1]) for r in rows],
+        )
+
+    def update_counts(self, article_id, upvotes, views):
+        """Patch one candidate's counters in place (no-op if it isn't in the set)"""
+        i = self._row.get(article_id)
+        if i is not None:
+            self.upvotes[i] = upvotes
+            self.views[i] = views
+
+
+def _score_numpy(columns, pref_vector, now_us):
+    hours_old = (now_us - columns.published_us) / MICROSECONDS / 3600
+    recency = np.maximum(0, 10 - (hours_old / 24))
+    engagement = np.minimum(10, (columns.upvotes * 0.5 + columns.views * 0.01) / 10)
+    category_pref = np.asarray(pref_vector)[columns.category_codes]
+    return (
+        recency * 0.3
+        + engagement * 0.1
+        + columns.credibility * 0.1
+        + category_pref * 0.5
+    )
+
+
+def _score_python(columns, pref_vector, now_us):
+    scores = []
+    for published_us, upvotes, views, credibility, code in zip(
+        columns.published_us, columns.upvotes, columns.views, columns.credibility, columns.category_codes
+    ):
+        hours_old = (now_us - published_us) / MICROSECONDS / 3600
+        recency = max(0, 10 - (hours_old / 24))
+        engagement = min(10, (upvotes * 0.5 + views * 0.01) / 10)
+        scores.append(
+            recency * 0.3
+            + engagement * 0.1
+            + credibility * 0.1
+            + pref_vector[code] * 0.5
+        )
+    return scores
+
+
+def score_batch(columns, prefs, now):
+    """Scores for every candidate, in column order"""
+    pref_vector = preference_vector(prefs)
+    now_us = to_microseconds(now)
+    if np is not None:
+        return _score_numpy(columns, pref_vector, now_us)
+    return _score_python(columns, pref_vector, now_us)
+
+
+def top_k(columns, prefs, now, k=50, after=None):
+    """
+    Best k candidates without sorting the whole set.
+
+    Ties on score are broken by id (higher first) so the order is total and
+    `after=(score, id)` can resume exactly where a previous page stopped.
+
+    Returns:
+        List of (article_id, score), best first
+    """
+    if not len(columns) or k <= 0:
+        return []
+    scores = score_batch(columns, prefs, now)
+
+    if np is not None:
+        ids = np.asarray(columns.ids, dtype=np.int64)
+        rows = np.arange(len(scores))
+        if after is not None:
+            after_score, after_id = after
+            rows = rows[(scores < after_score) | ((scores == after_score) & (ids < after_id))]
+        if len(rows) > k:
+            # Everything scoring at least the k-th best survives, ties included
+            kth = np.partition(scores[rows], len(rows) - k)[len(rows) - k]
+            rows = rows[scores[rows] >= kth]
+        rows = rows[np.lexsort((-ids[rows], -scores[rows]))][:k]
+        return [(columns.ids[i], float(scores[i])) for i in rows]
+
+    rows = range(len(scores))
+    if after is not None:
+        rows = [i for i in rows if (scores[i], columns.ids[i]) < tuple(after)]
+    best = heapq.nlargest(k, rows, key=lambda i: (scores[i], columns.ids[i]))
+    return [(columns.ids[i], scores[i]) for i in best]
+
+
+def is_trending(upvotes, comment_count):
+    """Feed trending flag: upvotes > 50, or > 20 with more than 5 comments"""
+    return upvotes > 50 or (upvotes > 20 and comment_count > 5)
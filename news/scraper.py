@@ -1,7 +1,18 @@
 import requests
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from django.db import DatabaseError, IntegrityError, transaction
 from django.utils import timezone
 from .models import NewsArticle
+from .http_cache import cached_get_json
+from .http_client import get_http_client, format_metrics as format_http_metrics
+from .ranking import feed_ranker
+from .feed_cache import bump_version
+from .events import article_poller
+from .pipeline import Pipeline, Stage, format_report
+from .dedup import index_articles
+from .stats import increment as increment_stat, category_counter
 
 # ==================== API KEYS ====================
 # Get free API keys from:
@@ -56,50 +67,260 @@ def get_credibility_score(source_name):
     source_id = source_name.lower().replace(' ', '-')
     return SOURCE_CREDIBILITY.get(source_id, SOURCE_CREDIBILITY['default'])
 
+def normalize_article(article_data, category):
+    """
+    Turn a provider article dict into NewsArticle field values.
+    Returns None for articles that should never be stored.
+    """
+    url = article_data.get('url', '')
+    if not url:
+        return None
+    
+    title = article_data.get('title', '')
+    if not title or '[Removed]' in title:
+        return None
+    
+    published_at = article_data.get('publishedAt') or article_data.get('published_date')
+    if published_at:
+        try:
+            published_date = datetime.fromisoformat(published_at.replace('Z', '+00:00'))
+        except:
+            published_date = timezone.now()
+    else:
+        published_date = timezone.now()
+    
+    source_name = article_data.get('source', 'Unknown')
+    if isinstance(source_name, dict):
+        source_name = source_name.get('name', 'Unknown')
+    
+    return {
+        'title': title,
+        'description': article_data.get('description', '')[:500] if article_data.get('description') else '',
+        'content': article_data.get('content', ''),
+        'category': category,
+        'source': source_name,
+        'source_url': url,
+        'image_url': article_data.get('image_url') or article_data.get('urlToImage', ''),
+        'published_date': published_date,
+        'credibility_score': get_credibility_score(source_name),
+        'upvotes': 0,
+        'downvotes': 0,
+        'views': 0,
+    }
+
 def save_article_to_db(article_data, category):
     """Save a news article to the database"""
     try:
-        url = article_data.get('url', '')
-        if not url or NewsArticle.objects.filter(source_url=url).exists():
+        fields = normalize_article(article_data, category)
+        if not fields or NewsArticle.objects.filter(source_url=fields['source_url']).exists():
             return None
         
-        title = article_data.get('title', '')
-        if '[Removed]' in title or not title:
-            return None
+        article = NewsArticle.objects.create(**fields)
+        index_new_articles([article])
+        return article
         
-        published_at = article_data.get('publishedAt') or article_data.get('published_date')
-        if published_at:
+    except Exception as e:
+        print(f"Error saving article: {e}")
+        return None
+
+# ==================== BULK INGEST ====================
+INGEST_BATCH_SIZE = 500
+
+def save_articles_bulk(articles_data, category, on_error=None, on_drop=None):
+    """
+    Save a whole batch of provider articles (see save_rows_bulk).
+    on_drop(article_data) is called for each article normalize_article
+    rejects or fails on.
+
+    Returns:
+        List of newly created NewsArticle objects
+    """
+    rows = []
+    for article_data in articles_data:
+        try:
+            fields = normalize_article(article_data, category)
+        except Exception as e:
+            print(f"Error normalizing article: {e}")
+            fields = None
+        if fields:
+            rows.append(fields)
+        elif on_drop is not None:
+            on_drop(article_data)
+    
+    return save_rows_bulk(rows, on_error=on_error)
+
+def insert_new_rows(rows, new_urls, on_error=None):
+    """
+    Insert the rows for `new_urls` and return only the articles this call
+    inserted.
+
+    If the batch insert fails (a concurrent ingest got some of the URLs in
+    after our lookup, or one row is bad), the rows go in one by one, each in
+    its own savepoint: URLs that are already stored are skipped, and rows the
+    database rejects are passed to on_error(url, exc) instead of sinking the
+    rest of the batch.
+    """
+    articles = [NewsArticle(**rows[url]) for url in new_urls]
+    try:
+        with transaction.atomic():
+            NewsArticle.objects.bulk_create(articles, batch_size=INGEST_BATCH_SIZE)
+    except DatabaseError:
+        saved = []
+        for url in new_urls:
             try:
-                published_date = datetime.fromisoformat(published_at.replace('Z', '+00:00'))
-            except:
-                published_date = timezone.now()
-        else:
-            published_date = timezone.now()
+                with transaction.atomic():
+                    # bulk_create (not create) so the post_save stats signal stays out of it
+                    saved.extend(NewsArticle.objects.bulk_create([NewsArticle(**rows[url])]))
+            except IntegrityError:
+                pass
+            except DatabaseError as e:
+                if on_error is None:
+                    raise
+                on_error(url, e)
+        articles = saved
+    if articles and articles[0].pk is None:
+        # Backend can't return ids from a bulk insert; nothing conflicted, so every row is ours
+        return list(NewsArticle.objects.filter(source_url__in=[a.source_url for a in articles]))
+    return articles
+
+def save_rows_bulk(rows, on_error=None):
+    """
+    Insert normalized article rows (see normalize_article).
+
+    One `source_url__in` lookup finds the URLs we already have, and the rest
+    go in with a single bulk_create (see insert_new_rows for races with a
+    concurrent fetcher and for bad rows). Only the insert and its stat
+    counters share a transaction. Database errors that aren't about a single
+    row propagate to the caller.
+
+    Returns:
+        List of the NewsArticle objects this call inserted; rows another
+        writer inserted first are not included, so they are counted once
+    """
+    by_url = {}
+    for fields in rows:
+        by_url.setdefault(fields['source_url'], fields)
+    rows = by_url
+    if not rows:
+        return []
+    
+    existing = set(
+        NewsArticle.objects.filter(source_url__in=list(rows)).values_list('source_url', flat=True)
+    )
+    new_urls = [url for url in rows if url not in existing]
+    if not new_urls:
+        return []
+    
+    with transaction.atomic():
+        saved = insert_new_rows(rows, new_urls, on_error=on_error)
         
-        source_name = article_data.get('source', 'Unknown')
-        if isinstance(source_name, dict):
-            source_name = source_name.get('name', 'Unknown')
+        # bulk_create skips post_save, so update the stats counters here
+        increment_stat('total_articles', len(saved))
+        by_category = {}
+        for article in saved:
+            by_category[article.category] = by_category.get(article.category, 0) + 1
+        for category, count in by_category.items():
+            increment_stat(category_counter(category), count)
+    
+    # After the commit: a dedup failure must not roll back the articles
+    index_new_articles(saved)
+    return saved
+
+def index_new_articles(articles):
+    """
+    Cluster syndicated copies under their story's first article. Failures are
+    logged and the articles stay unsigned (visible in the feed) until
+    `manage.py index_duplicates` picks them up.
+    """
+    if not articles:
+        return
+    try:
+        index_articles(articles)
+    except Exception as e:
+        print(f"Duplicate indexing failed for {len(articles)} articles (run index_duplicates): {e}")
+
+def new_ingest_stats():
+    """
+    Empty stats dict in the shape fetch_and_save_news returns. total_saved
+    only counts rows this run inserted itself. Articles that were fetched but
+    not saved are either duplicates (see duplicates_skipped) or counted in:
+      normalize_dropped      - unusable provider data (no title/URL, parse errors)
+      rows_rejected          - single rows the database refused
+      batches_failed         - write batches lost to a batch-wide database error
+      rows_in_failed_batches - the rows those batches carried
+    """
+    return {
+        'total_fetched': 0,
+        'total_saved': 0,
+        'normalize_dropped': 0,
+        'rows_rejected': 0,
+        'batches_failed': 0,
+        'rows_in_failed_batches': 0,
+        'by_category': {},
+        'by_source': {}
+    }
+
+def duplicates_skipped(stats):
+    """Fetched articles that were not saved because we already had them"""
+    return (
+        stats['total_fetched'] - stats['total_saved'] - stats['normalize_dropped']
+        - stats['rows_rejected'] - stats['rows_in_failed_batches']
+    )
+
+def format_ingest_losses(stats):
+    """Lines for the non-duplicate reasons an article was not saved"""
+    lines = []
+    if stats['normalize_dropped']:
+        lines.append(f"Articles dropped by normalization: {stats['normalize_dropped']}")
+    if stats['rows_rejected']:
+        lines.append(f"Rows rejected by the database: {stats['rows_rejected']}")
+    if stats['batches_failed']:
+        lines.append(f"Write batches failed: {stats['batches_failed']} ({stats['rows_in_failed_batches']} rows)")
+    return lines
+
+def ingest_articles(articles_by_category, stats=None):
+    """
+    Batch-ingest {our_category: [provider article dicts]}.
+
+    Returns:
+        Dictionary with stats (total_fetched, total_saved, by_category, by_source)
+    """
+    if stats is None:
+        stats = new_ingest_stats()
+    
+    def row_failed(url, error):
+        print(f"Error saving article {url}: {error}")
+        stats['rows_rejected'] += 1
+    
+    def dropped(article_data):
+        stats['normalize_dropped'] += 1
+    
+    for our_category, articles in articles_by_category.items():
+        if not articles:
+            continue
         
-        article = NewsArticle.objects.create(
-            title=title,
-            description=article_data.get('description', '')[:500] if article_data.get('description') else '',
-            content=article_data.get('content', ''),
-            category=category,
-            source=source_name,
-            source_url=url,
-            image_url=article_data.get('image_url') or article_data.get('urlToImage', ''),
-            published_date=published_date,
-            credibility_score=get_credibility_score(source_name),
-            upvotes=0,
-            downvotes=0,
-            views=0
-        )
+        stats['total_fetched'] += len(articles)
+        saved_articles = save_articles_bulk(articles, our_category, on_error=row_failed, on_drop=dropped)
+        stats['total_saved'] += len(saved_articles)
         
-        return article
+        # Track by source
+        for saved_article in saved_articles:
+            source = saved_article.source
+            stats['by_source'][source] = stats['by_source'].get(source, 0) + 1
         
-    except Exception as e:
-        print(f"Error saving article: {e}")
-        return None
+        stats['by_category'][our_category] = stats['by_category'].get(our_category, 0) + len(saved_articles)
+        print(f"   💾 Saved {len(saved_articles)} new articles for {our_category}\n")
+    
+    if stats['total_saved']:
+        publish_ingest()
+    
+    return stats
+
+def publish_ingest():
+    """Make newly saved articles visible to the feed"""
+    feed_ranker.invalidate()
+    bump_version('ingest')
+    article_poller.poke()
 
 # ==================== NEWS API (Original) ====================
 def fetch_newsapi(category='general', page_size=100, page=1):
@@ -113,10 +334,9 @@ def fetch_newsapi(category='general', page_size=100, page=1):
             'page': page,
         }
         
-        response = requests.get(NEWS_API_URL, params=params, timeout=10)
+        data = cached_get_json('NewsAPI', NEWS_API_URL, params)
         
-        if response.status_code == 200:
-            data = response.json()
+        if data:
             if data['status'] == 'ok':
                 return data['articles']
         return None
@@ -142,10 +362,9 @@ def fetch_newsdata(category='top', language='en', page_size=10):
             'size': page_size,
         }
         
-        response = requests.get(NEWSDATA_URL, params=params, timeout=10)
+        data = cached_get_json('NewsData.io', NEWSDATA_URL, params)
         
-        if response.status_code == 200:
-            data = response.json()
+        if data:
             if data['status'] == 'success':
                 # Transform to common format
                 articles = []
@@ -184,10 +403,9 @@ def fetch_guardian(section='world', page_size=50):
             'order-by': 'newest'
         }
         
-        response = requests.get(GUARDIAN_URL, params=params, timeout=10)
+        data = cached_get_json('The Guardian', GUARDIAN_URL, params)
         
-        if response.status_code == 200:
-            data = response.json()
+        if data:
             if data['response']['status'] == 'ok':
                 # Transform to common format
                 articles = []
@@ -222,10 +440,9 @@ def fetch_nytimes(section='home'):
         url = f"{NYTIMES_URL}/{section}.json"
         params = {'api-key': NYTIMES_API_KEY}
         
-        response = requests.get(url, params=params, timeout=10)
+        data = cached_get_json('NYTimes', url, params)
         
-        if response.status_code == 200:
-            data = response.json()
+        if data:
             if data['status'] == 'OK':
                 # Transform to common format
                 articles = []
@@ -270,10 +487,9 @@ def fetch_gnews(category='general', lang='en', max_results=10):
             'max': max_results,
         }
         
-        response = requests.get(GNEWS_URL, params=params, timeout=10)
+        data = cached_get_json('GNews', GNEWS_URL, params)
         
-        if response.status_code == 200:
-            data = response.json()
+        if data:
             # Transform to common format
             articles = []
             for item in data.get('articles', []):
@@ -292,172 +508,324 @@ def fetch_gnews(category='general', lang='en', max_results=10):
         print(f"GNews API error: {e}")
         return None
 
-# ==================== MASTER FETCH FUNCTION ====================
-def fetch_from_all_apis(category='general', articles_per_category=10):
+# ==================== CONCURRENT FETCH ENGINE ====================
+# Every provider x category request is independent, so they all go out at once
+# on a bounded thread pool. Each provider gets its own concurrency limit so we
+# never hammer a single API (free tiers rate-limit aggressively).
+PROVIDER_CONCURRENCY = {
+    'NewsAPI': 4,
+    'NewsData.io': 2,
+    'The Guardian': 4,
+    'NYTimes': 2,
+    'GNews': 2,
+}
+
+def _fetch_newsapi_for(category, articles_per_category):
+    # NewsAPI - Max 100
+    return fetch_newsapi(category=category, page_size=min(100, articles_per_category))
+
+def _fetch_newsdata_for(category, articles_per_category):
+    # NewsData.io - Max 10 (size is 10 max)
+    newsdata_category = category if category != 'general' else 'top'
+    return fetch_newsdata(category=newsdata_category, page_size=min(10, articles_per_category))
+
+def _fetch_guardian_for(category, articles_per_category):
+    # The Guardian - Max 50
+    guardian_section = 'world' if category == 'general' else category
+    return fetch_guardian(section=guardian_section, page_size=min(50, articles_per_category))
+
+def _fetch_nytimes_for(category, articles_per_category):
+    # NYTimes - No size parameter, so slice to the requested size
+    nyt_section = 'home' if category == 'general' else category
+    nyt_articles = fetch_nytimes(section=nyt_section)
+    return nyt_articles[:articles_per_category] if nyt_articles else nyt_articles
+
+def _fetch_gnews_for(category, articles_per_category):
+    # GNews - Max 10
+    return fetch_gnews(category=category, max_results=min(10, articles_per_category))
+
+# Provider name -> fetcher(category, articles_per_category), in display order
+PROVIDERS = {
+    'NewsAPI': _fetch_newsapi_for,
+    'NewsData.io': _fetch_newsdata_for,
+    'The Guardian': _fetch_guardian_for,
+    'NYTimes': _fetch_nytimes_for,
+    'GNews': _fetch_gnews_for,
+}
+
+def fetch_concurrently(categories, articles_per_category=10, providers=None):
     """
-    Fetch from ALL available APIs at once!
-    This gives you MASSIVE amounts of diverse news
+    Send all provider x category requests at once.
+
+    Args:
+        categories: List of API categories
+        articles_per_category: Number of articles requested from each provider
+        providers: Provider names to use (None = all of PROVIDERS)
+
+    Returns:
+        {category: {provider_name: list of articles or None}}
     """
+    providers = list(providers or PROVIDERS.keys())
+    limits = {
+        name: threading.BoundedSemaphore(PROVIDER_CONCURRENCY.get(name, 1))
+        for name in providers
+    }
+
+    def run(name, category):
+        with limits[name]:
+            try:
+                return PROVIDERS[name](category, articles_per_category)
+            except Exception as e:
+                print(f"{name} error: {e}")
+                return None
+
+    # Interleave providers so no single provider's limit starves the pool
+    tasks = [(name, category) for category in categories for name in providers]
+    results = {category: {} for category in categories}
+    if not tasks:
+        return results
+
+    max_workers = min(len(tasks), sum(PROVIDER_CONCURRENCY.get(name, 1) for name in providers))
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='news-fetch') as executor:
+        futures = {executor.submit(run, name, category): (name, category) for name, category in tasks}
+        for future in as_completed(futures):
+            name, category = futures[future]
+            results[category][name] = future.result()
+
+    return results
+
+def merge_provider_results(category, provider_results):
+    """Flatten one category's provider results (in provider order) and log a summary"""
     all_articles = []
     sources_used = []
-    
+
     print(f"\n{'='*60}")
-    print(f"🌐 FETCHING FROM MULTIPLE SOURCES: {category.upper()}")
+    print(f"🌐 FETCHED FROM MULTIPLE SOURCES: {category.upper()}")
     print(f"{'='*60}\n")
-    
-    # 1. NewsAPI - Max 100
-    newsapi_size = min(100, articles_per_category)
-    print(f"📰 NewsAPI.org (size={newsapi_size})...", end=' ')
-    newsapi_articles = fetch_newsapi(category=category, page_size=newsapi_size)
-    if newsapi_articles:
-        all_articles.extend(newsapi_articles)
-        sources_used.append('NewsAPI')
-        print(f"✓ {len(newsapi_articles)} articles")
-    else:
-        print("✗ Failed")
-    
-    # 2. NewsData.io - Max 10 (size is 10 max)
-    newsdata_size = min(10, articles_per_category)
-    print(f"📰 NewsData.io (size={newsdata_size})...", end=' ')
-    newsdata_articles = fetch_newsdata(category=category if category != 'general' else 'top', page_size=newsdata_size) 
-    if newsdata_articles:
-        all_articles.extend(newsdata_articles)
-        sources_used.append('NewsData.io')
-        print(f"✓ {len(newsdata_articles)} articles")
-    else:
-        print("✗ Skipped (no API key/failed)")
-    
-    # 3. The Guardian - Max 50
-    guardian_size = min(50, articles_per_category)
-    print(f"📰 The Guardian (size={guardian_size})...", end=' ')
-    guardian_section = 'world' if category == 'general' else category
-    guardian_articles = fetch_guardian(section=guardian_section, page_size=guardian_size)
-    if guardian_articles:
-        all_articles.extend(guardian_articles)
-        sources_used.append('The Guardian')
-        print(f"✓ {len(guardian_articles)} articles")
-    else:
-        print("✗ Skipped (no API key/failed)")
-    
-    # 4. NYTimes - No size parameter, but we can take the top N results later if needed.
-    print("📰 New York Times...", end=' ')
-    nyt_section = 'home' if category == 'general' else category
-    nyt_articles = fetch_nytimes(section=nyt_section)
-    if nyt_articles:
-        # Slice to the requested size if NYT has more results
-        nyt_articles = nyt_articles[:articles_per_category]
-        all_articles.extend(nyt_articles)
-        sources_used.append('NYTimes')
-        print(f"✓ {len(nyt_articles)} articles")
-    else:
-        print("✗ Skipped (no API key/failed)")
-    
-    # 5. GNews - Max 10
-    gnews_size = min(10, articles_per_category)
-    print(f"📰 GNews (size={gnews_size})...", end=' ')
-    gnews_articles = fetch_gnews(category=category, max_results=gnews_size)
-    if gnews_articles:
-        all_articles.extend(gnews_articles)
-        sources_used.append('GNews')
-        print(f"✓ {len(gnews_articles)} articles")
-    else:
-        print("✗ Skipped (no API key/failed)")
-    
+
+    for name in PROVIDERS:
+        if name not in provider_results:
+            continue
+        articles = provider_results[name]
+        if articles:
+            all_articles.extend(articles)
+            sources_used.append(name)
+            print(f"📰 {name}... ✓ {len(articles)} articles")
+        else:
+            print(f"📰 {name}... ✗ Skipped (no API key/failed)")
+
     print(f"\n✅ Total fetched: {len(all_articles)} articles from {len(sources_used)} sources")
     print(f"   Sources: {', '.join(sources_used)}\n")
-    
+
     return all_articles
 
+# ==================== MASTER FETCH FUNCTION ====================
+def fetch_from_all_apis(category='general', articles_per_category=10):
+    """
+    Fetch from ALL available APIs at once!
+    This gives you MASSIVE amounts of diverse news
+    """
+    results = fetch_concurrently([category], articles_per_category=articles_per_category)
+    return merge_provider_results(category, results[category])
+
+# ==================== INGEST PIPELINE ====================
+# fetch -> normalize -> dedupe -> write, joined by bounded queues so network,
+# parsing and DB writes overlap (see news/pipeline.py). The fetch stage runs
+# one worker per provider slot in PROVIDER_CONCURRENCY; the others use:
+INGEST_STAGE_WORKERS = {
+    'normalize': 2,
+    'dedupe': 1,
+    'write': 1,  # SQLite takes one writer at a time
+}
+INGEST_QUEUE_SIZE = 200
+INGEST_WRITE_BATCH = 100
+
+def title_key(title):
+    """Case- and punctuation-insensitive title for duplicate detection"""
+    return ' '.join(''.join(ch if ch.isalnum() else ' ' for ch in title.lower()).split())
+
+def build_ingest_pipeline(articles_per_category, providers, stats, stage_workers=None, queue_size=INGEST_QUEUE_SIZE):
+    """
+    Pipeline that takes (provider_name, api_category) tasks and saves what
+    they return, updating `stats` (see new_ingest_stats) as batches are written.
+    """
+    workers = dict(INGEST_STAGE_WORKERS, **(stage_workers or {}))
+    limits = {
+        name: threading.BoundedSemaphore(PROVIDER_CONCURRENCY.get(name, 1))
+        for name in providers
+    }
+    stats_lock = threading.Lock()
+    seen_lock = threading.Lock()
+    seen_urls = set()
+    seen_titles = set()
+
+    def fetch(task, emit):
+        name, api_category = task
+        with limits[name]:
+            try:
+                articles = PROVIDERS[name](api_category, articles_per_category)
+            except Exception as e:
+                print(f"{name} error: {e}")
+                articles = None
+        if not articles:
+            print(f"📰 {name} [{api_category}]... ✗ Skipped (no API key/failed)")
+            return
+        print(f"📰 {name} [{api_category}]... ✓ {len(articles)} articles")
+        our_category = CATEGORY_MAPPING.get(api_category, 'world')
+        for article_data in articles:
+            emit((our_category, article_data))
+
+    def normalize(item, emit):
+        our_category, article_data = item
+        with stats_lock:
+            stats['total_fetched'] += 1
+        try:
+            fields = normalize_article(article_data, our_category)
+        except Exception as e:
+            print(f"Error normalizing article: {e}")
+            fields = None
+        if fields:
+            emit(fields)
+        else:
+            with stats_lock:
+                stats['normalize_dropped'] += 1
+
+    def dedupe(fields, emit):
+        key = title_key(fields['title'])
+        with seen_lock:
+            if fields['source_url'] in seen_urls or key in seen_titles:
+                return
+            seen_urls.add(fields['source_url'])
+            seen_titles.add(key)
+        emit(fields)
+
+    def row_failed(url, error):
+        print(f"Error saving article {url}: {error}")
+        with stats_lock:
+            stats['rows_rejected'] += 1
+
+    def write(rows, emit):
+        # Batch-wide database errors lose the whole batch; count it, then let
+        # the stage log it
+        try:
+            saved_articles = save_rows_bulk(rows, on_error=row_failed)
+        except Exception:
+            with stats_lock:
+                stats['batches_failed'] += 1
+                stats['rows_in_failed_batches'] += len(rows)
+            raise
+        with stats_lock:
+            stats['total_saved'] += len(saved_articles)
+            for saved_article in saved_articles:
+                stats['by_source'][saved_article.source] = stats['by_source'].get(saved_article.source, 0) + 1
+                stats['by_category'][saved_article.category] = stats['by_category'].get(saved_article.category, 0) + 1
+        for saved_article in saved_articles:
+            emit(saved_article)
+
+    fetch_workers = sum(PROVIDER_CONCURRENCY.get(name, 1) for name in providers)
+    return Pipeline([
+        Stage('fetch', fetch, workers=fetch_workers, queue_size=queue_size),
+        Stage('normalize', normalize, workers=workers['normalize'], queue_size=queue_size),
+        Stage('dedupe', dedupe, workers=workers['dedupe'], queue_size=queue_size),
+        Stage('write', write, workers=workers['write'], queue_size=queue_size, batch_size=INGEST_WRITE_BATCH),
+    ])
+
 # ==================== MAIN FETCH FUNCTION ====================
-def fetch_and_save_news(categories=None, articles_per_category=10, use_all_apis=True):
+def fetch_and_save_news(categories=None, articles_per_category=10, use_all_apis=True, stage_workers=None):
     """
     Fetch news from multiple APIs and save to database
     
     Args:
         categories: List of categories (None = all)
-        articles_per_category: Number of articles per category (Used by single API call and passed to multi-API fetcher)
+        articles_per_category: Number of articles requested from each provider
         use_all_apis: If True, fetch from all available APIs
+        stage_workers: Optional {stage name: worker count} overrides for INGEST_STAGE_WORKERS
     
     Returns:
-        Dictionary with stats
+        Dictionary with stats, including a per-stage report under 'stages'
     """
     if categories is None:
         categories = list(CATEGORY_MAPPING.keys())
     
-    stats = {
-        'total_fetched': 0,
-        'total_saved': 0,
-        'by_category': {},
-        'by_source': {}
-    }
+    stats = new_ingest_stats()
     
     print(f"\n{'='*70}")
     print(f"🚀 MULTI-API NEWS FETCHER - {len(categories)} categories")
     print(f"{'='*70}\n")
     
-    for api_category in categories:
-        our_category = CATEGORY_MAPPING.get(api_category, 'world')
-        
-        if use_all_apis:
-            # Pass the corrected arguments to the master fetcher
-            articles = fetch_from_all_apis(category=api_category, articles_per_category=articles_per_category)
-        else:
-            # Use articles_per_category for the single API call mode
-            articles = fetch_newsapi(category=api_category, page_size=articles_per_category)
-        
-        if articles:
-            saved_count = 0
-            for article_data in articles:
-                stats['total_fetched'] += 1
-                
-                saved_article = save_article_to_db(article_data, our_category)
-                if saved_article:
-                    saved_count += 1
-                    stats['total_saved'] += 1
-                    
-                    # Track by source
-                    source = saved_article.source
-                    stats['by_source'][source] = stats['by_source'].get(source, 0) + 1
-            
-            stats['by_category'][our_category] = saved_count
-            print(f"   💾 Saved {saved_count} new articles for {our_category}\n")
+    providers = list(PROVIDERS) if use_all_apis else ['NewsAPI']
+    pipeline = build_ingest_pipeline(articles_per_category, providers, stats, stage_workers=stage_workers)
+    # Interleave providers so no single provider's limit starves the fetch workers
+    stats['stages'] = pipeline.run((name, category) for category in categories for name in providers)
     
-    print(f"{'='*70}")
+    if stats['total_saved']:
+        publish_ingest()
+    
+    print(f"\n{'='*70}")
     print(f"✅ COMPLETE!")
     print(f"   Fetched: {stats['total_fetched']} articles")
     print(f"   Saved: {stats['total_saved']} NEW articles")
+    print(f"   Duplicates skipped: {duplicates_skipped(stats)}")
+    for line in format_ingest_losses(stats):
+        print(f"   {line}")
     print(f"   Sources: {len(stats['by_source'])}")
-    print(f"{'='*70}\n")
+    print(f"{'='*70}")
+    # Starved stages wait on upstream, blocked ones on downstream: a starved
+    # writer means network-bound, a blocked fetch stage means DB-bound.
+    print(format_report(stats['stages']))
+    print(format_http_metrics(get_http_client().metrics()))
+    print()
     
     return stats
 
 
 # ==================== STALE ARTICLE CHECK (NEW) ====================
 
-def check_article_status(url):
+LINK_CHECK_RETRIES = 1
+
+def probe_article_url(url, client=None, timeout=5, retries=LINK_CHECK_RETRIES):
     """
-    Checks if an article's URL is still accessible (returns HTTP 200).
-    Uses a HEAD request for speed.
+    Send a HEAD request for an article URL.
+
+    Args:
+        url: Article URL
+        client: Optional HttpClient (defaults to the shared one)
+        timeout: Seconds before giving up
+        retries: Retries for connection errors, 429 and 5xx
 
     Returns:
-        True if URL is accessible, False otherwise.
+        The HTTP status code, or None if the request itself failed.
     """
     if not url:
-        return False
+        return None
     
+    http = client or get_http_client()
     try:
-        # Use HEAD request to avoid downloading the entire page content
-        response = requests.head(url, timeout=5, allow_redirects=True)
-        
-        # We consider the article still available if status code is 200
-        # or in the 3xx range (redirects are often valid updates).
-        if 200 <= response.status_code < 400:
-            return True
-        else:
-            # Codes like 404 (Not Found), 410 (Gone), 5xx (Server Error) suggest deletion
-            return False
-            
+        # Use HEAD request to avoid downloading the entire page content.
+        # One retry tells a 503 blip apart from a removed article.
+        response = http.head(url, timeout=timeout, allow_redirects=True, retries=retries)
+        return response.status_code
     except requests.exceptions.RequestException as e:
         # Catch connection errors, DNS errors, or timeouts (suggesting article is offline)
         print(f"URL check failed for {url}: {e}")
-        return False
\ No newline at end of file
+        return None
+
+
+def is_live_status(status_code):
+    """
+    We consider the article still available if status code is 200
+    or in the 3xx range (redirects are often valid updates).
+    Codes like 404 (Not Found), 410 (Gone), 5xx (Server Error) suggest deletion.
+    """
+    return status_code is not None and 200 <= status_code < 400
+
+
+def check_article_status(url, client=None):
+    """
+    Checks if an article's URL is still accessible (returns HTTP 200).
+    Uses a HEAD request for speed.
+
+    Returns:
+        True if URL is accessible, False otherwise.
+    """
+    return is_live_status(probe_article_url(url, client=client))
@@ -0,0 +1,201 @@
+import re
+import threading
+from collections import namedtuple
+
+from django.conf import settings
+from django.db import connection, DatabaseError
+from django.db.models import Q
+from django.utils.module_loading import import_string
+
+from .models import NewsArticle
+
+# ==================== FULL-TEXT SEARCH ====================
+# `title__icontains OR description__icontains` is a full table scan with
+# LIKE '%q%' and no relevance order. Search goes through a backend instead:
+#   - SQLite: an FTS5 index over title + description, kept in sync with
+#     news_newsarticle by triggers, ranked with bm25() and snippet().
+#   - PostgreSQL: a GIN index on the same tsvector expression the query uses,
+#     ranked with ts_rank_cd() and ts_headline().
+#   - Anything else (or SQLite built without FTS5): the old LIKE query.
+# NEWSIFY_SEARCH_BACKEND (a dotted path) overrides the automatic choice.
+
+SearchHit = namedtuple('SearchHit', ['article_id', 'rank', 'snippet'])
+
+FTS_TABLE = 'news_article_fts'
+ARTICLE_TABLE = 'news_newsarticle'
+SNIPPET_WORDS = 16
+
+SQLITE_FTS_SQL = [
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        title, description,
+        content='{ARTICLE_TABLE}', content_rowid='id',
+        tokenize='porter unicode61'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON {ARTICLE_TABLE} BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON {ARTICLE_TABLE} BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF title, description ON {ARTICLE_TABLE} BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO {FTS_TABLE}(rowid, title, description) VALUES (new.id, new.title, new.description);
+    END""",
+]
+
+SQLITE_FTS_DROP_SQL = [
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ai",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ad",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_au",
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+]
+
+PG_SEARCH_CONFIG = 'english'
+PG_DOCUMENT_SQL = (
+    f"to_tsvector('{PG_SEARCH_CONFIG}'::regconfig, "
+    "COALESCE(title, '') || ' ' || COALESCE(description, ''))"
+)
+PG_INDEX_NAME = 'news_newsarticle_search_idx'
+
+
+def install_search_index(schema_editor):
+    """
+    Create (or re-create) the database-side search index. Idempotent.
+
+    SQLite drops a table's triggers whenever Django rebuilds it during a
+    migration, so migrations that rebuild news_newsarticle call this again.
+    """
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        try:
+            for sql in SQLITE_FTS_SQL:
+                schema_editor.execute(sql)
+            # Backfill from the content table
+            schema_editor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+        except DatabaseError as e:
+            # SQLite compiled without FTS5: search falls back to LIKE
+            print(f"FTS5 unavailable, full-text index not created: {e}")
+    elif vendor == 'postgresql':
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {PG_INDEX_NAME} ON {ARTICLE_TABLE} USING GIN ({PG_DOCUMENT_SQL})"
+        )
+
+
+def remove_search_index(schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        for sql in SQLITE_FTS_DROP_SQL:
+            schema_editor.execute(sql)
+    elif vendor == 'postgresql':
+        schema_editor.execute(f"DROP INDEX IF EXISTS {PG_INDEX_NAME}")
+
+
+def search_terms(query):
+    """Split user input into plain word tokens (drops FTS operators and punctuation)"""
+    return re.findall(r'\w+', query.lower())[:16]
+
+
+class BaseSearchBackend:
+    """search() returns SearchHit tuples, most relevant first"""
+
+    def search(self, query, category=None, limit=100):
+        raise NotImplementedError
+
+
+class LikeSearchBackend(BaseSearchBackend):
+    """Original icontains query: unranked, no snippets"""
+
+    def search(self, query, category=None, limit=100):
+        qs = NewsArticle.objects.filter(Q(title__icontains=query) | Q(description__icontains=query))
+        if category:
+            qs = qs.filter(category=category)
+        ids = qs.order_by('-published_date').values_list('id', flat=True)[:limit]
+        return [SearchHit(article_id, None, None) for article_id in ids]
+
+
+class SQLiteFTSBackend(BaseSearchBackend):
+    """FTS5 MATCH with bm25() ranking (title weighted above description)"""
+
+    def search(self, query, category=None, limit=100):
+        terms = search_terms(query)
+        if not terms:
+            return []
+        # Every term must match; the last one as a prefix so results follow typing
+        match = ' '.join(f'"{t}"' for t in terms[:-1])
+        match = f'{match} "{terms[-1]}"*'.strip()
+
+        sql = (
+            f"SELECT f.rowid, bm25({FTS_TABLE}, 10.0, 1.0) AS rank, "
+            f"snippet({FTS_TABLE}, 1, '<mark>', '</mark>', '…', {SNIPPET_WORDS}) "
+            f"FROM {FTS_TABLE} f "
+        )
+        params = [match]
+        if category:
+            sql += f"JOIN {ARTICLE_TABLE} a ON a.id = f.rowid WHERE {FTS_TABLE} MATCH %s AND a.category = %s "
+            params.append(category)
+        else:
+            sql += f"WHERE {FTS_TABLE} MATCH %s "
+        sql += "ORDER BY rank LIMIT %s"
+        params.append(limit)
+
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return [SearchHit(*row) for row in cursor.fetchall()]
+
+
+class PostgresSearchBackend(BaseSearchBackend):
+    """tsvector @@ websearch_to_tsquery over the GIN-indexed document expression"""
+
+    def search(self, query, category=None, limit=100):
+        if not search_terms(query):
+            return []
+        sql = (
+            f"SELECT a.id, ts_rank_cd({PG_DOCUMENT_SQL}, q) AS rank, "
+            f"ts_headline('{PG_SEARCH_CONFIG}', a.description, q, "
+            f"'StartSel=<mark>, StopSel=</mark>, MaxWords={SNIPPET_WORDS}, MinWords=6') "
+            f"FROM {ARTICLE_TABLE} a, websearch_to_tsquery('{PG_SEARCH_CONFIG}', %s) q "
+            f"WHERE {PG_DOCUMENT_SQL} @@ q "
+        )
+        params = [query]
+        if category:
+            sql += "AND a.category = %s "
+            params.append(category)
+        sql += "ORDER BY rank DESC LIMIT %s"
+        params.append(limit)
+
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return [SearchHit(*row) for row in cursor.fetchall()]
+
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def _sqlite_fts_available():
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s", [FTS_TABLE])
+        return cursor.fetchone() is not None
+
+
+def get_search_backend():
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            path = getattr(settings, 'NEWSIFY_SEARCH_BACKEND', None)
+            if path:
+                _backend = import_string(path)()
+            elif connection.vendor == 'sqlite' and _sqlite_fts_available():
+                _backend = SQLiteFTSBackend()
+            elif connection.vendor == 'postgresql':
+                _backend = PostgresSearchBackend()
+            else:
+                _backend = LikeSearchBackend()
+        return _backend
+
+
+def search_articles(query, category=None, limit=100):
+    """Relevance-ranked SearchHits for a user query"""
+    return get_search_backend().search(query, category=category, limit=limit)
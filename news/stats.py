@@ -0,0 +1,194 @@
+import threading
+import time
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_save, post_delete
+from django.utils import timezone
+
+from .buffers import DeltaBuffer
+from .models import (
+    NewsArticle, Vote, Comment, UserPreference, Poll, PollOption, UserProfile, StatCounter,
+)
+
+# ==================== MATERIALIZED STATS ====================
+# /api/stats/ and the dashboard used to run a COUNT(*) per table on every hit.
+# Counts now live in StatCounter rows. The write paths (signals below, plus the
+# bulk ingest and poll vote paths, which bypass signals) add +/-1 deltas after
+# their transaction commits. Deltas go through a DeltaBuffer so a burst of votes
+# doesn't turn the 'votes' row into a hot lock. Reads are served from a
+# process-local copy at most NEWSIFY_STATS_MAX_AGE seconds old.
+#
+# `manage.py rebuild_stats` recomputes everything from the real tables; run it
+# after bulk data changes or periodically to correct any drift.
+
+DEFAULT_STATS_MAX_AGE = 30  # seconds
+
+COUNTER_MODELS = {
+    'total_articles': NewsArticle,
+    'total_votes': Vote,
+    'total_comments': Comment,
+    'active_users': UserPreference,
+    'total_users': User,
+    'total_profiles': UserProfile,
+    'total_polls': Poll,
+}
+POLL_VOTES = 'total_poll_votes'
+CATEGORY_PREFIX = 'category:'
+
+
+def category_counter(category):
+    return f'{CATEGORY_PREFIX}{category}'
+
+
+def _apply_deltas(batch):
+    groups = {}
+    for name, deltas in batch.items():
+        groups.setdefault(deltas.get('value', 0), []).append(name)
+    groups.pop(0, None)
+    if not groups:
+        return
+    now = timezone.now()
+    with transaction.atomic():
+        # A counter first seen since the last rebuild (a new category) has no row yet
+        StatCounter.objects.bulk_create(
+            [StatCounter(name=name, value=0, updated_at=now) for names in groups.values() for name in names],
+            ignore_conflicts=True,
+        )
+        for delta, names in groups.items():
+            StatCounter.objects.filter(name__in=names).update(value=F('value') + delta, updated_at=now)
+
+
+counter_buffer = DeltaBuffer('stat-counters', _apply_deltas, interval=2.0)
+
+
+def write_behind_enabled():
+    return getattr(settings, 'NEWSIFY_STATS_WRITE_BEHIND', True)
+
+
+def increment(name, delta=1):
+    """Add to a counter once the current transaction (if any) commits"""
+    if not delta:
+        return
+    if write_behind_enabled():
+        transaction.on_commit(lambda: counter_buffer.add(name, value=delta))
+    else:
+        transaction.on_commit(lambda: _apply_deltas({name: {'value': delta}}))
+
+
+def rebuild_counters():
+    """Recompute every counter from the source tables"""
+    values = {name: model.objects.count() for name, model in COUNTER_MODELS.items()}
+    values[POLL_VOTES] = PollOption.objects.aggregate(total=Coalesce(Sum('votes'), 0))['total']
+
+    for category, _ in NewsArticle.CATEGORY_CHOICES:
+        values[category_counter(category)] = 0
+    for row in NewsArticle.objects.values('category').annotate(count=Count('id')):
+        values[category_counter(row['category'])] = row['count']
+
+    # Drop queued deltas: the fresh counts already include them
+    counter_buffer.flush()
+    now = timezone.now()
+    with transaction.atomic():
+        StatCounter.objects.all().delete()
+        StatCounter.objects.bulk_create(
+            [StatCounter(name=name, value=value, updated_at=now) for name, value in values.items()]
+        )
+    _cache.clear()
+    return values
+
+
+class _StatsCache:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values = None
+        self._loaded_at = 0.0
+
+    def clear(self):
+        with self._lock:
+            self._values = None
+
+    def get(self, max_age):
+        with self._lock:
+            if self._values is not None and time.monotonic() - self._loaded_at < max_age:
+                return self._values
+        values = dict(StatCounter.objects.values_list('name', 'value'))
+        if not values:
+            values = rebuild_counters()
+        with self._lock:
+            self._values = values
+            self._loaded_at = time.monotonic()
+        return values
+
+
+_cache = _StatsCache()
+
+
+def get_site_stats():
+    """
+    Site-wide stats in the /api/stats/ shape, at most NEWSIFY_STATS_MAX_AGE
+    seconds stale.
+    """
+    values = _cache.get(getattr(settings, 'NEWSIFY_STATS_MAX_AGE', DEFAULT_STATS_MAX_AGE))
+    stats = {name: values.get(name, 0) for name in COUNTER_MODELS}
+    stats[POLL_VOTES] = values.get(POLL_VOTES, 0)
+    stats['by_category'] = {
+        name[len(CATEGORY_PREFIX):]: value
+        for name, value in values.items()
+        if name.startswith(CATEGORY_PREFIX) and value > 0
+    }
+    return stats
+
+
+# -------------------- SIGNALS --------------------
+# Connected from NewsConfig.ready(). Bulk operations (bulk_create, update) skip
+# signals, so those paths call increment() themselves.
+
+def _count_created(name):
+    def handler(sender, instance, created, raw=False, **kwargs):
+        if created and not raw:
+            increment(name)
+    return handler
+
+
+def _count_deleted(name):
+    def handler(sender, instance, **kwargs):
+        increment(name, -1)
+    return handler
+
+
+def _article_created(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        increment(category_counter(instance.category))
+
+
+def _article_deleted(sender, instance, **kwargs):
+    increment(category_counter(instance.category), -1)
+
+
+def _poll_option_deleted(sender, instance, **kwargs):
+    increment(POLL_VOTES, -instance.votes)
+
+
+def _poll_option_created(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        increment(POLL_VOTES, instance.votes)
+
+
+_handlers = []
+
+
+def connect_signals():
+    for name, model in COUNTER_MODELS.items():
+        for signal, factory in ((post_save, _count_created), (post_delete, _count_deleted)):
+            handler = factory(name)
+            _handlers.append(handler)  # signals hold weak references
+            signal.connect(handler, sender=model, dispatch_uid=f'stats-{name}-{signal is post_save}')
+
+    post_save.connect(_article_created, sender=NewsArticle, dispatch_uid='stats-article-category-created')
+    post_delete.connect(_article_deleted, sender=NewsArticle, dispatch_uid='stats-article-category-deleted')
+    post_save.connect(_poll_option_created, sender=PollOption, dispatch_uid='stats-poll-option-created')
+    post_delete.connect(_poll_option_deleted, sender=PollOption, dispatch_uid='stats-poll-option-deleted')
@@ -0,0 +1,27 @@
+from django.test.runner import DiscoverRunner
+from django.test.utils import override_settings
+
+from .buffers import discard_all
+
+
+class NewsifyTestRunner(DiscoverRunner):
+    """
+    Write-behind buffers flush from a background thread and again at exit, by
+    which time the test database is gone and the flush would go to the real
+    one. Stat counters are written directly while tests run, and every buffer
+    is discarded before the test databases are destroyed. Tests that exercise
+    a buffer flush it themselves.
+    """
+
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self._buffer_settings = override_settings(NEWSIFY_STATS_WRITE_BEHIND=False)
+        self._buffer_settings.enable()
+
+    def teardown_databases(self, old_config, **kwargs):
+        discard_all()
+        super().teardown_databases(old_config, **kwargs)
+
+    def teardown_test_environment(self, **kwargs):
+        self._buffer_settings.disable()
+        super().teardown_test_environment(**kwargs)
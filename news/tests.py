@@ -1,3 +1,1439 @@
-from django.test import TestCase
+import asyncio
+import json
+import threading
+import time
+from collections import defaultdict
+from datetime import timedelta
+from functools import partial
+from io import StringIO
+from tempfile import TemporaryDirectory
+from unittest.mock import Mock, patch
 
-# Create your tests here.
+import requests
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.contrib.sessions.models import Session
+from django.core.management import call_command
+from django.db import DatabaseError, IntegrityError, transaction
+from django.db.models import QuerySet
+from django.urls import reverse
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+
+from .async_views import in_thread
+from .buffers import DeltaBuffer
+from .dedup import index_articles
+from .events import ArticlePoller, EventBroker, Subscription, event_broker
+from .feed_cache import bump_version, current_versions, get_feed_cache
+from .http_client import BREAKER_RESET, CircuitBreaker, CircuitOpenError, HttpClient
+from .http_cache import MemoryResponseCache, QuotaAccountant, cached_get_json
+from .impressions import MAX_BEACON_ARTICLES, SeenSet, read_buffer, view_buffer
+from .ingest import (
+    IngestSchedule, claim_next_job, enqueue_refresh, job_status, requeue_interrupted_jobs, run_job,
+)
+from .linkcheck import (
+    BASE_CHECK_INTERVAL, FAILURE_RETRY_INTERVAL, MAX_CHECK_INTERVAL, HostScheduler, next_check_delay,
+)
+from .models import (
+    ArticleSignature, Comment, IngestJob, NewsArticle, Poll, PollOption, PollVote, StatCounter, UserPreference,
+    UserProfile, Vote,
+)
+from .pagination import InvalidCursor, feed_page
+from .pipeline import Pipeline, Stage
+from .polls import (
+    build_polls_payload, cast_poll_vote, get_polls_payload, invalidate_polls_cache, poll_vote_buffer,
+)
+from .preferences import PreferenceLRU, preference_cache
+from .ranking import feed_ranker
+from .search import SQLiteFTSBackend, _sqlite_fts_available
+from .scoring import CandidateColumns, is_trending, score_batch, top_k
+from .scraper import (
+    build_ingest_pipeline, duplicates_skipped, ingest_articles, insert_new_rows, new_ingest_stats,
+    normalize_article, save_articles_bulk,
+)
+from .stats import category_counter, get_site_stats, increment, rebuild_counters
+from .views import COMMENT_PREVIEW_LIMIT, build_archived_body, calculate_personalized_score, get_comment_previews
+from .votes import apply_counter_deltas, cast_vote, vote_buffer
+
+
+def make_article(n, **fields):
+    fields.setdefault('title', f'Article {n}')
+    fields.setdefault('description', f'Description of article {n}')
+    fields.setdefault('category', 'technology')
+    fields.setdefault('source', 'tests')
+    fields.setdefault('source_url', f'https://tests.invalid/{n}')
+    return NewsArticle.objects.create(**fields)
+
+
+# ==================== BULK INGEST ====================
+
+def provider_article(n, **fields):
+    """Article dict in the shape the providers return"""
+    return dict({
+        'url': f'https://provider.invalid/{n}',
+        'title': f'Provider story {n}',
+        'description': f'What happened in provider story {n}',
+        'source': {'name': 'Reuters'},
+        'publishedAt': '2026-10-01T12:00:00Z',
+    }, **fields)
+
+
+class BulkIngestTests(TestCase):
+    def test_only_new_urls_are_inserted(self):
+        make_article(1, source_url='https://provider.invalid/1')
+        articles = [provider_article(1), provider_article(2), provider_article(2), provider_article(3, title='')]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            saved = save_articles_bulk(articles, 'technology')
+
+        self.assertEqual([article.source_url for article in saved], ['https://provider.invalid/2'])
+        self.assertEqual(NewsArticle.objects.count(), 2)
+        # bulk_create skips post_save, so the bulk path counts its own rows
+        self.assertEqual(StatCounter.objects.get(name='total_articles').value, 1)
+        self.assertEqual(StatCounter.objects.get(name=category_counter('technology')).value, 1)
+
+    def test_url_inserted_after_lookup_is_skipped(self):
+        rows = {}
+        for n in (1, 2):
+            fields = normalize_article(provider_article(n), 'technology')
+            rows[fields['source_url']] = fields
+        # Another fetcher stores URL 1 between our lookup and our insert
+        make_article(1, source_url='https://provider.invalid/1')
+
+        saved = insert_new_rows(rows, list(rows))
+
+        self.assertEqual([article.source_url for article in saved], ['https://provider.invalid/2'])
+        self.assertEqual(NewsArticle.objects.filter(source_url='https://provider.invalid/1').count(), 1)
+
+
+# ==================== LINK CHECKS ====================
+
+class HostSchedulerTests(SimpleTestCase):
+    def run_calls(self, scheduler, hosts, calls_per_host, duration):
+        lock = threading.Lock()
+        running = defaultdict(int)
+        peak = defaultdict(int)
+        starts = defaultdict(list)
+
+        def call(host):
+            with lock:
+                running[host] += 1
+                peak[host] = max(peak[host], running[host])
+                starts[host].append(time.monotonic())
+            time.sleep(duration)
+            with lock:
+                running[host] -= 1
+
+        for _ in range(calls_per_host):
+            for host in hosts:
+                scheduler.submit(host, partial(call, host))
+        scheduler.close()
+        return peak, starts
+
+    def test_per_host_cap(self):
+        scheduler = HostScheduler(max_workers=8, per_host=2, interval=0)
+        peak, starts = self.run_calls(scheduler, ['a.invalid', 'b.invalid'], 6, duration=0.05)
+        self.assertEqual(dict(peak), {'a.invalid': 2, 'b.invalid': 2})
+        self.assertEqual({host: len(times) for host, times in starts.items()}, {'a.invalid': 6, 'b.invalid': 6})
+
+    def test_gap_between_starts_on_one_host(self):
+        scheduler = HostScheduler(max_workers=8, per_host=4, interval=0.05)
+        _, starts = self.run_calls(scheduler, ['a.invalid'], 4, duration=0)
+        gaps = [later - earlier for earlier, later in zip(starts['a.invalid'], starts['a.invalid'][1:])]
+        # Some slack for thread start-up; without the gap they would all start at once
+        self.assertGreater(min(gaps), 0.03)
+
+
+def fake_probe(url, **kwargs):
+    return 404 if '//dead.' in url else 200
+
+
+class CleanupArticlesTests(TestCase):
+    def setUp(self):
+        self.live = make_article(1, source_url='https://live.invalid/1')
+        self.dead = make_article(2, source_url='https://dead.invalid/2')
+
+    def cleanup(self, **options):
+        with patch('news.linkcheck.probe_article_url', side_effect=fake_probe) as probe:
+            call_command('cleanup_articles', host_interval=0, stdout=StringIO(), **options)
+        return sorted(call.args[0] for call in probe.call_args_list)
+
+    def test_dead_link_is_deleted_and_feed_refreshed(self):
+        versions = current_versions()
+        checked = self.cleanup(max_failures=1)
+
+        self.assertEqual(checked, [self.dead.source_url, self.live.source_url])
+        self.assertFalse(NewsArticle.objects.filter(id=self.dead.id).exists())
+        self.assertTrue(NewsArticle.objects.filter(id=self.live.id).exists())
+        self.assertNotEqual(current_versions(), versions)
+
+    def test_only_due_articles_are_checked(self):
+        NewsArticle.objects.filter(id=self.live.id).update(link_next_check=timezone.now() + timedelta(days=1))
+        self.assertEqual(self.cleanup(max_failures=2), [self.dead.source_url])
+        self.assertEqual(self.cleanup(max_failures=2, all=True), [self.dead.source_url, self.live.source_url])
+
+    def test_failures_must_repeat_before_delete(self):
+        self.cleanup(max_failures=2)
+        self.dead.refresh_from_db()
+        self.assertEqual((self.dead.link_failures, self.dead.link_status), (1, 404))
+        self.assertGreater(self.dead.link_next_check, timezone.now())
+
+        # Not due again yet
+        self.assertEqual(self.cleanup(max_failures=2), [])
+        self.assertTrue(NewsArticle.objects.filter(id=self.dead.id).exists())
+
+        self.cleanup(max_failures=2, all=True)
+        self.assertFalse(NewsArticle.objects.filter(id=self.dead.id).exists())
+
+    def test_dry_run_changes_nothing(self):
+        versions = current_versions()
+        self.cleanup(max_failures=1, dry_run=True)
+
+        for article in (self.live, self.dead):
+            article.refresh_from_db()
+            self.assertIsNone(article.link_checked_at)
+            self.assertIsNone(article.link_next_check)
+            self.assertEqual((article.link_failures, article.link_successes), (0, 0))
+        self.assertEqual(current_versions(), versions)
+
+
+class CheckScheduleTests(SimpleTestCase):
+    def test_stable_links_are_checked_less_often(self):
+        now = timezone.now()
+        delays = [next_check_delay(now, successes, 0, now) for successes in range(1, 10)]
+        self.assertEqual(delays[0], BASE_CHECK_INTERVAL)
+        self.assertEqual(delays, sorted(delays))
+        self.assertEqual(delays[-1], MAX_CHECK_INTERVAL)
+        # Older articles wait longer at the same record
+        self.assertGreater(next_check_delay(now - timedelta(days=14), 1, 0, now), BASE_CHECK_INTERVAL)
+
+    def test_failures_retry_soon(self):
+        now = timezone.now()
+        self.assertEqual(next_check_delay(now, 0, 1, now), FAILURE_RETRY_INTERVAL)
+        self.assertEqual(next_check_delay(now, 0, 2, now), FAILURE_RETRY_INTERVAL * 2)
+        self.assertEqual(next_check_delay(now, 0, 10, now), BASE_CHECK_INTERVAL)
+
+
+# ==================== PROVIDER RESPONSE CACHE ====================
+
+def provider_response(status_code, data=None, etag=None):
+    response = Mock(status_code=status_code, headers={'ETag': etag} if etag else {})
+    response.json.return_value = data
+    return response
+
+
+class ProviderCacheTests(SimpleTestCase):
+    def setUp(self):
+        directory = TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.quota_path = f'{directory.name}/quota.json'
+        self.quota = QuotaAccountant(quotas={'Provider': 2}, path=self.quota_path)
+        self.cache = MemoryResponseCache()
+        self.client = Mock()
+        self.client.is_open.return_value = False
+        for target, value in (('get_response_cache', self.cache), ('get_quota_accountant', self.quota),
+                              ('get_http_client', self.client)):
+            patcher = patch(f'news.http_cache.{target}', return_value=value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def fetch(self):
+        return cached_get_json('Provider', 'https://provider.invalid/news', {'page': 1})
+
+    def expire(self):
+        for entry in self.cache._entries.values():
+            entry['stored_at'] = 0
+
+    def test_quota_is_shared_through_the_file(self):
+        self.assertTrue(self.quota.try_consume('Provider'))
+        # Another process (the daemon, a manual fetch) spends the same budget
+        other = QuotaAccountant(quotas={'Provider': 2}, path=self.quota_path)
+        self.assertTrue(other.try_consume('Provider'))
+        self.assertFalse(self.quota.try_consume('Provider'))
+        self.assertEqual(self.quota.remaining('Provider'), 0)
+        self.assertIsNone(self.quota.remaining('Unlimited'))
+
+    def test_fresh_hit_then_conditional_revalidation(self):
+        self.client.get.return_value = provider_response(200, {'articles': ['a']}, etag='"v1"')
+        self.assertEqual(self.fetch(), {'articles': ['a']})
+        self.assertEqual(self.fetch(), {'articles': ['a']})
+        self.assertEqual(self.client.get.call_count, 1)
+
+        self.expire()
+        self.client.get.return_value = provider_response(304)
+        self.assertEqual(self.fetch(), {'articles': ['a']})
+        self.assertEqual(self.client.get.call_args.kwargs['headers'], {'If-None-Match': '"v1"'})
+        # The 304 renewed the entry
+        self.assertEqual(self.fetch(), {'articles': ['a']})
+        self.assertEqual(self.client.get.call_count, 2)
+
+    def test_spent_quota_serves_the_stale_entry(self):
+        self.client.get.return_value = provider_response(200, {'articles': ['a']})
+        self.fetch()
+        self.quota.try_consume('Provider')
+        self.expire()
+
+        self.assertEqual(self.fetch(), {'articles': ['a']})
+        self.assertEqual(self.client.get.call_count, 1)
+
+
+# ==================== BATCH SCORING ====================
+
+class BatchScoringTests(SimpleTestCase):
+    def setUp(self):
+        self.now = timezone.now()
+        categories = ['technology', 'sports', 'world', 'no-such-category']
+        self.articles = [
+            NewsArticle(
+                id=i + 1,
+                category=categories[i % len(categories)],
+                published_date=self.now - timedelta(hours=i * 7, microseconds=i * 123457),
+                upvotes=(i * 37) % 300,
+                views=(i * 1009) % 5000,
+                credibility_score=5 + i % 6,
+            )
+            for i in range(60)
+        ]
+        self.columns = CandidateColumns.from_rows(
+            (a.id, a.category, a.published_date, a.upvotes, a.views, a.credibility_score) for a in self.articles
+        )
+        self.prefs = {'technology': 9, 'sports': 2}
+
+    def expected(self):
+        return [calculate_personalized_score(article, self.prefs, self.now) for article in self.articles]
+
+    def best(self, k, after=None):
+        ranked = sorted(zip(self.expected(), (a.id for a in self.articles)), reverse=True)
+        if after is not None:
+            ranked = [(score, article_id) for score, article_id in ranked if (score, article_id) < after]
+        return [(article_id, score) for score, article_id in ranked[:k]]
+
+    def test_scores_match_the_per_article_formula(self):
+        scores = score_batch(self.columns, self.prefs, self.now)
+        self.assertEqual([float(score) for score in scores], self.expected())
+
+    def test_pure_python_path_matches(self):
+        with patch('news.scoring.np', None):
+            columns = CandidateColumns.from_rows(
+                (a.id, a.category, a.published_date, a.upvotes, a.views, a.credibility_score) for a in self.articles
+            )
+            self.assertEqual(score_batch(columns, self.prefs, self.now), self.expected())
+            self.assertEqual(top_k(columns, self.prefs, self.now, k=10), self.best(10))
+
+    def test_top_k_pages(self):
+        first = top_k(self.columns, self.prefs, self.now, k=10)
+        self.assertEqual([(article_id, float(score)) for article_id, score in first], self.best(10))
+
+        after = (first[-1][1], first[-1][0])
+        second = top_k(self.columns, self.prefs, self.now, k=10, after=after)
+        self.assertEqual([(article_id, float(score)) for article_id, score in second], self.best(10, after))
+
+    def test_trending(self):
+        self.assertTrue(is_trending(51, 0))
+        self.assertTrue(is_trending(21, 6))
+        self.assertFalse(is_trending(21, 5))
+        self.assertFalse(is_trending(20, 100))
+
+
+# ==================== FULL-TEXT SEARCH ====================
+
+class FullTextSearchTests(TestCase):
+    def setUp(self):
+        # The test database ran every migration, so this also checks that the
+        # ones rebuilding news_newsarticle reinstalled the triggers
+        if not _sqlite_fts_available():
+            self.skipTest('SQLite without FTS5')
+        self.backend = SQLiteFTSBackend()
+        self.in_title = make_article(1, title='Quantum processor breaks a record',
+                                     description='Researchers reported the result on Monday.')
+        self.in_description = make_article(2, title='Weekly science roundup',
+                                           description='Also this week: a quantum processor from another lab.')
+
+    def search(self, query, **kwargs):
+        return [hit.article_id for hit in self.backend.search(query, **kwargs)]
+
+    def test_title_matches_rank_first(self):
+        self.assertEqual(self.search('quantum processor'), [self.in_title.id, self.in_description.id])
+        self.assertEqual(self.search('roundup quantum'), [self.in_description.id])
+        self.assertIn('<mark>', self.backend.search('monday')[0].snippet)
+
+    def test_last_term_is_a_prefix(self):
+        self.assertEqual(set(self.search('quant')), {self.in_title.id, self.in_description.id})
+
+    def test_operators_are_plain_words(self):
+        self.assertEqual(self.search('quantum" (roundup'), [self.in_description.id])
+        self.assertEqual(self.search('"*'), [])
+
+    def test_category_filter(self):
+        self.assertEqual(self.search('quantum', category='sports'), [])
+        self.assertEqual(len(self.search('quantum', category='technology')), 2)
+
+    def test_index_follows_updates_and_deletes(self):
+        NewsArticle.objects.filter(id=self.in_title.id).update(title='Photonic chip breaks a record')
+        self.assertEqual(self.search('photonic'), [self.in_title.id])
+        self.assertEqual(self.search('quantum'), [self.in_description.id])
+
+        self.in_description.delete()
+        self.assertEqual(self.search('quantum'), [])
+
+
+# ==================== VOTE COUNTERS ====================
+
+@override_settings(NEWSIFY_VOTE_WRITE_BEHIND=False)
+class VoteCounterTests(TestCase):
+    def setUp(self):
+        self.article = make_article(1)
+
+    def assertCounts(self, upvotes, downvotes):
+        self.article.refresh_from_db()
+        self.assertEqual((self.article.upvotes, self.article.downvotes), (upvotes, downvotes))
+        self.assertEqual(Vote.objects.filter(article=self.article, vote_type='up').count(), upvotes)
+        self.assertEqual(Vote.objects.filter(article=self.article, vote_type='down').count(), downvotes)
+        self.assertEqual(self.article.engagement, upvotes + self.article.views + self.article.comment_count)
+
+    def test_vote_toggle_and_switch(self):
+        article, user_vote = cast_vote(self.article.id, 's1', 'up')
+        self.assertEqual((article.upvotes, user_vote), (1, 'up'))
+        self.assertCounts(1, 0)
+
+        # Same button again removes the vote
+        article, user_vote = cast_vote(self.article.id, 's1', 'up')
+        self.assertEqual((article.upvotes, user_vote), (0, None))
+        self.assertCounts(0, 0)
+
+        cast_vote(self.article.id, 's1', 'down')
+        cast_vote(self.article.id, 's2', 'up')
+        article, user_vote = cast_vote(self.article.id, 's1', 'up')
+        self.assertEqual((article.upvotes, article.downvotes, user_vote), (2, 0, 'up'))
+        self.assertCounts(2, 0)
+
+    def test_missing_article(self):
+        with self.assertRaises(NewsArticle.DoesNotExist):
+            cast_vote(self.article.id + 1000, 's1', 'up')
+        self.assertFalse(Vote.objects.exists())
+
+
+# Write-behind flushes may run on the buffer's own thread, which needs to see
+# committed rows, hence TransactionTestCase
+@override_settings(NEWSIFY_VOTE_WRITE_BEHIND=True)
+class BufferedVoteCounterTests(TransactionTestCase):
+    def tearDown(self):
+        vote_buffer.flush()
+
+    def test_counts_match_vote_rows_after_flush(self):
+        article = make_article(1)
+        for session_id, vote_type in [('s1', 'up'), ('s2', 'up'), ('s3', 'down'), ('s1', 'down'), ('s2', 'up')]:
+            served, _ = cast_vote(article.id, session_id, vote_type)
+
+        # Read-your-writes before the flush
+        self.assertEqual((served.upvotes, served.downvotes), (0, 2))
+
+        vote_buffer.flush()
+        article.refresh_from_db()
+        self.assertEqual(article.upvotes, Vote.objects.filter(article=article, vote_type='up').count())
+        self.assertEqual(article.downvotes, Vote.objects.filter(article=article, vote_type='down').count())
+        self.assertEqual((article.upvotes, article.downvotes, article.engagement), (0, 2, 0))
+
+
+# ==================== COMMENT PREVIEWS ====================
+
+class CommentPreviewTests(TestCase):
+    def setUp(self):
+        self.article = make_article(1)
+        self.quiet = make_article(2)
+
+    def test_latest_comments_per_article(self):
+        for i in range(COMMENT_PREVIEW_LIMIT + 2):
+            Comment.objects.create(article=self.article, session_id='s1', text=f'comment {i}')
+        other = make_article(3)
+        Comment.objects.create(article=other, session_id='s1', text='elsewhere')
+
+        previews = get_comment_previews([self.article.id, self.quiet.id])
+
+        self.assertEqual(list(previews), [self.article.id])
+        self.assertEqual(
+            [comment['text'] for comment in previews[self.article.id]],
+            [f'comment {i}' for i in range(COMMENT_PREVIEW_LIMIT + 1, 1, -1)],
+        )
+        self.assertEqual(get_comment_previews([]), {})
+
+    def test_comment_count_follows_comments(self):
+        comments = [Comment.objects.create(article=self.article, session_id='s1', text=f'c{i}') for i in range(3)]
+        self.article.refresh_from_db()
+        self.assertEqual((self.article.comment_count, self.article.engagement), (3, 3))
+
+        comments[0].delete()
+        self.article.refresh_from_db()
+        self.assertEqual((self.article.comment_count, self.article.engagement), (2, 2))
+
+        # Never below zero, even after the counter was reset by hand
+        NewsArticle.objects.filter(id=self.article.id).update(comment_count=0)
+        comments[1].delete()
+        self.article.refresh_from_db()
+        self.assertEqual(self.article.comment_count, 0)
+
+
+# ==================== CURSOR PAGINATION ====================
+
+class FeedCursorTests(TestCase):
+    def setUp(self):
+        self.now = timezone.now()
+        # More than one ranking window, so paging crosses into the chronological tail
+        self.articles = [
+            make_article(i, published_date=self.now - timedelta(hours=i), upvotes=i % 7)
+            for i in range(130)
+        ]
+        self.duplicate = make_article(
+            'dup', published_date=self.now - timedelta(minutes=30), duplicate_of=self.articles[0]
+        )
+        feed_ranker.invalidate()
+
+    def tearDown(self):
+        feed_ranker.invalidate()
+
+    def collect(self, category, page_size=30):
+        seen = []
+        page, cursor = feed_page(category, {}, page_size=page_size, now=self.now)
+        seen.extend(article.id for article, _ in page)
+        while cursor:
+            page, cursor = feed_page(category, {}, cursor=cursor, page_size=page_size)
+            seen.extend(article.id for article, _ in page)
+        return seen
+
+    def test_pages_cover_feed_without_overlap(self):
+        seen = self.collect('all')
+        self.assertEqual(len(seen), len(set(seen)))
+        self.assertEqual(set(seen), {article.id for article in self.articles})
+        self.assertNotIn(self.duplicate.id, seen)
+
+    def test_tampered_cursor(self):
+        _, cursor = feed_page('all', {}, page_size=30, now=self.now)
+        with self.assertRaises(InvalidCursor):
+            feed_page('all', {}, cursor=cursor[:-2] + ('A' if cursor[-2] != 'A' else 'B') + cursor[-1])
+        with self.assertRaises(InvalidCursor):
+            feed_page('all', {}, cursor='not-a-cursor')
+
+    def test_cursor_from_another_feed(self):
+        _, cursor = feed_page('technology', {}, page_size=30, now=self.now)
+        with self.assertRaises(InvalidCursor):
+            feed_page('sports', {}, cursor=cursor)
+
+
+# ==================== MATERIALIZED STATS ====================
+
+class StatCounterTests(TestCase):
+    def counter(self, name):
+        return StatCounter.objects.filter(name=name).values_list('value', flat=True).first()
+
+    def test_signals_count_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            article = make_article(1, category='sports')
+        self.assertEqual((self.counter('total_articles'), self.counter(category_counter('sports'))), (1, 1))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            article.delete()
+        self.assertEqual((self.counter('total_articles'), self.counter(category_counter('sports'))), (0, 0))
+
+    def test_rolled_back_writes_are_not_counted(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    make_article(1)
+                    raise RuntimeError('roll back')
+            except RuntimeError:
+                pass
+        self.assertIsNone(self.counter('total_articles'))
+
+    def test_counter_without_a_row_is_created(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            increment(category_counter('brand-new'), 2)
+            increment('total_votes', 0)
+        self.assertEqual(self.counter(category_counter('brand-new')), 2)
+        self.assertIsNone(self.counter('total_votes'))
+
+    def test_rebuild_matches_the_tables(self):
+        make_article(1)
+        make_article(2, category='sports')
+        StatCounter.objects.create(name='total_articles', value=40)
+
+        self.assertEqual(rebuild_counters()['total_articles'], 2)
+        stats = get_site_stats()
+        self.assertEqual(stats['total_articles'], 2)
+        self.assertEqual(stats['by_category'], {'technology': 1, 'sports': 1})
+
+
+class DeltaBufferTests(SimpleTestCase):
+    def make_buffer(self, flush_func):
+        buffer = DeltaBuffer('tests', flush_func, interval=60)
+        self.addCleanup(buffer.discard)
+        return buffer
+
+    def test_deltas_are_summed_per_key(self):
+        batches = []
+        buffer = self.make_buffer(batches.append)
+        buffer.add('a', up=1)
+        buffer.add('a', up=2, down=1)
+        buffer.add('b', up=0)
+        self.assertEqual(buffer.pending('a'), {'up': 3, 'down': 1})
+
+        self.assertEqual(buffer.flush(), 1)
+        self.assertEqual(batches, [{'a': {'up': 3, 'down': 1}}])
+        self.assertEqual(buffer.pending('a'), {})
+
+    def test_failed_flush_is_retried(self):
+        batches = []
+
+        def flaky(batch):
+            batches.append(batch)
+            if len(batches) == 1:
+                raise RuntimeError('database is locked')
+
+        buffer = self.make_buffer(flaky)
+        buffer.add('a', up=1)
+        self.assertEqual(buffer.flush(), 0)
+        self.assertEqual(buffer.pending('a'), {'up': 1})
+        buffer.add('a', up=1)
+        self.assertEqual(buffer.flush(), 1)
+        self.assertEqual(batches[-1], {'a': {'up': 2}})
+
+    def test_discarded_buffer_never_flushes(self):
+        batches = []
+        buffer = self.make_buffer(batches.append)
+        buffer.add('a', up=1)
+        buffer.discard()
+        buffer.add('a', up=1)
+        buffer.stop()  # what atexit would run
+        self.assertEqual(batches, [])
+        self.assertEqual(buffer.pending('a'), {})
+
+
+# ==================== POLLS ====================
+
+class PollPayloadTests(TestCase):
+    def setUp(self):
+        invalidate_polls_cache()
+        self.addCleanup(invalidate_polls_cache)
+        for i in range(3):
+            poll = Poll.objects.create(question=f'Question {i}')
+            PollOption.objects.create(poll=poll, text='Yes', votes=i * 3 + 1)
+            PollOption.objects.create(poll=poll, text='No', votes=i)
+        Poll.objects.create(question='Closed', is_active=False)
+
+    def test_two_queries_for_any_number_of_polls(self):
+        with self.assertNumQueries(2):
+            payload = build_polls_payload()
+
+        self.assertEqual([poll['question'] for poll in payload], ['Question 0', 'Question 1', 'Question 2'])
+        percentages = [{option['text']: option['percentage'] for option in poll['options']} for poll in payload]
+        self.assertEqual(percentages[0], {'Yes': 100.0, 'No': 0.0})
+        self.assertEqual(percentages[2], {'Yes': 77.8, 'No': 22.2})
+        self.assertEqual([poll['total_votes'] for poll in payload], [1, 5, 9])
+
+    def test_admin_edits_invalidate_the_cached_payload(self):
+        get_polls_payload()
+        with self.assertNumQueries(0):
+            get_polls_payload()
+
+        option = PollOption.objects.get(poll__question='Question 1', text='No')
+        option.text = 'Maybe'
+        option.save()
+        texts = [option['text'] for poll in get_polls_payload() for option in poll['options']]
+        self.assertIn('Maybe', texts)
+
+
+class PollVoteCounterTests(TransactionTestCase):
+    def setUp(self):
+        self.poll = Poll.objects.create(question='Tabs or spaces?')
+        self.tabs = PollOption.objects.create(poll=self.poll, text='Tabs')
+        self.spaces = PollOption.objects.create(poll=self.poll, text='Spaces')
+
+    def tearDown(self):
+        poll_vote_buffer.flush()
+        invalidate_polls_cache()
+
+    def assertCountersMatchVotes(self):
+        counters = dict(PollOption.objects.filter(poll=self.poll).values_list('id', 'votes'))
+        for option_id, votes in counters.items():
+            self.assertEqual(votes, PollVote.objects.filter(option_id=option_id).count())
+
+    def test_one_vote_per_session(self):
+        for write_behind in (True, False):
+            with self.subTest(write_behind=write_behind), \
+                    override_settings(NEWSIFY_POLL_WRITE_BEHIND=write_behind):
+                session_id = f'voter-{write_behind}'
+                poll_data, option_id, created = cast_poll_vote(self.tabs.id, session_id)
+                self.assertTrue(created)
+
+                # A second vote keeps the first choice
+                poll_data, option_id, created = cast_poll_vote(self.spaces.id, session_id)
+                self.assertFalse(created)
+                self.assertEqual(option_id, self.tabs.id)
+
+                poll_vote_buffer.flush()
+                self.assertCountersMatchVotes()
+
+        self.assertEqual(PollOption.objects.get(id=self.tabs.id).votes, 2)
+        self.assertEqual(PollOption.objects.get(id=self.spaces.id).votes, 0)
+
+    @override_settings(NEWSIFY_POLL_WRITE_BEHIND=True)
+    def test_voter_sees_buffered_vote(self):
+        poll_data, _, _ = cast_poll_vote(self.tabs.id, 'voter')
+        self.assertEqual({option['id']: option['votes'] for option in poll_data['options']},
+                         {self.tabs.id: 1, self.spaces.id: 0})
+        self.assertEqual(poll_data['total_votes'], 1)
+
+
+# ==================== FEED RESPONSE CACHE ====================
+
+@override_settings(NEWSIFY_VOTE_WRITE_BEHIND=False)
+class FeedResponseCacheTests(TestCase):
+    def setUp(self):
+        get_feed_cache().clear()
+        self.addCleanup(get_feed_cache().clear)
+        feed_ranker.invalidate()
+        self.addCleanup(feed_ranker.invalidate)
+        self.article = make_article(1)
+
+    def get_feed(self):
+        response = self.client.get(reverse('get_news'))
+        return response['X-Cache'], {item['id']: item for item in response.json()['news']}
+
+    def test_votes_are_overlaid_on_the_cached_body(self):
+        self.assertEqual(self.get_feed()[0], 'MISS')
+
+        cast_vote(self.article.id, 's1', 'up')
+        status, items = self.get_feed()
+        self.assertEqual(status, 'HIT')
+        self.assertEqual(items[self.article.id]['upvotes'], 1)
+        self.assertFalse(items[self.article.id]['trending'])
+
+        NewsArticle.objects.filter(id=self.article.id).update(upvotes=60)
+        status, items = self.get_feed()
+        self.assertEqual(status, 'HIT')
+        self.assertEqual(items[self.article.id]['upvotes'], 60)
+        self.assertTrue(items[self.article.id]['trending'])
+
+    def test_ingest_marks_entries_stale(self):
+        self.get_feed()
+        bump_version('ingest')
+        with patch('news.feed_cache._revalidate') as revalidate:
+            self.assertEqual(self.get_feed()[0], 'STALE')
+        revalidate.assert_called_once()
+
+    def test_visitors_with_preferences_bypass_the_cache(self):
+        user = User.objects.create_user('reader', password='unused-password')
+        UserProfile.objects.update_or_create(user=user, defaults={'preferred_categories': ['technology']})
+        self.client.force_login(user)
+        response = self.client.get(reverse('get_news'))
+        self.assertNotIn('X-Cache', response)
+
+
+# ==================== ANONYMOUS PREFERENCES ====================
+
+@override_settings(NEWSIFY_VOTE_WRITE_BEHIND=False)
+class AnonymousPreferenceTests(TestCase):
+    def setUp(self):
+        preference_cache.clear()
+        self.addCleanup(preference_cache.clear)
+        get_feed_cache().clear()
+        self.addCleanup(get_feed_cache().clear)
+        self.article = make_article(1)
+
+    def test_feed_reads_write_nothing(self):
+        response = self.client.get(reverse('get_news'))
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn(settings.SESSION_COOKIE_NAME, response.cookies)
+        self.assertFalse(Session.objects.exists())
+        self.assertFalse(UserPreference.objects.exists())
+
+    def test_votes_do_not_learn_preferences(self):
+        response = self.client.post(reverse('vote_article'), {'article_id': self.article.id, 'vote_type': 'up'},
+                                    content_type='application/json')
+        self.assertEqual(response.json()['upvotes'], 1)
+        self.assertFalse(UserPreference.objects.exists())
+
+    def test_stored_preferences_are_used_and_cached(self):
+        session = self.client.session
+        session.save()
+        UserPreference.objects.create(session_id=session.session_key, preferred_categories={'sports': 9})
+
+        response = self.client.get(reverse('get_news'))
+        self.assertEqual(response.json()['user_preferences'], ['sports'])
+        self.assertNotIn('X-Cache', response)
+        self.assertEqual(preference_cache.get(session.session_key), {'sports': 9})
+
+
+class PreferenceLRUTests(SimpleTestCase):
+    def test_least_recently_used_is_evicted(self):
+        lru = PreferenceLRU(size=2, ttl=60)
+        lru.set('a', {'sports': 1})
+        lru.set('b', {})
+        lru.get('a')
+        lru.set('c', {'world': 3})
+        self.assertIsNone(lru.get('b'))
+        self.assertEqual((lru.get('a'), lru.get('c')), ({'sports': 1}, {'world': 3}))
+
+    def test_entries_expire(self):
+        lru = PreferenceLRU(size=2, ttl=0.01)
+        lru.set('a', {'sports': 1})
+        time.sleep(0.02)
+        self.assertIsNone(lru.get('a'))
+
+
+class PurgePreferencesTests(TestCase):
+    def test_purges_empty_and_orphaned_rows(self):
+        session = self.client.session
+        session.save()
+        live = UserPreference.objects.create(session_id=session.session_key, preferred_categories={'sports': 9})
+        UserPreference.objects.create(session_id='gone', preferred_categories={'world': 2})
+        UserPreference.objects.create(session_id=session.session_key + '-empty', preferred_categories={})
+        recent = UserPreference.objects.create(session_id='recent', preferred_categories={})
+        UserPreference.objects.exclude(id=recent.id).update(updated_at=timezone.now() - timedelta(days=60))
+
+        call_command('purge_preferences', dry_run=True, stdout=StringIO())
+        self.assertEqual(UserPreference.objects.count(), 4)
+
+        call_command('purge_preferences', stdout=StringIO())
+        self.assertEqual(set(UserPreference.objects.values_list('id', flat=True)), {live.id, recent.id})
+
+
+# ==================== INGEST PIPELINE ====================
+
+class PipelineTests(SimpleTestCase):
+    def test_items_flow_through_batches_and_errors(self):
+        collected = []
+        batch_sizes = []
+
+        def double(item, emit):
+            if item == 3:
+                raise ValueError('bad item')
+            emit(item * 2)
+
+        def collect(batch, emit):
+            batch_sizes.append(len(batch))
+            collected.extend(batch)
+
+        pipeline = Pipeline([
+            Stage('double', double, workers=3, queue_size=2),
+            Stage('collect', collect, queue_size=2, batch_size=4),
+        ])
+        report = {stage['stage']: stage for stage in pipeline.run(range(10))}
+
+        self.assertEqual(sorted(collected), [i * 2 for i in range(10) if i != 3])
+        self.assertLessEqual(max(batch_sizes), 4)
+        self.assertEqual((report['double']['items_in'], report['double']['errors']), (10, 1))
+        self.assertEqual(report['collect']['items_in'], 9)
+
+
+def fake_provider(api_category, articles_per_category):
+    return [
+        provider_article(1),
+        provider_article(1),  # same story from the same run
+        provider_article(2, title=''),  # dropped by normalization
+        provider_article(3),
+        provider_article(4),  # already stored
+    ]
+
+
+# The write stage runs on its own threads with their own connections
+@patch.dict('news.scraper.PROVIDERS', {'Fake': fake_provider}, clear=True)
+class IngestStatsTests(TransactionTestCase):
+    def setUp(self):
+        make_article('stored', source_url='https://provider.invalid/4')
+
+    def run_pipeline(self):
+        stats = new_ingest_stats()
+        build_ingest_pipeline(10, ['Fake'], stats).run([('Fake', 'technology')])
+        return stats
+
+    def test_counters(self):
+        stats = self.run_pipeline()
+        self.assertEqual(
+            (stats['total_fetched'], stats['total_saved'], stats['normalize_dropped'], duplicates_skipped(stats)),
+            (5, 2, 1, 2),
+        )
+        self.assertEqual((stats['rows_rejected'], stats['batches_failed']), (0, 0))
+        self.assertEqual(stats['by_source'], {'Reuters': 2})
+
+    def test_failed_write_batch(self):
+        with patch('news.scraper.save_rows_bulk', side_effect=DatabaseError('disk I/O error')):
+            stats = self.run_pipeline()
+        self.assertEqual(stats['total_saved'], 0)
+        self.assertGreaterEqual(stats['batches_failed'], 1)
+        self.assertEqual(stats['rows_in_failed_batches'], 3)
+        # Only the in-run copy is a duplicate; the stored URL never got as far as the lookup
+        self.assertEqual(duplicates_skipped(stats), 1)
+
+    def test_bulk_ingest_counts_normalize_drops(self):
+        articles = [provider_article(1), provider_article(2, title=''), provider_article(4)]
+        stats = ingest_articles({'technology': articles})
+        self.assertEqual((stats['total_fetched'], stats['total_saved'], stats['normalize_dropped']), (3, 1, 1))
+        self.assertEqual(duplicates_skipped(stats), 1)
+
+
+# ==================== NEAR-DUPLICATES ====================
+
+STORY_TITLE = 'Central bank raises interest rates by half a point as inflation stays high'
+STORY_DESCRIPTION = (
+    'The central bank raised its benchmark interest rate by half a percentage point on Tuesday, '
+    'its third increase this year, saying inflation remained well above target.'
+)
+
+
+class DedupTests(TestCase):
+    def setUp(self):
+        self.now = timezone.now()
+
+    def test_copies_point_at_earliest_article(self):
+        original = make_article(1, title=STORY_TITLE, description=STORY_DESCRIPTION,
+                                published_date=self.now - timedelta(hours=2))
+        copy = make_article(2, title=f'{STORY_TITLE} - Reuters', description=STORY_DESCRIPTION + '...',
+                            published_date=self.now - timedelta(hours=1))
+        other = make_article(3, title='Local team wins championship after dramatic overtime finish',
+                             description='Fans celebrated downtown after the home side clinched the title.',
+                             published_date=self.now)
+
+        # Newest first on purpose: the earliest copy must still win
+        self.assertEqual(index_articles([other, copy, original]), 1)
+
+        for article in (original, copy, other):
+            article.refresh_from_db()
+        self.assertIsNone(original.duplicate_of_id)
+        self.assertEqual(copy.duplicate_of_id, original.id)
+        self.assertIsNone(other.duplicate_of_id)
+        self.assertEqual(ArticleSignature.objects.count(), 3)
+
+    def test_later_batch_matches_stored_signatures(self):
+        original = make_article(1, title=STORY_TITLE, description=STORY_DESCRIPTION,
+                                published_date=self.now - timedelta(hours=2))
+        self.assertEqual(index_articles([original]), 0)
+
+        copy = make_article(2, title=f'{STORY_TITLE} - AP', description=STORY_DESCRIPTION,
+                            published_date=self.now)
+        self.assertEqual(index_articles([copy]), 1)
+        copy.refresh_from_db()
+        self.assertEqual(copy.duplicate_of_id, original.id)
+
+    def test_outside_window_is_not_a_duplicate(self):
+        original = make_article(1, title=STORY_TITLE, description=STORY_DESCRIPTION,
+                                published_date=self.now - timedelta(days=10))
+        index_articles([original])
+        rerun = make_article(2, title=STORY_TITLE, description=STORY_DESCRIPTION, published_date=self.now)
+        self.assertEqual(index_articles([rerun]), 0)
+
+    def test_earlier_copy_from_a_later_batch_takes_over(self):
+        late = make_article(1, title=STORY_TITLE, description=STORY_DESCRIPTION,
+                            published_date=self.now - timedelta(hours=1))
+        later = make_article(2, title=f'{STORY_TITLE} - AP', description=STORY_DESCRIPTION,
+                             published_date=self.now)
+        index_articles([late, later])
+
+        # A provider that was slow to fetch had the story first
+        early = make_article(3, title=f'{STORY_TITLE} - Reuters', description=STORY_DESCRIPTION,
+                             published_date=self.now - timedelta(hours=5))
+        self.assertEqual(index_articles([early]), 1)
+
+        for article in (early, late, later):
+            article.refresh_from_db()
+        self.assertIsNone(early.duplicate_of_id)
+        self.assertEqual((late.duplicate_of_id, later.duplicate_of_id), (early.id, early.id))
+
+
+# ==================== INGEST JOBS ====================
+
+class IngestJobTests(TestCase):
+    def test_one_active_job_per_request(self):
+        job, created = enqueue_refresh('public', ['technology'], 5)
+        self.assertTrue(created)
+        self.assertEqual(enqueue_refresh('public', ['technology'], 5), (job, False))
+        self.assertTrue(enqueue_refresh('public', ['sports'], 5)[1])
+
+        # The database enforces it, not just the lookup
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            IngestJob.objects.create(kind='public', categories=['technology'], articles_per_category=5)
+
+        IngestJob.objects.filter(id=job.id).update(status='done')
+        self.assertTrue(enqueue_refresh('public', ['technology'], 5)[1])
+
+    def test_losing_the_insert_race_returns_the_winner(self):
+        winner, _ = enqueue_refresh('public', ['technology'], 5)
+        real_first = QuerySet.first
+        lookups = []
+
+        def first(queryset):
+            lookups.append(queryset)
+            # Our lookup ran before the other request's insert was visible
+            return None if len(lookups) == 1 else real_first(queryset)
+
+        with patch.object(QuerySet, 'first', first):
+            self.assertEqual(enqueue_refresh('public', ['technology'], 5), (winner, False))
+        self.assertEqual(IngestJob.objects.count(), 1)
+
+    def test_jobs_are_claimed_oldest_first(self):
+        first, _ = enqueue_refresh('public', ['technology'], 5)
+        second, _ = enqueue_refresh('admin', None, 10)
+        self.assertEqual(job_status(second)['queued_ahead'], 1)
+
+        self.assertEqual(claim_next_job(), first)
+        self.assertEqual(claim_next_job(), second)
+        self.assertIsNone(claim_next_job())
+        self.assertEqual(IngestJob.objects.get(id=first.id).status, 'running')
+
+        # A daemon that died mid-job leaves it running; the next one starts over
+        self.assertEqual(requeue_interrupted_jobs(), 2)
+        self.assertEqual(claim_next_job(), first)
+
+    def test_run_job_records_the_outcome(self):
+        enqueue_refresh('public', ['technology'], 5)
+        job = claim_next_job()
+        with patch('news.ingest.run_ingest', side_effect=RuntimeError('provider exploded')):
+            run_job(job)
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.error), ('failed', 'RuntimeError: provider exploded'))
+        self.assertIsNotNone(job.finished_at)
+
+        enqueue_refresh('public', ['technology'], 5)
+        job = claim_next_job()
+        with patch('news.ingest.run_ingest') as run_ingest:
+            run_job(job)
+        job.refresh_from_db()
+        self.assertEqual(job.status, 'done')
+        self.assertEqual({category for _, category in run_ingest.call_args.args[0]}, {'technology'})
+
+
+class IngestScheduleTests(SimpleTestCase):
+    def schedule(self, remaining):
+        quota = Mock()
+        quota.remaining.return_value = remaining
+        with patch('news.ingest.get_quota_accountant', return_value=quota):
+            return IngestSchedule(categories=['technology', 'sports'], providers=['Provider'], base_interval=600)
+
+    def test_interval_follows_the_remaining_quota(self):
+        with patch('news.ingest.seconds_until_quota_reset', return_value=36000):
+            self.assertEqual(self.schedule(None).interval('Provider'), 600)
+            self.assertEqual(self.schedule(10).interval('Provider'), 7200)
+            self.assertEqual(self.schedule(1000).interval('Provider'), 600)
+            self.assertEqual(self.schedule(0).interval('Provider'), 36060)
+
+    def test_first_round_is_spread_over_a_minute(self):
+        schedule = self.schedule(None)
+        now = time.monotonic()
+        self.assertEqual(schedule.due(now - 1), [])
+        self.assertEqual(len(schedule.due(now + 61)), 2)
+
+        schedule.reschedule(schedule.due(now + 61), now=now + 61)
+        self.assertEqual(schedule.due(now + 61 + 600 * 0.89), [])
+        self.assertGreater(schedule.seconds_until_next(now + 61), 600 * 0.89)
+
+
+# ==================== CIRCUIT BREAKER ====================
+
+class CircuitBreakerTests(SimpleTestCase):
+    def test_open_half_open_closed(self):
+        breaker = CircuitBreaker('tests', threshold=2, reset_after=60)
+        breaker.record_failure()
+        self.assertTrue(breaker.allow())
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        self.assertFalse(breaker.allow())
+        self.assertTrue(breaker.is_open())
+
+        # Reset interval passed: exactly one trial call goes out
+        breaker.opened_at -= 61
+        self.assertTrue(breaker.allow())
+        self.assertEqual(breaker.state, CircuitBreaker.HALF_OPEN)
+        self.assertFalse(breaker.allow())
+
+        # A failed trial reopens at once
+        breaker.record_failure()
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        self.assertFalse(breaker.allow())
+
+        breaker.opened_at -= 61
+        self.assertTrue(breaker.allow())
+        breaker.record_success()
+        self.assertEqual((breaker.state, breaker.failures), (CircuitBreaker.CLOSED, 0))
+        self.assertTrue(breaker.allow())
+
+
+class HttpClientTests(SimpleTestCase):
+    def setUp(self):
+        self.client = HttpClient(retries=2)
+        self.client.session = Mock()
+        sleep = patch('news.http_client.time.sleep')
+        sleep.start()
+        self.addCleanup(sleep.stop)
+
+    def test_retries_then_succeeds(self):
+        self.client.session.request.side_effect = [
+            Mock(status_code=503, headers={}),
+            requests.exceptions.ConnectionError('reset'),
+            Mock(status_code=200, headers={}),
+        ]
+        response = self.client.get('https://provider.invalid/news', breaker='Provider')
+        self.assertEqual(response.status_code, 200)
+        host = self.client.metrics()['hosts']['provider.invalid']
+        self.assertEqual((host['requests'], host['errors'], host['retries']), (3, 2, 2))
+        self.assertEqual(self.client.breaker('Provider').state, CircuitBreaker.CLOSED)
+
+    def test_failed_half_open_trial_always_reopens(self):
+        breaker = self.client.breaker('Provider')
+        breaker.state, breaker.opened_at = CircuitBreaker.OPEN, time.monotonic() - BREAKER_RESET - 1
+        # Not a RequestException: the trial must still count as failed
+        self.client.session.request.side_effect = KeyboardInterrupt
+
+        with self.assertRaises(KeyboardInterrupt):
+            self.client.get('https://provider.invalid/news', breaker='Provider')
+        self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+        with self.assertRaises(CircuitOpenError):
+            self.client.get('https://provider.invalid/news', breaker='Provider')
+        self.assertEqual(self.client.session.request.call_count, 1)
+
+
+# ==================== DASHBOARD LISTS ====================
+
+class DashboardListTests(TestCase):
+    def setUp(self):
+        staff = User.objects.create_user('editor', password='unused-password', is_staff=True)
+        self.client.force_login(staff)
+        now = timezone.now()
+        # Pairs share a published_date, so paging has to fall back to the id tie-breaker
+        self.articles = [
+            make_article(i, published_date=now - timedelta(hours=i // 2), category='science' if i % 3 else 'world')
+            for i in range(9)
+        ]
+
+    def walk(self, url, params):
+        ids, pages = [], 0
+        response = self.client.get(url, params)
+        while True:
+            self.assertEqual(response.status_code, 200)
+            ids += [row['id'] for row in response.context['articles']]
+            pages += 1
+            if not response.context['next_url']:
+                return ids, pages
+            response = self.client.get(url + response.context['next_url'])
+
+    def test_pages_cover_every_row_once_in_order(self):
+        expected = list(NewsArticle.objects.order_by('-published_date', '-id').values_list('id', flat=True))
+        ids, pages = self.walk(reverse('dashboard_articles'), {'page_size': 2})
+        self.assertEqual(ids, expected)
+        self.assertEqual(pages, 5)
+
+    def test_filters_apply_to_every_page(self):
+        expected = list(NewsArticle.objects.filter(category='science')
+                        .order_by('-published_date', '-id').values_list('id', flat=True))
+        ids, _ = self.walk(reverse('dashboard_articles'), {'page_size': 2, 'category': 'science'})
+        self.assertEqual(ids, expected)
+
+    def test_rows_are_projected_columns(self):
+        response = self.client.get(reverse('dashboard_articles'))
+        row = response.context['articles'][0]
+        self.assertIsInstance(row, dict)
+        self.assertNotIn('description', row)
+
+    def test_cursor_is_bound_to_list_and_filters(self):
+        url = reverse('dashboard_articles')
+        next_url = self.client.get(url, {'page_size': 2, 'category': 'science'}).context['next_url']
+        cursor = next_url.split('cursor=')[1]
+
+        self.assertEqual(self.client.get(url + next_url.replace('science', 'world')).status_code, 400)
+        self.assertEqual(self.client.get(reverse('dashboard_votes'), {'cursor': cursor}).status_code, 400)
+        self.assertEqual(self.client.get(url, {'cursor': 'tampered'}).status_code, 400)
+
+    def test_csv_export_streams_every_matching_row(self):
+        for i in range(5):
+            Vote.objects.create(article=self.articles[0], session_id=f'voter-{i}', vote_type='up' if i % 2 else 'down')
+        Vote.objects.create(article=self.articles[1], session_id='voter-0', vote_type='up')
+
+        response = self.client.get(reverse('dashboard_votes'), {'article': self.articles[0].id, 'format': 'csv'})
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual(lines[0], 'id,created_at,session_id,vote_type,article_id,article__title')
+        self.assertEqual([line.split(',')[2] for line in lines[1:]], [f'voter-{i}' for i in reversed(range(5))])
+
+    def test_ndjson_export(self):
+        response = self.client.get(reverse('dashboard_articles'), {'category': 'world', 'format': 'ndjson'})
+        self.assertTrue(response.streaming)
+        rows = [json.loads(line) for line in b''.join(response.streaming_content).decode().splitlines()]
+        self.assertEqual({row['id'] for row in rows},
+                         set(NewsArticle.objects.filter(category='world').values_list('id', flat=True)))
+        self.assertEqual(set(rows[0]), {'id', 'published_date', 'title', 'category', 'source', 'upvotes',
+                                        'downvotes', 'views', 'comment_count', 'source_url'})
+
+    def test_users_list_filters_and_requires_staff(self):
+        User.objects.create_user('alice', email='alice@example.com')
+        User.objects.create_user('bob', email='bob@example.com')
+        response = self.client.get(reverse('dashboard_users'), {'q': 'ali'})
+        self.assertEqual([row['username'] for row in response.context['users']], ['alice'])
+
+        self.client.logout()
+        self.assertEqual(self.client.get(reverse('dashboard_users')).status_code, 302)
+
+
+# ==================== SSE RESUME ====================
+
+class EventBrokerTests(SimpleTestCase):
+    def setUp(self):
+        self.broker = EventBroker(history=3)
+        for i in range(5):
+            self.broker.publish('votes', {'n': i})
+
+    def test_resume_from_history(self):
+        self.assertEqual([event[0] for event in self.broker.since(3)], [4, 5])
+        self.assertEqual(self.broker.since(5), [])
+
+    def test_resync_when_history_was_dropped(self):
+        self.assertIsNone(self.broker.since(1))
+
+    def test_resync_when_client_is_ahead(self):
+        # Last-Event-ID from another process or from before a restart
+        self.assertIsNone(self.broker.since(9))
+
+    def test_overflowing_subscriber_gets_one_resync(self):
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        subscription = Subscription(loop, queue_size=2)
+        for event in self.broker.since(2):
+            subscription._put(event)
+
+        self.assertEqual(loop.run_until_complete(subscription.get(0.1)), (5, 'resync', {}))
+        self.assertIsNone(loop.run_until_complete(subscription.get(0.01)))
+
+
+class LiveUpdatesTests(TestCase):
+    def test_event_stream_declines_under_wsgi(self):
+        # The test client builds a WSGIRequest: no endless stream on a worker thread
+        response = self.client.get(reverse('event_stream'))
+        self.assertEqual(response.status_code, 204)
+        self.assertFalse(response.streaming)
+
+    def test_index_polls_under_wsgi(self):
+        user = User.objects.create_user('reader', password='unused-password')
+        UserProfile.objects.filter(user=user).update(onboarding_complete=True)
+        self.client.force_login(user)
+        response = self.client.get(reverse('index'))
+        self.assertEqual(response.status_code, 200)
+        self.assertIs(response.context['live_updates'], False)
+
+    def test_poller_publishes_new_feed_rows(self):
+        poller = ArticlePoller()
+        stored = make_article(1)
+        self.assertEqual(poller.poll(), 0)  # starts from the newest row
+        self.assertEqual(poller.last_seen_id, stored.id)
+
+        last_id = event_broker.last_id
+        fresh = make_article(2, category='science')
+        make_article(3, duplicate_of=stored)
+        self.assertEqual(poller.poll(), 1)
+        self.assertEqual(event_broker.since(last_id),
+                         [(last_id + 1, 'articles', {'articles': [{'id': fresh.id, 'category': 'science'}]})])
+        self.assertEqual(poller.poll(), 0)
+
+
+# ==================== ASYNC API VIEWS ====================
+
+class AsyncViewTests(TransactionTestCase):
+    def setUp(self):
+        get_feed_cache().clear()
+        self.addCleanup(get_feed_cache().clear)
+        feed_ranker.invalidate()
+        self.addCleanup(feed_ranker.invalidate)
+        now = timezone.now()
+        self.article = make_article(1, published_date=now - timedelta(hours=1))
+        make_article(2, published_date=now - timedelta(days=3), category='science')
+        poll = Poll.objects.create(question='Tabs or spaces?')
+        PollOption.objects.create(poll=poll, text='Tabs')
+        self.addCleanup(invalidate_polls_cache)
+
+    def get_async(self, name, **params):
+        return async_to_sync(self.async_client.get)(reverse(name), params)
+
+    def test_reads_match_the_sync_views(self):
+        for name, params in [('get_news', {}), ('get_news', {'category': 'science'}),
+                             ('get_archived', {'days': 7}), ('get_polls', {}), ('get_stats', {})]:
+            with self.subTest(name=name, **params):
+                expected = self.client.get(reverse(name), params)
+                response = self.get_async(f'async_{name}', **params)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.json(), expected.json())
+
+    def test_vote(self):
+        response = async_to_sync(self.async_client.post)(
+            reverse('async_vote_article'),
+            json.dumps({'article_id': self.article.id, 'vote_type': 'up'}),
+            content_type='application/json',
+        )
+        self.assertEqual(response.json(), {'status': 'success', 'upvotes': 1, 'downvotes': 0, 'user_vote': 'up'})
+        self.assertEqual(Vote.objects.get().article_id, self.article.id)
+
+        response = async_to_sync(self.async_client.post)(
+            reverse('async_vote_article'),
+            json.dumps({'article_id': 0, 'vote_type': 'up'}),
+            content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 404)
+
+    def test_missing_refresh_job(self):
+        response = async_to_sync(self.async_client.get)(reverse('async_refresh_status', args=[404]))
+        self.assertEqual(response.status_code, 404)
+
+
+class InThreadTests(SimpleTestCase):
+    def test_runs_off_the_caller_thread_and_closes_connections(self):
+        calls = []
+
+        def work(value):
+            calls.append(('work', threading.get_ident()))
+            return value * 2
+
+        with patch('news.async_views.close_old_connections', side_effect=lambda: calls.append(('close', None))):
+            self.assertEqual(async_to_sync(in_thread(work))(21), 42)
+
+        self.assertEqual([call[0] for call in calls], ['close', 'work', 'close'])
+        self.assertNotEqual(calls[1][1], threading.get_ident())
+
+    def test_closes_connections_when_the_call_fails(self):
+        def fail():
+            raise ValueError('boom')
+
+        with patch('news.async_views.close_old_connections') as close:
+            with self.assertRaises(ValueError):
+                async_to_sync(in_thread(fail))()
+        self.assertEqual(close.call_count, 2)
+
+
+# ==================== ARCHIVE ENGAGEMENT ====================
+
+class EngagementTests(TestCase):
+    def setUp(self):
+        self.article = make_article(1, upvotes=3, views=10)
+
+    def assertEngagementInStep(self):
+        article = NewsArticle.objects.get(id=self.article.id)
+        self.assertEqual(article.engagement, article.upvotes + article.views + article.comment_count)
+        return article
+
+    def test_save(self):
+        self.assertEqual(self.assertEngagementInStep().engagement, 13)
+        self.article.views = 20
+        self.article.save(update_fields=['views'])
+        self.assertEqual(self.assertEngagementInStep().engagement, 23)
+
+    def test_votes(self):
+        cast_vote(self.article.id, 's1', 'up')
+        self.assertEqual(self.assertEngagementInStep().engagement, 14)
+        cast_vote(self.article.id, 's1', 'down')
+        self.assertEqual(self.assertEngagementInStep().engagement, 13)
+
+    def test_buffered_vote_flush(self):
+        apply_counter_deltas({self.article.id: {'upvotes': 2, 'downvotes': 1}})
+        self.assertEqual(self.assertEngagementInStep().engagement, 15)
+        apply_counter_deltas({self.article.id: {'upvotes': -10}})
+        self.assertEqual(self.assertEngagementInStep().upvotes, 0)
+
+    def test_comments(self):
+        comment = Comment.objects.create(article=self.article, text='First')
+        self.assertEqual(self.assertEngagementInStep().comment_count, 1)
+        comment.delete()
+        self.assertEqual(self.assertEngagementInStep().engagement, 13)
+
+
+class ArchivedTests(TestCase):
+    def test_most_engaged_old_articles_first(self):
+        old = timezone.now() - timedelta(days=10)
+        quiet = make_article(1, published_date=old, upvotes=6, views=60)
+        busy = make_article(2, published_date=old, upvotes=6, views=500)
+        discussed = make_article(3, published_date=old, upvotes=6, views=60)
+        comments = [Comment.objects.create(article=discussed, text=f'Comment {i}') for i in range(100)]
+        make_article(4, published_date=timezone.now(), upvotes=50, views=900)  # too recent
+        make_article(5, published_date=old, upvotes=2, views=900)  # too few votes
+        make_article(6, published_date=old, upvotes=60, views=900, duplicate_of=quiet)
+
+        archived = build_archived_body(7)['archived']
+        self.assertEqual([item['id'] for item in archived], [busy.id, discussed.id, quiet.id])
+        self.assertEqual({c['id'] for c in archived[1]['comments']}, {c.id for c in comments})
+        self.assertEqual(archived[0]['comments'], [])
+
+
+# ==================== VIEW TRACKING ====================
+
+class SeenSetTests(SimpleTestCase):
+    def test_repeats_within_ttl(self):
+        seen = SeenSet(size=10, ttl=60)
+        self.assertTrue(seen.add('a'))
+        self.assertFalse(seen.add('a'))
+
+        expired = SeenSet(size=10, ttl=0)
+        expired.add('a')
+        self.assertTrue(expired.add('a'))
+
+    def test_oldest_entries_are_evicted(self):
+        seen = SeenSet(size=2, ttl=60)
+        for key in 'abc':
+            seen.add(key)
+        self.assertTrue(seen.add('a'))
+        self.assertFalse(seen.add('c'))
+
+
+class ViewBeaconTests(TransactionTestCase):
+    def setUp(self):
+        seen = patch('news.impressions.seen_views', SeenSet(size=100, ttl=60))
+        seen.start()
+        self.addCleanup(seen.stop)
+        self.first = make_article(1, upvotes=2)
+        self.second = make_article(2)
+
+    def tearDown(self):
+        view_buffer.flush()
+        read_buffer.flush()
+
+    def beacon(self, article_ids, **data):
+        return self.client.post(
+            reverse('view_beacon'), json.dumps(dict(data, article_ids=article_ids)), content_type='application/json'
+        )
+
+    def views(self, article):
+        return NewsArticle.objects.values_list('views', 'engagement').get(id=article.id)
+
+    def test_views_are_deduplicated_and_flushed_in_bulk(self):
+        self.assertEqual(self.beacon([self.first.id, self.second.id, self.first.id]).json()['counted'], 2)
+        self.assertEqual(self.beacon([self.first.id]).json()['counted'], 0)
+        self.assertEqual(self.views(self.first), (0, 2))  # nothing written per request
+
+        view_buffer.flush()
+        self.assertEqual(self.views(self.first), (1, 3))
+        self.assertEqual(self.views(self.second), (1, 1))
+
+    def test_anonymous_visitors_are_told_apart_without_a_session(self):
+        response = self.beacon([self.first.id])
+        self.assertNotIn(settings.SESSION_COOKIE_NAME, response.cookies)
+        self.assertEqual(self.beacon([self.first.id]).json()['counted'], 0)
+        self.client.defaults['HTTP_USER_AGENT'] = 'Another browser'
+        self.assertEqual(self.beacon([self.first.id]).json()['counted'], 1)
+
+        view_buffer.flush()
+        self.assertEqual(self.views(self.first), (2, 4))
+
+    def test_reads_credit_the_reader_once(self):
+        user = User.objects.create_user('reader', password='unused-password')
+        self.client.force_login(user)
+        self.assertEqual(self.beacon([self.first.id], kind='read').json()['counted'], 1)
+        self.assertEqual(self.beacon([self.first.id], kind='read').json()['counted'], 0)
+        # An impression after the read is not counted again
+        self.assertEqual(self.beacon([self.first.id]).json()['counted'], 0)
+
+        read_buffer.flush()
+        self.assertEqual(UserProfile.objects.get(user=user).total_articles_read, 1)
+
+    def test_invalid_beacons(self):
+        self.assertEqual(self.client.get(reverse('view_beacon')).status_code, 400)
+        self.assertEqual(self.beacon(['not-an-id']).status_code, 400)
+        self.assertEqual(self.beacon([self.first.id], kind='share').status_code, 400)
+        self.assertFalse(view_buffer.pending(self.first.id))
+
+    def test_beacon_is_capped(self):
+        ids = list(range(1000, 1000 + MAX_BEACON_ARTICLES + 10))
+        self.assertEqual(self.beacon(ids).json()['counted'], MAX_BEACON_ARTICLES)
@@ -1,7 +1,7 @@
 # news/urls.py
 
 from django.urls import path
-from . import views
+from . import views, async_views
 
 urlpatterns = [
     # Public pages
@@ -32,6 +32,7 @@ urlpatterns = [
     path('api/archived/', views.get_archived, name='get_archived'),
     path('api/vote/', views.vote_article, name='vote_article'),
     path('api/comment/', views.add_comment, name='add_comment'),
+    path('api/view-beacon/', views.view_beacon, name='view_beacon'),
     path('api/polls/', views.get_polls, name='get_polls'),
     path('api/poll/vote/', views.vote_poll, name='vote_poll'),
     path('api/stats/', views.get_stats, name='get_stats'),
@@ -43,6 +44,22 @@ urlpatterns = [
     # Admin refresh endpoint
     path('api/refresh-news/', views.refresh_news, name='refresh_news'),
     
+    # Refresh job progress
+    path('api/refresh-status/<int:job_id>/', views.refresh_status, name='refresh_status'),
+    
+    # Live feed updates (Server-Sent Events; serve through asgi.py)
+    path('api/events/', views.event_stream, name='event_stream'),
+    
     # Alias for headlines (uses get_news)
     path('api/headlines/', views.get_news, name='get_headlines'),
+
+    # Async versions of the hot endpoints (serve through asgi.py; compare with benchmark_api)
+    path('api/async/news/', async_views.get_news, name='async_get_news'),
+    path('api/async/archived/', async_views.get_archived, name='async_get_archived'),
+    path('api/async/vote/', async_views.vote_article, name='async_vote_article'),
+    path('api/async/polls/', async_views.get_polls, name='async_get_polls'),
+    path('api/async/stats/', async_views.get_stats, name='async_get_stats'),
+    path('api/async/refresh-news-public/', async_views.refresh_news_public, name='async_refresh_news_public'),
+    path('api/async/refresh-news/', async_views.refresh_news, name='async_refresh_news'),
+    path('api/async/refresh-status/<int:job_id>/', async_views.refresh_status, name='async_refresh_status'),
 ]
@@ -1,15 +1,27 @@
 from django.shortcuts import render, redirect
-from django.http import JsonResponse
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib.auth import login, logout, authenticate, update_session_auth_hash
 from django.contrib.auth.models import User
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
-from django.db.models import F, Q, Count, Sum
-from django.db.models.functions import Coalesce
-from .models import NewsArticle, Vote, Comment, UserPreference, Poll, UserProfile, PollOption
-from .scraper import fetch_and_save_news
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+from .models import NewsArticle, Vote, Comment, UserProfile, PollOption, IngestJob
+from .ingest import enqueue_refresh, job_status
+from .pagination import feed_page, InvalidCursor
+from .dashboard import DASHBOARD_LISTS, parse_page_size
+from .search import search_articles
+from .scoring import DEFAULT_PREFERENCE, is_trending
+from .votes import cast_vote, vote_buffer, write_behind_enabled
+from .impressions import record_views, visitor_key, MAX_BEACON_ARTICLES, VIEW_KINDS
+from .polls import get_polls_payload, get_session_poll_votes, with_pending_votes, cast_poll_vote
+from .stats import get_site_stats
+from .feed_cache import cached_body, bump_version
+from .events import event_broker, article_poller, format_event, HEARTBEAT_INTERVAL
+from .preferences import get_anonymous_preferences, profile_preferences
 from .forms import (
     SignUpForm,
     OnboardingForm,
@@ -24,6 +36,8 @@ from django.utils import timezone
 
 # ==================== Utility Functions ====================
 
+COMMENT_PREVIEW_LIMIT = 5
+
 def get_or_create_session(request):
     """Get or create session ID"""
     if not request.session.session_key:
@@ -46,13 +60,14 @@ def get_relative_time(dt):
     return dt.strftime('%B %d, %Y')
 
 
-def calculate_personalized_score(article, prefs):
+def calculate_personalized_score(article, prefs, now=None):
     """Weighted personalized score"""
-    hours_old = (timezone.now() - article.published_date).total_seconds() / 3600
+    now = now or timezone.now()
+    hours_old = (now - article.published_date).total_seconds() / 3600
     recency = max(0, 10 - (hours_old / 24))
     engagement = min(10, (article.upvotes * 0.5 + article.views * 0.01) / 10)
     credibility = article.credibility_score
-    category_pref = prefs.get(article.category, 5)
+    category_pref = prefs.get(article.category, DEFAULT_PREFERENCE)
     
     # MODIFIED WEIGHTS: Increased Category Preference (0.5), Recency (0.3)
     #                   Decreased Engagement (0.1) and Credibility (0.1)
@@ -64,6 +79,37 @@ def calculate_personalized_score(article, prefs):
     )
 
 
+def get_comment_previews(article_ids, per_article=COMMENT_PREVIEW_LIMIT):
+    """
+    Latest comments for many articles at once: {article_id: [comment dicts]}.
+    A ROW_NUMBER() window keeps it to `per_article` rows per article, so an
+    article with thousands of comments still only sends 5 over the wire.
+    """
+    if not article_ids:
+        return {}
+
+    rows = (
+        Comment.objects.filter(article_id__in=article_ids)
+        .annotate(row=Window(
+            expression=RowNumber(),
+            partition_by=[F('article_id')],
+            order_by=[F('created_at').desc(), F('id').desc()],
+        ))
+        .filter(row__lte=per_article)
+        .order_by('article_id', 'row')
+        .values('article_id', 'author_name', 'text', 'created_at')
+    )
+
+    previews = {}
+    for c in rows:
+        previews.setdefault(c['article_id'], []).append({
+            'author': c['author_name'],
+            'text': c['text'],
+            'created_at': c['created_at'].strftime('%Y-%m-%d %H:%M'),
+        })
+    return previews
+
+
 def calculate_reading_time(text):
     """Calculate reading time in minutes (avg 200 words/min)"""
     words = len(text.split())
@@ -79,7 +125,7 @@ def index(request):
         return redirect('onboarding')
 
     if request.user.is_authenticated:
-        return render(request, 'index.html')
+        return render(request, 'index.html', {'live_updates': sse_available(request)})
         
     # RESTORED: Show landing page for unauthenticated users
     return render(request, 'landing.html')
@@ -274,70 +320,43 @@ def user_dashboard_auth(request):
 # ==================== API Endpoints ====================
 # ... (rest of the API endpoints remain the same)
 
-def get_news(request):
-    """Fetch personalized news"""
-    session_id = get_or_create_session(request)
-    category = request.GET.get('category', 'all')
-    search_query = request.GET.get('search', '')
-
-    user_pref, _ = UserPreference.objects.get_or_create(
-        session_id=session_id, defaults={'preferred_categories': {}}
-    )
-
-    # Determine preference source
-    if request.user.is_authenticated:
-        try:
-            profile = request.user.profile
-            if isinstance(profile.preferred_categories, list):
-                preferences = {cat: 5.0 for cat in profile.preferred_categories}
-            else:
-                preferences = profile.preferred_categories or {}
-        except UserProfile.DoesNotExist:
-            preferences = {}
-    else:
-        preferences = user_pref.preferred_categories
-
-    # Fetch articles
-    if category == 'all':
-        articles_qs = NewsArticle.objects.all().prefetch_related('comments').order_by('-published_date')
-    else:
-        articles_qs = NewsArticle.objects.filter(category=category).prefetch_related('comments').order_by('-published_date')
+def build_news_body(category, search_query, cursor, preferences):
+    """
+    /api/news/ body for one set of parameters and preferences, without any
+    per-session fields (user_vote is always None here).
 
+    Raises:
+        InvalidCursor for a bad cursor.
+    """
+    snippets = {}
+    next_cursor = None
     if search_query:
-        articles_qs = articles_qs.filter(
-            Q(title__icontains=search_query) | Q(description__icontains=search_query)
-        )
-
-    articles = list(articles_qs[:100])
-
-    # Calculate personalized scores
-    articles_with_scores = [
-        (a, calculate_personalized_score(a, preferences)) for a in articles
-    ]
-    articles_with_scores.sort(key=lambda x: x[1], reverse=True)
+        # Full-text index, most relevant first; personalized score is still reported
+        hits = search_articles(search_query, category=None if category == 'all' else category, limit=50)
+        snippets = {hit.article_id: hit.snippet for hit in hits}
+        articles_by_id = NewsArticle.objects.in_bulk(list(snippets))
+
+        now = timezone.now()
+        articles_with_scores = [
+            (article, calculate_personalized_score(article, preferences, now))
+            for article in (articles_by_id.get(hit.article_id) for hit in hits)
+            if article and not article.duplicate_of_id
+        ]
+    else:
+        # Ranked window first, then older articles; each page resumes from its cursor
+        articles_with_scores, next_cursor = feed_page(category, preferences, cursor=cursor)
 
-    # Get user votes
-    user_votes = Vote.objects.filter(
-        session_id=session_id,
-        article__in=[a[0] for a in articles_with_scores]
-    ).values('article_id', 'vote_type')
-    user_votes_dict = {v['article_id']: v['vote_type'] for v in user_votes}
+    # Latest 5 comments per article in one windowed query
+    articles_with_scores = articles_with_scores[:50]
+    previews = get_comment_previews([a.id for a, _ in articles_with_scores])
 
     # Prepare data
     news_data = []
-    for article, score in articles_with_scores[:50]:
-        comments = [
-            {
-                'author': c.author_name,
-                'text': c.text,
-                'created_at': c.created_at.strftime('%Y-%m-%d %H:%M'),
-            }
-            for c in article.comments.all()[:5]
-        ]
+    for article, score in articles_with_scores:
+        comments = previews.get(article.id, [])
 
         reading_time = calculate_reading_time(article.description + (article.content or ''))
         is_personalized = article.category in preferences
-        is_trending = article.upvotes > 50 or (article.upvotes > 20 and len(comments) > 5)
 
         news_data.append({
             'id': article.id,
@@ -351,36 +370,140 @@ def get_news(request):
             'upvotes': article.upvotes,
             'downvotes': article.downvotes,
             'views': article.views,
-            'user_vote': user_votes_dict.get(article.id),
+            'user_vote': None,
             'comments': comments,
+            'comment_count': article.comment_count,
             'score': round(score, 2),
+            'snippet': snippets.get(article.id),
             'reading_time': reading_time,
             'personalized': is_personalized,
-            'trending': is_trending,
+            'trending': is_trending(article.upvotes, article.comment_count),
         })
 
-    return JsonResponse({'news': news_data, 'user_preferences': list(preferences.keys())})
+    return {
+        'news': news_data,
+        'user_preferences': list(preferences.keys()),
+        'next_cursor': next_cursor,
+    }
 
 
-def get_archived(request):
-    """Fetch old, highly-engaged news (archived)"""
-    days = int(request.GET.get('days', 7))
+def with_user_votes(body, session_id):
+    """Copy of a news body with this session's votes filled in"""
+    if not session_id or not body['news']:
+        return body
+    user_votes_dict = dict(
+        Vote.objects.filter(
+            session_id=session_id,
+            article_id__in=[item['id'] for item in body['news']]
+        ).values_list('article_id', 'vote_type')
+    )
+    if not user_votes_dict:
+        return body
+    return dict(body, news=[
+        dict(item, user_vote=user_votes_dict[item['id']]) if item['id'] in user_votes_dict else item
+        for item in body['news']
+    ])
+
+
+def with_live_counts(body, key='news'):
+    """
+    Copy of a cached body with current vote counts (including this process's
+    unflushed votes) and the trending flags they imply, so votes don't need
+    to invalidate the shared cache.
+    """
+    items = body[key]
+    if not items:
+        return body
+    counts = {
+        article_id: (upvotes, downvotes)
+        for article_id, upvotes, downvotes in NewsArticle.objects.filter(
+            id__in=[item['id'] for item in items]
+        ).values_list('id', 'upvotes', 'downvotes')
+    }
+    if write_behind_enabled():
+        for article_id, (upvotes, downvotes) in counts.items():
+            pending = vote_buffer.pending(article_id)
+            counts[article_id] = (
+                max(0, upvotes + pending.get('upvotes', 0)),
+                max(0, downvotes + pending.get('downvotes', 0)),
+            )
+    return dict(body, **{key: [
+        live_item(item, *counts[item['id']])
+        if item['id'] in counts and counts[item['id']] != (item['upvotes'], item['downvotes']) else item
+        for item in items
+    ]})
+
+
+def live_item(item, upvotes, downvotes):
+    item = dict(item, upvotes=upvotes, downvotes=downvotes)
+    if 'trending' in item:
+        item['trending'] = is_trending(upvotes, item['comment_count'])
+    return item
+
+
+def get_news(request):
+    """Fetch personalized news"""
+    # Reads never create a session or a preference row (see news/preferences.py)
+    session_id = request.session.session_key
+    category = request.GET.get('category', 'all')
+    # Normalized so equivalent searches share a cache entry
+    search_query = ' '.join(request.GET.get('search', '').split()).lower()
+    cursor = request.GET.get('cursor') or None
+
+    # Determine preference source
+    if request.user.is_authenticated:
+        try:
+            preferences = profile_preferences(request.user.profile.preferred_categories)
+        except UserProfile.DoesNotExist:
+            preferences = {}
+    else:
+        preferences = get_anonymous_preferences(request)
+
+    try:
+        if preferences:
+            body, cache_status = build_news_body(category, search_query, cursor, preferences), None
+        else:
+            # Same body for every visitor without preferences (see news/feed_cache.py)
+            params = {'category': category, 'search': search_query, 'cursor': cursor}
+            body, cache_status = cached_body(
+                'news', params, lambda: build_news_body(category, search_query, cursor, {})
+            )
+            body = with_live_counts(body)
+    except InvalidCursor as e:
+        return JsonResponse({'status': 'error', 'message': str(e)}, status=400)
+
+    response = JsonResponse(with_user_votes(body, session_id))
+    if cache_status:
+        response['X-Cache'] = cache_status
+    return response
+
+
+def build_archived_body(days):
     min_upvotes = 5
     min_views = 50
 
     cutoff_date = timezone.now() - timedelta(days=days)
 
-    archived_articles = (
+    # Walks the (-engagement, published_date) index from the top and stops at
+    # the 10th match instead of aggregating every old article
+    archived_articles = list(
         NewsArticle.objects.filter(
             published_date__lt=cutoff_date,
             upvotes__gt=min_upvotes,
-            views__gt=min_views
+            views__gt=min_views,
+            duplicate_of__isnull=True,
         )
-        .annotate(engagement=F('upvotes') + F('views') + Count('comments'))
-        .order_by('-engagement')[:10]
-        .prefetch_related('comments')
+        .only('id', 'title', 'description', 'category', 'source', 'source_url',
+              'published_date', 'image_url', 'upvotes', 'downvotes', 'views')
+        .order_by('-engagement', 'published_date')[:10]
     )
 
+    comment_ids = {}
+    for article_id, comment_id in Comment.objects.filter(
+        article_id__in=[a.id for a in archived_articles]
+    ).order_by('-created_at').values_list('article_id', 'id'):
+        comment_ids.setdefault(article_id, []).append({'id': comment_id})
+
     archived_data = [
         {
             'id': a.id,
@@ -394,12 +517,22 @@ def get_archived(request):
             'upvotes': a.upvotes,
             'downvotes': a.downvotes,
             'views': a.views,
-            'comments': [{'id': c.id} for c in a.comments.all()],
+            'comments': comment_ids.get(a.id, []),
         }
         for a in archived_articles
     ]
 
-    return JsonResponse({'archived': archived_data})
+    return {'archived': archived_data}
+
+
+def get_archived(request):
+    """Fetch old, highly-engaged news (archived)"""
+    days = int(request.GET.get('days', 7))
+
+    body, cache_status = cached_body('archived', {'days': days}, lambda: build_archived_body(days))
+    response = JsonResponse(with_live_counts(body, 'archived'))
+    response['X-Cache'] = cache_status
+    return response
 
 
 @csrf_exempt
@@ -414,39 +547,7 @@ def vote_article(request):
     session_id = get_or_create_session(request)
 
     try:
-        article = NewsArticle.objects.get(id=article_id)
-        vote_obj, created = Vote.objects.get_or_create(
-            session_id=session_id,
-            article=article,
-            defaults={'vote_type': vote_type}
-        )
-
-        if not created:
-            if vote_obj.vote_type == vote_type:
-                if vote_type == 'up':
-                    article.upvotes = max(0, article.upvotes - 1)
-                else:
-                    article.downvotes = max(0, article.downvotes - 1)
-                vote_obj.delete()
-                new_vote = None
-            else:
-                if vote_obj.vote_type == 'up':
-                    article.upvotes = max(0, article.upvotes - 1)
-                    article.downvotes += 1
-                else:
-                    article.downvotes = max(0, article.downvotes - 1)
-                    article.upvotes += 1
-                vote_obj.vote_type = vote_type
-                vote_obj.save()
-                new_vote = vote_type
-        else:
-            if vote_type == 'up':
-                article.upvotes += 1
-            else:
-                article.downvotes += 1
-            new_vote = vote_type
-
-        article.save()
+        article, new_vote = cast_vote(article_id, session_id, vote_type)
 
         return JsonResponse({
             'status': 'success',
@@ -459,6 +560,26 @@ def vote_article(request):
         return JsonResponse({'status': 'error', 'message': 'Article not found'}, status=404)
 
 
+@csrf_exempt
+def view_beacon(request):
+    """Record article impressions/reads sent with navigator.sendBeacon (see news/impressions.py)"""
+    if request.method != 'POST':
+        return JsonResponse({'status': 'error', 'message': 'Invalid request'}, status=400)
+
+    try:
+        data = json.loads(request.body)
+        article_ids = [int(article_id) for article_id in data.get('article_ids', [])[:MAX_BEACON_ARTICLES]]
+    except (ValueError, TypeError, AttributeError):
+        return JsonResponse({'status': 'error', 'message': 'Invalid beacon'}, status=400)
+    kind = data.get('kind', 'impression')
+    if kind not in VIEW_KINDS:
+        return JsonResponse({'status': 'error', 'message': 'Invalid beacon'}, status=400)
+
+    user_id = request.user.id if request.user.is_authenticated else None
+    counted = record_views(visitor_key(request), article_ids, kind=kind, user_id=user_id)
+    return JsonResponse({'status': 'success', 'counted': counted})
+
+
 @csrf_exempt
 def add_comment(request):
     """Add a comment to an article"""
@@ -479,6 +600,7 @@ def add_comment(request):
         comment = Comment.objects.create(
             article=article, text=comment_text, author_name=author_name
         )
+        bump_version('comments')
 
         return JsonResponse({
             'status': 'success',
@@ -494,28 +616,10 @@ def add_comment(request):
 
 def get_polls(request):
     """Get active polls"""
-    polls_qs = Poll.objects.filter(is_active=True).prefetch_related('options')
-    polls_data = []
-
-    for poll in polls_qs:
-        total_votes = poll.options.aggregate(total=Coalesce(Sum('votes'), 0))['total']
-        options_data = [
-            {
-                'id': o.id,
-                'text': o.text,
-                'votes': o.votes,
-                'percentage': round((o.votes / total_votes) * 100, 1) if total_votes > 0 else 0,
-            }
-            for o in poll.options.all()
-        ]
-
-        polls_data.append({
-            'id': poll.id,
-            'question': poll.question,
-            'options': options_data,
-            'total_votes': total_votes,
-        })
-
+    polls_data = [with_pending_votes(poll_data) for poll_data in get_polls_payload()]
+    user_votes = get_session_poll_votes(request.session.session_key, [poll_data['id'] for poll_data in polls_data])
+    for poll_data in polls_data:
+        poll_data['user_vote'] = user_votes.get(poll_data['id'])
     return JsonResponse({'polls': polls_data})
 
 
@@ -528,13 +632,17 @@ def vote_poll(request):
     data = json.loads(request.body)
     option_id = data.get('option_id')
 
+    session_id = get_or_create_session(request)
+
     try:
-        option = PollOption.objects.get(id=option_id)
-        option.votes = F('votes') + 1
-        option.save()
-        option.refresh_from_db()
+        poll_data, voted_option_id, created = cast_poll_vote(option_id, session_id)
 
-        return JsonResponse({'status': 'success', 'option_id': option.id})
+        return JsonResponse({
+            'status': 'success',
+            'option_id': voted_option_id,
+            'already_voted': not created,
+            'poll': dict(poll_data, user_vote=voted_option_id),
+        })
 
     except PollOption.DoesNotExist:
         return JsonResponse({'status': 'error', 'message': 'Poll option not found'}, status=404)
@@ -543,24 +651,8 @@ def vote_poll(request):
 
 
 def get_stats(request):
-    """Get overall statistics"""
-    total_poll_votes = PollOption.objects.aggregate(total=Coalesce(Sum('votes'), 0))['total']
-
-    stats = {
-        'total_articles': NewsArticle.objects.count(),
-        'total_votes': Vote.objects.count(),
-        'total_comments': Comment.objects.count(),
-        'active_users': UserPreference.objects.count(),
-        'total_users': User.objects.count(),
-        'total_profiles': UserProfile.objects.count(),
-        'total_polls': Poll.objects.count(),
-        'total_poll_votes': total_poll_votes,
-    }
-
-    category_counts_qs = NewsArticle.objects.values('category').annotate(count=Count('id'))
-    stats['by_category'] = {i['category']: i['count'] for i in category_counts_qs}
-
-    return JsonResponse(stats)
+    """Get overall statistics (materialized counters, see news/stats.py)"""
+    return JsonResponse(get_site_stats())
 
 
 @login_required
@@ -578,10 +670,7 @@ def get_user_stats_auth(request):
 
     user_comments_qs = Comment.objects.filter(author_name__in=[user.username, user.first_name]).select_related('article') 
     
-    if isinstance(profile.preferred_categories, list):
-        preferences = {cat: 5.0 for cat in profile.preferred_categories}
-    else:
-        preferences = profile.preferred_categories or {}
+    preferences = profile_preferences(profile.preferred_categories)
         
     favorite_category = max(preferences.items(), key=lambda x: x[1] if isinstance(x[1], (int, float)) else 0)[0] if preferences else 'None'
     
@@ -615,78 +704,148 @@ def get_user_stats_auth(request):
     return JsonResponse(stats)
 
 
+REFRESH_COOLDOWN = 300  # seconds between public refreshes per session
+
+
+def refresh_session_key(session_id):
+    return f'last_refresh_{session_id}'
+
+
+def refresh_cooldown_response(last_refresh):
+    """Error response while a session's public refresh cooldown runs, else None"""
+    if not last_refresh:
+        return None
+    try:
+        last_refresh_time = timezone.datetime.fromisoformat(last_refresh)
+    except ValueError:
+        return JsonResponse({'status': 'error', 'message': 'Internal error parsing last refresh time.'}, status=500)
+
+    time_since_refresh = (timezone.now() - last_refresh_time).total_seconds()
+    if time_since_refresh < REFRESH_COOLDOWN:
+        return JsonResponse({
+            'status': 'error',
+            'message': f'Please wait {int(REFRESH_COOLDOWN - time_since_refresh)} seconds before refreshing again.'
+        }, status=429)
+    return None
+
+
+def queue_public_refresh():
+    """Queue the public refresh; the ingest daemon does the fetching (see news/ingest.py)"""
+    job, _ = enqueue_refresh('public', categories=['general', 'technology'], articles_per_category=5)
+    return JsonResponse({
+        'status': 'queued',
+        'message': '🔄 Refresh queued. New articles will appear shortly.',
+        **job_status(job),
+    }, status=202)
+
+
+def queue_admin_refresh():
+    """Queue a refresh of every category"""
+    job, created = enqueue_refresh('admin', categories=None, articles_per_category=10)
+    return JsonResponse({
+        'status': 'queued',
+        'message': '🔄 Refresh queued.' if created else '🔄 A refresh is already queued.',
+        **job_status(job),
+    }, status=202)
+
+
 def refresh_news_public(request):
     """Public endpoint for users to refresh news"""
     session_id = get_or_create_session(request)
-    last_refresh_key = f'last_refresh_{session_id}'
-    last_refresh = request.session.get(last_refresh_key)
+    last_refresh_key = refresh_session_key(session_id)
     
-    if last_refresh:
-        try:
-            last_refresh_time = timezone.datetime.fromisoformat(last_refresh)
-        except ValueError:
-            return JsonResponse({'status': 'error', 'message': 'Internal error parsing last refresh time.'}, status=500)
-            
-        time_since_refresh = (timezone.now() - last_refresh_time).total_seconds()
-        
-        if time_since_refresh < 300:
-            return JsonResponse({
-                'status': 'error',
-                'message': f'Please wait {int(300 - time_since_refresh)} seconds before refreshing again.'
-            }, status=429)
+    error_response = refresh_cooldown_response(request.session.get(last_refresh_key))
+    if error_response:
+        return error_response
     
-    try:
-        stats = fetch_and_save_news(
-            categories=['general', 'technology'],
-            articles_per_category=5
-        )
-        
-        request.session[last_refresh_key] = timezone.now().isoformat()
-        
-        return JsonResponse({
-            'status': 'success',
-            'message': f"✅ Refreshed! Found {stats.get('total_saved', 0)} new articles",
-            'total_saved': stats.get('total_saved', 0),
-            'by_category': stats['by_category']
-        })
-    except Exception as e:
-        return JsonResponse({
-            'status': 'error',
-            'message': f'Scraping failed due to a server error: {type(e).__name__}'
-        }, status=500)
+    response = queue_public_refresh()
+    request.session[last_refresh_key] = timezone.now().isoformat()
+    return response
 
 
 @staff_member_required
 def refresh_news(request):
     """Admin endpoint to fetch news"""
+    return queue_admin_refresh()
+
+
+def refresh_status(request, job_id):
+    """Progress of a queued refresh"""
     try:
-        stats = fetch_and_save_news(
-            categories=None,
-            articles_per_category=10
-        )
-        
-        return JsonResponse({
-            'status': 'success',
-            'message': f"✅ Saved {stats['total_saved']} NEW articles!",
-            'total_fetched': stats['total_fetched'],
-            'total_saved': stats['total_saved'],
-            'by_category': stats['by_category'],
-        })
-    except Exception as e:
-        return JsonResponse({
-            'status': 'error',
-            'message': f'Admin scraping failed due to a server error: {type(e).__name__}'
-        }, status=500)
+        job = IngestJob.objects.get(id=job_id)
+    except IngestJob.DoesNotExist:
+        return JsonResponse({'status': 'error', 'message': 'Refresh job not found'}, status=404)
+    
+    return JsonResponse(job_status(job))
+
+
+def sse_available(request):
+    """
+    Whether /api/events/ can be served. Under WSGI (runserver, gunicorn sync
+    workers) Django drains an async streaming response on a worker thread,
+    so an endless stream would hold that thread for as long as the tab is open.
+    """
+    return isinstance(request, ASGIRequest)
+
+
+async def event_stream(request):
+    """
+    Server-Sent Events: new article ids and vote count changes.
+    Resumes from the Last-Event-ID header when the browser reconnects.
+    Answers 204 outside ASGI, which tells EventSource not to reconnect.
+    """
+    if not sse_available(request):
+        return HttpResponse(status=204)
+
+    article_poller.start()
+    try:
+        last_id = int(request.headers.get('Last-Event-ID', ''))
+    except ValueError:
+        last_id = None
+
+    async def stream():
+        subscription = event_broker.subscribe()
+        missed = []
+        if last_id is None:
+            sent = event_broker.last_id
+        else:
+            sent = last_id
+            missed = event_broker.since(last_id)
+            if missed is None:
+                # Ids from another process or an earlier run mean nothing here:
+                # resync and continue from this broker's counter
+                sent = event_broker.last_id
+                missed = [(sent, 'resync', {})]
+        try:
+            yield f'retry: 5000\nid: {sent}\n\n'
+            for event in missed:
+                yield format_event(event)
+                sent = max(sent, event[0])
+            while True:
+                event = await subscription.get(HEARTBEAT_INTERVAL)
+                if event is None:
+                    yield ': ping\n\n'
+                elif event[0] > sent or event[1] == 'resync':
+                    yield format_event(event)
+                    sent = event[0]
+        finally:
+            event_broker.unsubscribe(subscription)
+
+    response = StreamingHttpResponse(stream(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'  # nginx: pass events through unbuffered
+    return response
 
 
 @staff_member_required
 def dashboard(request):
     """Admin dashboard view"""
+    site_stats = get_site_stats()
     stats = {
-        'total_articles': NewsArticle.objects.count(),
-        'total_users': User.objects.count(),
-        'total_votes': Vote.objects.count(),
-        'total_comments': Comment.objects.count(),
+        'total_articles': site_stats['total_articles'],
+        'total_users': site_stats['total_users'],
+        'total_votes': site_stats['total_votes'],
+        'total_comments': site_stats['total_comments'],
     }
 
     # IMPORTANT: return must be inside this function
@@ -695,25 +854,51 @@ def dashboard(request):
 
 # ====================== CUSTOM DASHBOARD LIST VIEWS ======================
 
+def render_dashboard_list(request, name, template):
+    """Keyset-paginated page of a dashboard list, or a streamed export with ?format=csv|ndjson"""
+    dashboard_list = DASHBOARD_LISTS[name]
+    fmt = request.GET.get('format')
+    if fmt in ('csv', 'ndjson'):
+        return dashboard_list.export(request.GET, fmt)
+
+    try:
+        rows, filters, next_cursor = dashboard_list.page(
+            request.GET,
+            cursor=request.GET.get('cursor'),
+            page_size=parse_page_size(request.GET.get('page_size')),
+        )
+    except InvalidCursor as e:
+        return JsonResponse({'error': str(e)}, status=400)
+
+    params = request.GET.copy()
+    params.pop('cursor', None)
+    params.pop('format', None)
+    next_params = params.copy()
+    if next_cursor:
+        next_params['cursor'] = next_cursor
+    return render(request, template, {
+        name: rows,
+        'filters': filters,
+        'next_url': f'?{next_params.urlencode()}' if next_cursor else None,
+        'export_query': params.urlencode(),
+    })
+
+
 @staff_member_required
 def dashboard_users(request):
-    users = User.objects.all().order_by('username')
-    return render(request, 'dashboard_users.html', {'users': users})
+    return render_dashboard_list(request, 'users', 'dashboard_users.html')
 
 
 @staff_member_required
 def dashboard_comments(request):
-    comments = Comment.objects.select_related('article').order_by('-created_at')
-    return render(request, 'dashboard_comments.html', {'comments': comments})
+    return render_dashboard_list(request, 'comments', 'dashboard_comments.html')
 
 
 @staff_member_required
 def dashboard_articles(request):
-    articles = NewsArticle.objects.all().order_by('-published_date')
-    return render(request, 'dashboard_articles.html', {'articles': articles})
+    return render_dashboard_list(request, 'articles', 'dashboard_articles.html')
 
 
 @staff_member_required
 def dashboard_votes(request):
-    votes = Vote.objects.select_related('article').order_by('-created_at')
-    return render(request, 'dashboard_votes.html', {'votes': votes})
+    return render_dashboard_list(request, 'votes', 'dashboard_votes.html')
@@ -0,0 +1,114 @@
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import Greatest
+
+from .buffers import DeltaBuffer
+from .events import publish_vote
+from .models import NewsArticle, Vote, engagement_after
+from .ranking import feed_ranker
+
+# ==================== ARTICLE VOTES ====================
+# Counters are only ever changed with `UPDATE ... SET upvotes = upvotes + n`,
+# never read-modify-write in Python, so concurrent votes can't overwrite each
+# other. Each toggle/switch is applied only if this request actually changed
+# the Vote row, which keeps counters and Vote rows consistent under races.
+#
+# With NEWSIFY_VOTE_WRITE_BEHIND = True the counter deltas go to an in-memory
+# buffer and are flushed in batches, so a viral article isn't one hot row lock
+# per request. Vote rows are still written immediately.
+
+
+def _counter_field(vote_type):
+    return 'upvotes' if vote_type == 'up' else 'downvotes'
+
+
+def apply_counter_deltas(batch):
+    """
+    Write {article_id: {'upvotes': n, 'downvotes': m}} with one UPDATE per
+    distinct delta pair (most keys in a batch share +1/0 style deltas).
+    """
+    groups = {}
+    for article_id, deltas in batch.items():
+        key = (deltas.get('upvotes', 0), deltas.get('downvotes', 0))
+        groups.setdefault(key, []).append(article_id)
+
+    with transaction.atomic():
+        for (up, down), article_ids in groups.items():
+            upvotes = Greatest(F('upvotes') + up, 0)
+            NewsArticle.objects.filter(id__in=article_ids).update(
+                upvotes=upvotes,
+                downvotes=Greatest(F('downvotes') + down, 0),
+                engagement=engagement_after(upvotes=upvotes),
+            )
+
+
+def write_behind_enabled():
+    return getattr(settings, 'NEWSIFY_VOTE_WRITE_BEHIND', False)
+
+
+vote_buffer = DeltaBuffer(
+    'vote-counters',
+    apply_counter_deltas,
+    interval=getattr(settings, 'NEWSIFY_VOTE_FLUSH_INTERVAL', 2.0),
+)
+
+
+def cast_vote(article_id, session_id, vote_type):
+    """
+    Record, switch or toggle off a session's vote on an article.
+
+    Returns:
+        (article, user_vote) where article carries the current counts
+        (including buffered deltas) and user_vote is 'up', 'down' or None.
+
+    Raises:
+        NewsArticle.DoesNotExist if the article is gone.
+    """
+    deltas = {}
+    with transaction.atomic():
+        if not NewsArticle.objects.filter(id=article_id).exists():
+            raise NewsArticle.DoesNotExist
+
+        vote_obj, created = Vote.objects.get_or_create(
+            session_id=session_id,
+            article_id=article_id,
+            defaults={'vote_type': vote_type}
+        )
+
+        if created:
+            deltas[_counter_field(vote_type)] = 1
+            new_vote = vote_type
+        elif vote_obj.vote_type == vote_type:
+            # Same button again: remove the vote (only count it if we deleted the row)
+            deleted, _ = Vote.objects.filter(pk=vote_obj.pk).delete()
+            if deleted:
+                deltas[_counter_field(vote_type)] = -1
+            new_vote = None
+        else:
+            switched = Vote.objects.filter(pk=vote_obj.pk, vote_type=vote_obj.vote_type).update(vote_type=vote_type)
+            if switched:
+                deltas[_counter_field(vote_obj.vote_type)] = -1
+                deltas[_counter_field(vote_type)] = 1
+            new_vote = vote_type
+
+        if deltas and not write_behind_enabled():
+            counters = {field: Greatest(F(field) + delta, 0) for field, delta in deltas.items()}
+            if 'upvotes' in counters:
+                counters['engagement'] = engagement_after(upvotes=counters['upvotes'])
+            NewsArticle.objects.filter(id=article_id).update(**counters)
+
+    if deltas and write_behind_enabled():
+        vote_buffer.add(article_id, **deltas)
+
+    article = NewsArticle.objects.only('id', 'category', 'upvotes', 'downvotes', 'views').get(id=article_id)
+    if write_behind_enabled():
+        # Read-your-writes: add what hasn't been flushed yet
+        for field, delta in vote_buffer.pending(article_id).items():
+            setattr(article, field, max(0, getattr(article, field) + delta))
+
+    feed_ranker.update_article(article)
+    if deltas:
+        publish_vote(article_id, deltas.get('upvotes', 0), deltas.get('downvotes', 0),
+                     article.upvotes, article.downvotes)
+    return article, new_vote
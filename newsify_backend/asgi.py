@@ -5,6 +5,10 @@ It exposes the ASGI callable as a module-level variable named ``application``.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
+
+Serve through this module (e.g. ``uvicorn newsify_backend.asgi:application``)
+so /api/events/ streams stay open as coroutines instead of occupying a
+worker thread each.
 """
 
 import os
@@ -122,7 +122,94 @@ STATIC_URL = "static/"
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# Discards write-behind buffers before the test database is destroyed (see news/test_runner.py)
+TEST_RUNNER = "news.test_runner.NewsifyTestRunner"
+
 # Authentication redirects
 # Ensure Django redirects to our app's login page instead of the default /accounts/login/
 LOGIN_URL = "/login/"
 LOGIN_REDIRECT_URL = "/"
+
+# Provider API response cache and daily quotas (see news/http_cache.py)
+NEWSIFY_HTTP_CACHE_DIR = BASE_DIR / ".newsify_cache" / "http"
+NEWSIFY_HTTP_CACHE_BACKEND = "news.http_cache.FileResponseCache"
+# Seconds a cached provider response is served without revalidating
+NEWSIFY_PROVIDER_CACHE_TTL = {
+    "NewsAPI": 900,
+    "NewsData.io": 1800,
+    "The Guardian": 600,
+    "NYTimes": 900,
+    "GNews": 1800,
+}
+# Requests per UTC day before a provider is skipped
+NEWSIFY_PROVIDER_DAILY_QUOTA = {
+    "NewsAPI": 100,
+    "NewsData.io": 200,
+    "The Guardian": 5000,
+    "NYTimes": 500,
+    "GNews": 100,
+}
+
+# Outbound HTTP (see news/http_client.py): (connect, read) timeout in seconds and
+# retries for timeouts, 429 and 5xx
+NEWSIFY_HTTP_TIMEOUT = (3.05, 10)
+NEWSIFY_HTTP_RETRIES = 2
+
+# Seconds before the in-memory feed ranking window is reloaded from the database
+# (ingests in this process reload it immediately; see news/ranking.py)
+NEWSIFY_RANKING_TTL = 60
+
+# Full-text search backend for /api/news/?search= (see news/search.py).
+# Unset = FTS5 on SQLite, tsvector on PostgreSQL, LIKE elsewhere.
+# NEWSIFY_SEARCH_BACKEND = "news.search.SQLiteFTSBackend"
+
+# Buffer article vote counter updates in memory and flush them in batches
+# (see news/votes.py). Vote rows themselves are always written immediately.
+NEWSIFY_VOTE_WRITE_BEHIND = False
+NEWSIFY_VOTE_FLUSH_INTERVAL = 2.0
+
+# Maximum age in seconds of the site stats served by /api/stats/ and the dashboard
+# (see news/stats.py; `manage.py rebuild_stats` recomputes them from scratch)
+NEWSIFY_STATS_MAX_AGE = 30
+# Buffer stat counter deltas and flush them every 2 seconds; False writes each
+# delta when its transaction commits
+NEWSIFY_STATS_WRITE_BEHIND = True
+
+# Seconds the active-polls payload for /api/polls/ stays in the cache
+# (votes and admin edits invalidate it immediately; see news/polls.py)
+NEWSIFY_POLLS_CACHE_TTL = 60
+
+# Batch poll option counter updates (one PollVote row per session and poll is
+# still written per vote; counters flush every NEWSIFY_VOTE_FLUSH_INTERVAL seconds)
+NEWSIFY_POLL_WRITE_BEHIND = True
+
+# Article view beacons (see news/impressions.py): seconds between counter
+# flushes, and how long one visitor's view of an article counts only once
+NEWSIFY_VIEW_FLUSH_INTERVAL = 5.0
+NEWSIFY_VIEW_DEDUPE_TTL = 6 * 60 * 60
+
+# Shared response bodies for visitors without preferences (see news/feed_cache.py).
+# "feed" is per process; point NEWSIFY_FEED_CACHE at "feed_file" to share entries
+# and invalidations between the worker processes on one host.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "feed": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "newsify-feed",
+        "OPTIONS": {"MAX_ENTRIES": 5000},
+    },
+    "feed_file": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": BASE_DIR / ".newsify_cache" / "feed",
+        "OPTIONS": {"MAX_ENTRIES": 5000},
+    },
+}
+NEWSIFY_FEED_CACHE = "feed"
+NEWSIFY_FEED_CACHE_TTL = 30
+NEWSIFY_FEED_CACHE_STALE = 300
+
+# In-process cache of anonymous visitors' preferences (see news/preferences.py)
+NEWSIFY_PREFERENCE_CACHE_SIZE = 10000
+NEWSIFY_PREFERENCE_CACHE_TTL = 300